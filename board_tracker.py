@@ -0,0 +1,156 @@
+"""Turn the per-frame 20×10 board masks into piece-lock / line-clear events.
+
+The falling piece moves between frames, so a cell only counts as part of the
+*settled* stack once it has been present in ``settle_frames`` consecutive
+masks.  Comparing each new settled stack with the previous one tells us when
+a piece locked, how many lines it cleared, and when the board was reset –
+the only moments the prediction and stats pipelines need to run.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+import numpy as np
+
+from src.agents import bitboard
+
+log = logging.getLogger(__name__)
+
+BOARD_SHAPE = (20, 10)
+PIECE_CELLS = 4
+
+
+@dataclass(frozen=True)
+class BoardEvent:
+    """A change of the settled stack.
+
+    ``kind`` is ``"lock"`` (a piece joined the stack, possibly clearing
+    lines), ``"clear"`` (rows vanished without new cells, e.g. after a clear
+    animation) or ``"reset"`` (first board seen, or too large a change to be
+    one piece – new game, garbage, mis-capture).
+    """
+
+    kind: str
+    frame: int
+    board: np.ndarray
+    lines_cleared: int = 0
+    cells_added: int = 0
+
+
+class BoardStateTracker:
+    """Diff consecutive board masks and report settled-stack events."""
+
+    def __init__(self, settle_frames: int = 3):
+        if settle_frames < 1:
+            raise ValueError("settle_frames must be at least 1")
+        self.settle_frames = settle_frames
+        self.frames = 0
+        self.events = 0
+        self._recent: Deque[np.ndarray] = deque(maxlen=settle_frames)
+        self._candidates: Deque[np.ndarray] = deque(maxlen=settle_frames)
+        self._settled: Optional[np.ndarray] = None
+
+    @property
+    def settled(self) -> Optional[np.ndarray]:
+        """Last settled stack as a boolean 20×10 array (``None`` before the first)."""
+        return self._settled
+
+    def reset(self) -> None:
+        self._recent.clear()
+        self._candidates.clear()
+        self._settled = None
+
+    def update(self, mask) -> Optional[BoardEvent]:
+        """Feed one extracted mask; return a :class:`BoardEvent` or ``None``."""
+        occupied = np.asarray(mask) > 0
+        if occupied.shape != BOARD_SHAPE:
+            raise ValueError(f"Board mask must be {BOARD_SHAPE}, got {occupied.shape}")
+        self.frames += 1
+        self._recent.append(occupied)
+        if len(self._recent) < self.settle_frames:
+            return None
+
+        # cells present in every recent frame; the moving piece drops out
+        stack = np.logical_and.reduce(self._recent)
+        self._candidates.append(stack)
+        # while a window straddles a change its AND is a mix of both boards;
+        # only a stack that stays the same for a full window is trusted
+        if len(self._candidates) < self.settle_frames or not all(
+            np.array_equal(stack, c) for c in self._candidates
+        ):
+            return None
+
+        previous = self._settled
+        if previous is not None and np.array_equal(stack, previous):
+            return None
+
+        event = self._classify(previous, stack)
+        if event is None:
+            return None
+        self._settled = stack
+        self.events += 1
+        log.debug("Board event %s at frame %d", event.kind, self.frames)
+        return event
+
+    def _classify(self, previous, stack) -> Optional[BoardEvent]:
+        board = np.where(stack, 255, 0).astype(np.uint8)
+        if previous is None:
+            return BoardEvent("reset", self.frames, board)
+
+        lines, added = _match_rows(bitboard.from_array(previous), bitboard.from_array(stack))
+        if lines is None:
+            return BoardEvent("reset", self.frames, board)
+        if added:
+            if not lines and not _resting(previous, stack):
+                # a piece hovering under slow gravity has not locked yet
+                return None
+            return BoardEvent("lock", self.frames, board, lines_cleared=lines, cells_added=added)
+        if lines:
+            # the clear animation finished after the lock was already reported
+            return BoardEvent("clear", self.frames, board, lines_cleared=lines)
+        # a settled cell flickered off – not a game event
+        return None
+
+
+def _resting(before, after) -> bool:
+    """True when a cell new in ``after`` sits on the floor or on the old stack."""
+    support = np.ones_like(before)
+    support[:-1] = before[1:]
+    return bool((after & ~before & support).any())
+
+
+def _match_rows(before, after):
+    """Explain ``after`` as ``before`` plus one piece minus cleared rows.
+
+    Walks both stacks bottom-up: a row of ``after`` that contains the current
+    ``before`` row is the same row (plus any piece cells); otherwise the
+    ``before`` row must have been cleared, and the piece supplied its missing
+    cells.  Returns ``(lines, piece_cells)``, or ``(None, 0)`` when no single
+    piece explains the change.
+    """
+    i = j = bitboard.BOARD_ROWS - 1
+    lines = added = 0
+    while j >= 0:
+        old = before[i] if i >= 0 else 0
+        new = after[j]
+        if new & old == old:
+            added += (new & ~old).bit_count()
+            i -= 1
+            j -= 1
+        elif i >= 0:
+            # the piece's cells that completed this row vanished with it
+            lines += 1
+            added += bitboard.BOARD_COLS - old.bit_count()
+            i -= 1
+        else:
+            return None, 0
+    if lines > 4 or added > PIECE_CELLS:
+        return None, 0
+    return lines, added
+
+
+__all__ = ["BOARD_SHAPE", "BoardEvent", "BoardStateTracker"]
@@ -1,17 +1,46 @@
 import logging
 
+import cv2
 import mss  # type: ignore
+import numpy as np
 from PIL import Image  # type: ignore
 
-__all__ = ["ScreenCapture"]
+__all__ = ["CAPTURE_MODES", "ScreenCapture", "bgra_view", "to_pil"]
+
+# "pil": RGB PIL image (copies + swizzle, for Tk/pygame consumers)
+# "bgra": numpy view over mss's raw buffer (no copy)
+# "gray": single-channel numpy array (one cvtColor pass)
+CAPTURE_MODES = ("pil", "bgra", "gray")
+
+
+def bgra_view(shot) -> np.ndarray:
+    """Wrap an mss screenshot's raw BGRA buffer as an (h, w, 4) array without copying."""
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+
+def to_pil(image):
+    """Convert a BGRA/gray array to an RGB PIL image; PIL images pass through."""
+    if not isinstance(image, np.ndarray):
+        return image
+    if image.ndim == 2:
+        return Image.fromarray(image, "L").convert("RGB")
+    return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGRA2RGB))
 
 
 class ScreenCapture:
-    """Capture a rectangle (left, top, width, height) using mss only."""
+    """Capture a rectangle (left, top, width, height) using mss only.
 
-    def __init__(self, rect):
+    ``mode`` picks what :meth:`grab` returns, see ``CAPTURE_MODES``; hot
+    paths should use ``"bgra"`` or ``"gray"`` and convert with :func:`to_pil`
+    only where a consumer needs an image object.
+    """
+
+    def __init__(self, rect, mode="pil"):
         if len(rect) != 4:
             raise ValueError("rect must be (left, top, width, height)")
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"mode must be one of {CAPTURE_MODES}, got {mode!r}")
+        self.mode = mode
         left, top, width, height = rect
         self.region = {"left": left, "top": top, "width": width, "height": height}
         self.sct = mss.mss()
@@ -33,4 +62,21 @@ class ScreenCapture:
 
     def grab(self):
         shot = self.sct.grab(self.region)
-        return Image.frombytes("RGB", shot.size, shot.rgb)
+        if self.mode == "pil":
+            return Image.frombytes("RGB", shot.size, shot.rgb)
+        pixels = bgra_view(shot)
+        if self.mode == "gray":
+            return cv2.cvtColor(pixels, cv2.COLOR_BGRA2GRAY)
+        return pixels
+
+    def close(self):
+        """Release the mss handle; safe to call more than once."""
+        if self.sct is not None:
+            self.sct.close()
+            self.sct = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
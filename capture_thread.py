@@ -0,0 +1,193 @@
+"""Background screen capture with a single "latest frame wins" slot.
+
+The producer thread grabs continuously, so capture overlaps with board
+extraction, prediction and rendering on the consumer side.  Every published
+frame carries a sequence number and its capture timestamp; consumers block
+until a frame newer than the one they last handled arrives, and can measure
+how stale it is when they get to it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from dual_capture import CaptureSession
+from frame_pool import FramePool, PoolExhausted
+
+log = logging.getLogger(__name__)
+
+
+class CapturedFrame(NamedTuple):
+    """One grab: both board views plus the full bus frame for shared consumers."""
+
+    seq: int
+    timestamp: float  # time.perf_counter() when the grab finished
+    left: Any
+    right: Any
+    frame: Any
+    lease: Any = None  # FrameLease backing the pixels, if pooled
+
+    @property
+    def age(self) -> float:
+        """Seconds since the frame was captured."""
+        return time.perf_counter() - self.timestamp
+
+    def release(self) -> None:
+        """Hand the pooled buffer back; the views must not be used afterwards."""
+        if self.lease is not None:
+            self.lease.release()
+
+
+class LatestFrameSlot:
+    """Single-slot buffer: a new frame replaces the previous one unread.
+
+    A frame returned by :meth:`wait_newer` belongs to the consumer, who must
+    call :meth:`CapturedFrame.release`; frames replaced before anyone took
+    them are released here.  :meth:`latest` only peeks.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._latest: Optional[CapturedFrame] = None
+        self._seq = 0
+        self._taken = 0  # seq of the newest frame a consumer has received
+        self.published = 0
+        self.dropped = 0  # frames overwritten before any consumer saw them
+
+    def publish(self, left, right, frame, lease=None) -> CapturedFrame:
+        with self._cond:
+            if self._latest is not None and self._latest.seq > self._taken:
+                self.dropped += 1
+                self._latest.release()
+            self._seq += 1
+            self._latest = CapturedFrame(self._seq, time.perf_counter(), left, right, frame, lease)
+            self.published += 1
+            self._cond.notify_all()
+            return self._latest
+
+    def latest(self) -> Optional[CapturedFrame]:
+        """Return the newest frame without waiting (``None`` before the first)."""
+        with self._cond:
+            return self._latest
+
+    def wait_newer(self, after_seq: int = 0, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        """Block until a frame with ``seq > after_seq`` exists; ``None`` on timeout."""
+        with self._cond:
+            ready = self._cond.wait_for(
+                lambda: self._latest is not None and self._latest.seq > after_seq, timeout
+            )
+            if not ready:
+                return None
+            self._taken = max(self._taken, self._latest.seq)
+            return self._latest
+
+
+class CaptureThread:
+    """Producer thread that keeps ``slot`` filled with the newest grab.
+
+    The thread owns its :class:`CaptureSession` – mss handles must be used on
+    the thread that created them.  Capture errors are logged, the session is
+    rebuilt and the thread backs off for ``error_backoff`` seconds.
+
+    With ``pool_size`` set, grabs are copied into a :class:`FramePool` of
+    that many buffers (rebuilt if the capture region changes); when every
+    buffer is still held by consumers the grab is skipped.  This bounds the
+    frames in flight but adds a copy per grab, so it is off by default
+    (see ``AppConfig.dxgi_pool_size``).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], CaptureSession] = CaptureSession,
+        min_interval: float = 0.0,
+        error_backoff: float = 0.5,
+        pool_size: int = 0,
+    ):
+        self.session_factory = session_factory
+        self.min_interval = min_interval
+        self.error_backoff = error_backoff
+        self.pool_size = pool_size
+        self.pool: Optional[FramePool] = None
+        self.slot = LatestFrameSlot()
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "CaptureThread":
+        if self.running:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="capture", daemon=True)
+        self._thread.start()
+        log.info("Capture thread started")
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        log.info(
+            "Capture thread stopped (%d published, %d dropped, %d errors)",
+            self.slot.published,
+            self.slot.dropped,
+            self.errors,
+        )
+
+    def next_frame(self, after_seq: int = 0, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        return self.slot.wait_newer(after_seq, timeout)
+
+    def _run(self) -> None:
+        with self.session_factory() as session:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    capture = session.get()
+                    lease = self._lease(capture)
+                    try:
+                        left, right = capture.grab() if lease is None else capture.grab(lease.array)
+                    except BaseException:
+                        if lease is not None:
+                            lease.release()
+                        raise
+                    self.slot.publish(left, right, capture.frame, lease)
+                except PoolExhausted:
+                    # consumers still hold every buffer – skip this grab
+                    continue
+                except Exception as exc:
+                    self.errors += 1
+                    session.invalidate()
+                    log.error("Background capture failed: %s", exc)
+                    self._stop.wait(self.error_backoff)
+                    continue
+                remaining = self.min_interval - (time.perf_counter() - started)
+                if remaining > 0:
+                    self._stop.wait(remaining)
+
+    def _lease(self, capture):
+        shape = getattr(capture, "frame_shape", None)
+        if not self.pool_size or shape is None:
+            return None
+        if self.pool is None or self.pool.shape != tuple(shape):
+            self.pool = FramePool(self.pool_size, shape)
+        try:
+            return self.pool.acquire(timeout=self.error_backoff)
+        except PoolExhausted:
+            self.pool.check_leaks()
+            raise
+
+    def __enter__(self) -> "CaptureThread":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+__all__ = ["CaptureThread", "CapturedFrame", "LatestFrameSlot"]
@@ -0,0 +1,81 @@
+"""Parse-once cache for the JSON config files read on the capture path.
+
+Each :class:`FileCache` re-parses its file only when the ``(mtime, size)``
+signature changes, so a per-frame ``get()`` costs one ``stat``.  Writers
+(calibration, window cache) call :func:`reload_all` after saving so the new
+values are picked up even on filesystems with coarse timestamps.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+Signature = Optional[Tuple[int, int]]
+
+_CACHES: "weakref.WeakSet[FileCache]" = weakref.WeakSet()
+
+
+def file_signature(path: Path) -> Signature:
+    """``(mtime_ns, size)`` of ``path``, or ``None`` if it does not exist."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class FileCache:
+    """Cache ``parse(path)`` until the file changes or :meth:`reload` is called.
+
+    ``path`` may be a callable so module-level ``CONFIG_PATH`` overrides (as
+    used by tests) are honoured.  ``parse`` also runs for a missing file and
+    decides what that means (default value or exception); exceptions are not
+    cached.
+    """
+
+    def __init__(self, path: Union[Path, Callable[[], Path]], parse: Callable[[Path], Any]):
+        self._path = path if callable(path) else (lambda: path)
+        self.parse = parse
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[Path, Signature]] = None
+        self._value: Any = None
+        self.loads = 0
+        _CACHES.add(self)
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path())
+
+    def get(self) -> Any:
+        path = self.path
+        key = (path, file_signature(path))
+        with self._lock:
+            if self._key == key:
+                return self._value
+        value = self.parse(path)
+        with self._lock:
+            self._key, self._value = key, value
+            self.loads += 1
+        log.debug("Parsed %s (load #%d)", path, self.loads)
+        return value
+
+    def reload(self) -> None:
+        """Forget the cached value; the next :meth:`get` re-parses."""
+        with self._lock:
+            self._key = None
+            self._value = None
+
+
+def reload_all() -> None:
+    """Invalidate every cache, e.g. after calibration rewrote the configs."""
+    for cache in list(_CACHES):
+        cache.reload()
+
+
+__all__ = ["FileCache", "file_signature", "reload_all"]
@@ -1,17 +1,86 @@
-from capture import ScreenCapture
-from dual_roi_manager import get_roi_pair
+from config_cache import file_signature
+from dual_roi_manager import CONFIG_PATH, roi_pair
+from frame_bus import FrameBus, roi_rects
 import logging
 
 
 class DualScreenCapture:
     def __init__(self):
-        rois = get_roi_pair()
+        rois = roi_pair()
         if len(rois) != 2:
             raise ValueError("Dual ROI required – exactly 2 regions expected")
-        self.capturers = [ScreenCapture(r) for r in rois]
+        self.rois = list(rois)
+        # One bus grab covers both boards plus the shared-UI and queue ROIs
+        self.bus = FrameBus([*self.rois, *roi_rects()])
+        self.frame = None
 
-    def grab(self):
-        left_img = self.capturers[0].grab()
-        right_img = self.capturers[1].grab()
+    @property
+    def frame_shape(self):
+        return self.bus.shape
+
+    def grab(self, out=None):
+        """Grab the bus once; keep the full frame in ``self.frame`` for other consumers.
+
+        ``out`` is an optional preallocated buffer of :attr:`frame_shape`.
+        """
+        self.frame = self.bus.grab(out)
+        left_img = self.frame.view(self.rois[0])
+        right_img = self.frame.view(self.rois[1])
         logging.debug("Captured both boards")
         return left_img, right_img
+
+    def close(self):
+        self.bus.close()
+        self.frame = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _config_signature():
+    """(mtime, size) of the ROI config – changes whenever calibration saves."""
+    return file_signature(CONFIG_PATH)
+
+
+class CaptureSession:
+    """Long-lived capture, rebuilt only when the ROI config file changes.
+
+    ``get()`` is called every tick and costs one ``stat`` while the config is
+    unchanged; the previous capture's mss handle is closed before a rebuild.
+    """
+
+    def __init__(self, factory=DualScreenCapture):
+        self.factory = factory
+        self.capture = None
+        self._signature = None
+        self.builds = 0
+
+    def get(self):
+        signature = _config_signature()
+        if self.capture is None or signature != self._signature:
+            self.close()
+            self.capture = self.factory()
+            self._signature = signature
+            self.builds += 1
+            logging.info("Capture session built (#%d)", self.builds)
+        return self.capture
+
+    def invalidate(self):
+        """Drop the current capture (e.g. after a grab error); the next get() rebuilds."""
+        self.close()
+
+    def close(self):
+        if self.capture is not None:
+            close = getattr(self.capture, "close", None)
+            if close is not None:
+                close()
+            self.capture = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
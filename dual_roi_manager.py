@@ -1,14 +1,17 @@
 import json, logging
 from pathlib import Path
 
+from config_cache import FileCache
+
 CONFIG_PATH = Path("config/roi_config.json")
 
 
-def load_config():
-    if not CONFIG_PATH.is_file():
+def _parse_roi_pair(path):
+    """(left, right) board rects as int tuples, or () if either is missing."""
+    if not path.is_file():
         logging.info("Config missing – creating empty template")
-        return {"rois": [], "hwnd": None}
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        return ()
+    with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
     
     # Convert new format to old dual ROI format
@@ -22,12 +25,27 @@ def load_config():
         elif roi.get("name") == "player_right_board":
             right_board = roi.get("rect")
     
-    return {"roi": [left_board, right_board] if left_board and right_board else [], "hwnd": None}
+    if not (left_board and right_board):
+        return ()
+    return tuple(tuple(int(v) for v in rect) for rect in (left_board, right_board))
+
+
+_PAIR_CACHE = FileCache(lambda: CONFIG_PATH, _parse_roi_pair)
+
+
+def roi_pair():
+    """Cached ((left, top, width, height), (...)) board pair; () until calibrated."""
+    return _PAIR_CACHE.get()
+
+
+def load_config():
+    return {"roi": [list(rect) for rect in roi_pair()], "hwnd": None}
 
 
 def save_config(data):
     with open(CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    _PAIR_CACHE.reload()
     logging.info("Config saved")
 
 
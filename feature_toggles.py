@@ -18,6 +18,9 @@ class FeatureToggles:
     combo_indicators_enabled: bool = True
     debug_mode_enabled: bool = False
     experimental_ai_enabled: bool = False
+    staged_pipeline_enabled: bool = False  # capture/extract/predict/render on separate threads
+    opponent_prediction_enabled: bool = False  # ghost for the right-hand board too
+    dirty_rect_rendering_enabled: bool = True  # present only changed overlay regions
 
 class FeatureToggleManager:
     """Manages feature toggles with persistence."""
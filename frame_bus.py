@@ -0,0 +1,118 @@
+"""Single-grab frame bus shared by the board, shared-UI and queue consumers."""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, List, Sequence, Tuple
+
+import mss  # type: ignore
+import numpy as np
+
+from capture import bgra_view
+from roi_capture import roi_config
+
+log = logging.getLogger(__name__)
+
+Rect = Tuple[int, int, int, int]
+
+
+def roi_rects() -> List[Rect]:
+    """Every rectangle in roi_config.json (including next_queue slots), validated by roi_capture."""
+    return list(roi_config().flat)
+
+
+def union_rect(rects: Iterable[Sequence[int]]) -> Rect:
+    """Return the (left, top, width, height) bounding box of all rectangles."""
+    rects = list(rects)
+    if not rects:
+        raise ValueError("Frame bus needs at least one ROI rectangle")
+    left = min(r[0] for r in rects)
+    top = min(r[1] for r in rects)
+    right = max(r[0] + r[2] for r in rects)
+    bottom = max(r[1] + r[3] for r in rects)
+    return left, top, right - left, bottom - top
+
+
+class BusFrame:
+    """One BGRA grab plus the screen origin it was taken at.
+
+    ``crop``/``view`` take absolute screen coordinates and return numpy views
+    into the shared buffer, so consumers never copy unless they need to.
+    """
+
+    def __init__(self, pixels: np.ndarray, origin: Tuple[int, int]):
+        self.pixels = pixels
+        self.left, self.top = origin
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(width, height), mirroring ``PIL.Image.size``."""
+        return self.pixels.shape[1], self.pixels.shape[0]
+
+    def crop(self, box: Sequence[int]) -> np.ndarray:
+        """PIL-style crop with a (left, upper, right, lower) box in screen coordinates."""
+        left, upper, right, lower = box
+        height, width = self.pixels.shape[:2]
+        x0 = min(max(left - self.left, 0), width)
+        y0 = min(max(upper - self.top, 0), height)
+        x1 = min(max(right - self.left, x0), width)
+        y1 = min(max(lower - self.top, y0), height)
+        return self.pixels[y0:y1, x0:x1]
+
+    def view(self, rect: Sequence[int]) -> np.ndarray:
+        """Return the (left, top, width, height) rectangle as a BGRA view."""
+        left, top, width, height = rect
+        return self.crop((left, top, left + width, top + height))
+
+
+class FrameBus:
+    """Grab the union bounding box of all ROIs once per tick."""
+
+    def __init__(self, rects: Sequence[Sequence[int]] | None = None):
+        if rects is None:
+            rects = roi_rects()
+        left, top, width, height = union_rect(rects)
+        self.sct = mss.mss()
+        screen = self.sct.monitors[0]  # virtual screen spanning every monitor
+        x0 = max(left, screen["left"])
+        y0 = max(top, screen["top"])
+        x1 = min(left + width, screen["left"] + screen["width"])
+        y1 = min(top + height, screen["top"] + screen["height"])
+        if x1 <= x0 or y1 <= y0:
+            raise ValueError("Capture region lies completely off-screen")
+        self.region = {"left": x0, "top": y0, "width": x1 - x0, "height": y1 - y0}
+        log.info("FrameBus initialized with region %s", self.region)
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """(height, width, 4) of every grab – the buffer shape a frame pool needs."""
+        return self.region["height"], self.region["width"], 4
+
+    def grab(self, out: np.ndarray | None = None) -> BusFrame:
+        """Grab the bus region.
+
+        Without ``out`` the frame wraps mss's raw BGRA buffer without copying;
+        with ``out`` (e.g. a pooled buffer of :attr:`shape`) the pixels are
+        copied into it so the frame's memory is owned by the caller.  mss
+        still allocates its own buffer per grab, so ``out`` costs a copy.
+        """
+        pixels = bgra_view(self.sct.grab(self.region))
+        if out is not None:
+            np.copyto(out, pixels)
+            pixels = out
+        return BusFrame(pixels, (self.region["left"], self.region["top"]))
+
+    def close(self) -> None:
+        """Release the mss handle; safe to call more than once."""
+        if self.sct is not None:
+            self.sct.close()
+            self.sct = None
+
+    def __enter__(self) -> "FrameBus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = ["BusFrame", "FrameBus", "roi_rects", "union_rect"]
@@ -0,0 +1,133 @@
+"""Fixed pool of preallocated frame buffers shared by capture and analysis.
+
+Capture writes each grab into a buffer leased from the pool; consumers hold
+the lease while they work on the frame and release it afterwards.  The pool
+never grows, so the number of frames alive at once is bounded (with mss the
+grab itself still allocates; the pixels are copied into the lease).  Leases
+that are garbage-collected without being released are reported as leaks and
+their buffers reclaimed, and :meth:`FramePool.check_leaks` flags leases held
+for suspiciously long.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+
+class PoolExhausted(RuntimeError):
+    """Raised when no buffer becomes free within the acquire timeout."""
+
+
+class FrameLease:
+    """A borrowed buffer; call :meth:`release` (or use ``with``) when done."""
+
+    __slots__ = ("array", "acquired_at", "owner", "_pool", "_index", "_finalizer", "__weakref__")
+
+    def __init__(self, pool: "FramePool", index: int):
+        self.array = pool._buffers[index]
+        self.acquired_at = time.perf_counter()
+        self.owner = threading.current_thread().name
+        self._pool = pool
+        self._index = index
+        # fires if the lease is collected while still checked out
+        self._finalizer = weakref.finalize(self, FramePool._reclaim, pool, index, self.owner)
+
+    @property
+    def released(self) -> bool:
+        return not self._finalizer.alive
+
+    def release(self) -> None:
+        """Return the buffer to the pool; safe to call more than once."""
+        if self._finalizer.detach() is not None:
+            self._pool._put(self._index)
+
+    def __enter__(self) -> "FrameLease":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class FramePool:
+    """``size`` buffers of ``shape`` allocated once, leased round-robin."""
+
+    def __init__(self, size: int, shape: Sequence[int], dtype=np.uint8):
+        if size < 1:
+            raise ValueError("Frame pool needs at least one buffer")
+        self.size = size
+        self.shape: Tuple[int, ...] = tuple(shape)
+        self._buffers: List[np.ndarray] = [np.empty(self.shape, dtype=dtype) for _ in range(size)]
+        self.allocations = size
+        self._free: Deque[int] = deque(range(size))
+        self._out: "weakref.WeakSet[FrameLease]" = weakref.WeakSet()
+        self._cond = threading.Condition()
+        self.acquired = 0
+        self.exhausted = 0
+        self.leaked = 0
+        log.debug("FramePool: %d x %s buffers", size, self.shape)
+
+    @property
+    def available(self) -> int:
+        with self._cond:
+            return len(self._free)
+
+    def acquire(self, timeout: Optional[float] = None) -> FrameLease:
+        """Lease a free buffer, waiting up to ``timeout`` seconds for one."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._free, timeout):
+                self.exhausted += 1
+                raise PoolExhausted(
+                    f"All {self.size} frame buffers are in use "
+                    f"(held by: {sorted({lease.owner for lease in self._out})})"
+                )
+            index = self._free.popleft()
+            self.acquired += 1
+            lease = FrameLease(self, index)
+            self._out.add(lease)
+            return lease
+
+    def check_leaks(self, max_age: float = 1.0) -> List[FrameLease]:
+        """Return (and log) leases held longer than ``max_age`` seconds."""
+        now = time.perf_counter()
+        with self._cond:
+            stale = [lease for lease in self._out if now - lease.acquired_at > max_age]
+        for lease in stale:
+            log.warning(
+                "Frame buffer held for %.2fs by thread %s – missing release()?",
+                now - lease.acquired_at,
+                lease.owner,
+            )
+        return stale
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "available": self.available,
+            "allocations": self.allocations,
+            "acquired": self.acquired,
+            "exhausted": self.exhausted,
+            "leaked": self.leaked,
+        }
+
+    def _put(self, index: int) -> None:
+        with self._cond:
+            self._free.append(index)
+            self._cond.notify()
+
+    @staticmethod
+    def _reclaim(pool: "FramePool", index: int, owner: str) -> None:
+        pool.leaked += 1
+        log.warning("Frame buffer leased by thread %s was never released; reclaimed", owner)
+        pool._put(index)
+
+
+__all__ = ["FrameLease", "FramePool", "PoolExhausted"]
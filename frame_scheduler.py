@@ -0,0 +1,115 @@
+"""Deadline-driven frame loop on a monotonic clock.
+
+Ticks are scheduled on an absolute grid (``start + n * period``) so sleep
+jitter never accumulates into drift.  A tick that overruns its slot counts as
+a missed deadline and the loop jumps to the next future slot instead of
+bursting to catch up.  When the measured tick cost stays above the budget
+the period stretches (down to ``min_fps``) so weaker machines hold a steady,
+slower cadence; it shrinks back once there is headroom again.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+log = logging.getLogger(__name__)
+
+
+class FrameScheduler:
+    """Run a step function at ``target_fps`` with absolute deadlines."""
+
+    def __init__(
+        self,
+        target_fps: float = 30.0,
+        min_fps: float = 10.0,
+        headroom: float = 1.2,
+        smoothing: float = 0.1,
+        on_period_change: Optional[Callable[[float], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ):
+        if target_fps <= 0 or min_fps <= 0 or min_fps > target_fps:
+            raise ValueError("Need 0 < min_fps <= target_fps")
+        self.base_period = 1.0 / target_fps
+        self.max_period = 1.0 / min_fps
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.on_period_change = on_period_change
+        self.period = self.base_period
+        self.avg_cost = 0.0
+        self.ticks = 0
+        self.missed = 0  # ticks that overran their deadline
+        self.skipped = 0  # grid slots dropped to recover from overruns
+        self._clock = clock
+        self._sleep = sleep
+
+    @property
+    def effective_fps(self) -> float:
+        return 1.0 / self.period
+
+    def run(
+        self,
+        step: Callable[[], None],
+        stop: Optional[threading.Event] = None,
+        max_ticks: Optional[int] = None,
+    ) -> None:
+        """Call ``step`` once per slot until ``stop`` is set or ``max_ticks`` ran."""
+        deadline = self._clock()
+        while not (stop is not None and stop.is_set()):
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+            started = self._clock()
+            step()
+            finished = self._clock()
+            self.ticks += 1
+            self._observe(finished - started)
+
+            deadline += self.period
+            if finished > deadline:
+                # overran the slot: resume on the grid rather than catching up
+                behind = int((finished - deadline) // self.period) + 1
+                self.missed += 1
+                self.skipped += behind
+                deadline += behind * self.period
+                log.debug("Frame %d missed its deadline, skipping %d slot(s)", self.ticks, behind)
+            self._wait(deadline - self._clock(), stop)
+
+    def stats(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "missed_deadlines": self.missed,
+            "skipped_slots": self.skipped,
+            "effective_fps": self.effective_fps,
+            "avg_cost_ms": self.avg_cost * 1000.0,
+        }
+
+    def _observe(self, cost: float) -> None:
+        if self.ticks == 1:
+            self.avg_cost = cost
+        else:
+            self.avg_cost += self.smoothing * (cost - self.avg_cost)
+        period = min(max(self.avg_cost * self.headroom, self.base_period), self.max_period)
+        # ignore small wobbles so the cadence stays stable, but always settle
+        # exactly on the target / floor rates
+        at_bound = period in (self.base_period, self.max_period)
+        if period != self.period and (at_bound or abs(period - self.period) > 0.1 * self.period):
+            log.info("Frame period %.1f ms -> %.1f ms", self.period * 1000, period * 1000)
+            self.period = period
+            if self.on_period_change is not None:
+                self.on_period_change(period)
+
+    def _wait(self, delay: float, stop: Optional[threading.Event]) -> None:
+        if delay <= 0:
+            return
+        if self._sleep is not None:
+            self._sleep(delay)
+        elif stop is not None:
+            stop.wait(delay)
+        else:
+            time.sleep(delay)
+
+
+__all__ = ["FrameScheduler"]
@@ -1,19 +1,164 @@
+"""Telemetry logging that never blocks the frame thread.
+
+``LOGGER.info(payload)`` only samples and enqueues the record: a
+:class:`logging.handlers.QueueListener` thread serializes it as one compact
+JSON line – the payload dict itself, plus ``ts`` / ``level`` when needed –
+into a size-rotated file.  A full queue drops the record and counts it
+instead of stalling the frame.
+"""
+
+from __future__ import annotations
+
+import atexit
+import datetime
 import json
 import logging
+import logging.handlers
+from typing import Dict, Optional
+
+from src.pipeline import DROP_NEWEST, BoundedQueue
+
+TELEMETRY_LOGGER = "telemetry"
 
 
 class _JsonFormatter(logging.Formatter):
+    """Payload fields only, instead of every ``LogRecord`` attribute."""
+
     def format(self, record):
-        return json.dumps(record.__dict__, default=str)
+        if isinstance(record.msg, dict):
+            data = dict(record.msg)
+        else:
+            data = {"msg": record.getMessage()}
+        if "ts" not in data:
+            data["ts"] = datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat()
+        if record.levelno != logging.INFO:
+            data["level"] = record.levelname
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str, separators=(",", ":"))
+
+
+class FrameSampler(logging.Filter):
+    """Keep every ``every``-th per-frame payload (dicts with a ``frame_id``).
+
+    Stats, warnings and errors always pass.
+    """
+
+    def __init__(self, every: int = 1):
+        super().__init__()
+        self.every = max(1, int(every))
+        self.skipped = 0
+        self._seen = 0
+
+    def filter(self, record):
+        if self.every == 1 or record.levelno > logging.INFO:
+            return True
+        if not (isinstance(record.msg, dict) and "frame_id" in record.msg):
+            return True
+        keep = self._seen % self.every == 0
+        self._seen += 1
+        if not keep:
+            self.skipped += 1
+        return keep
+
+
+class TelemetryQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records unformatted; drops (and counts) them when the queue is full."""
+
+    def __init__(self, maxsize: int = 10000):
+        super().__init__(BoundedQueue(maxsize, DROP_NEWEST))
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
+    @property
+    def dropped(self) -> int:
+        return self.queue.dropped
+
+    def prepare(self, record):
+        # formatting happens on the listener thread; copy the payload so a
+        # caller mutating its dict afterwards cannot change the logged line
+        if isinstance(record.msg, dict):
+            record.msg = dict(record.msg)
+        return record
 
+    def enqueue(self, record):
+        self.queue.offer(record)
 
-def setup_telemetry_logger(log_path: str = "telemetry.log") -> logging.Logger:
-    logger = logging.getLogger("telemetry")
-    if logger.handlers:
+
+class _TelemetryListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # the drop policy must not discard the stop marker
+        self.queue.put(self._sentinel)
+
+
+def _queue_handler(logger: logging.Logger) -> Optional[TelemetryQueueHandler]:
+    for handler in logger.handlers:
+        if isinstance(handler, TelemetryQueueHandler):
+            return handler
+    return None
+
+
+def setup_telemetry_logger(
+    log_path: str = "telemetry.log",
+    sample_every: int = 1,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 3,
+    queue_size: int = 10000,
+) -> logging.Logger:
+    """Return the telemetry logger, starting its background writer once.
+
+    ``sample_every`` keeps one in N per-frame payloads; the file rolls over
+    at ``max_bytes`` keeping ``backup_count`` old files.
+    """
+    logger = logging.getLogger(TELEMETRY_LOGGER)
+    if _queue_handler(logger) is not None:
         return logger
     logger.setLevel(logging.INFO)
-    handler = logging.FileHandler(log_path, encoding="utf-8")
-    handler.setFormatter(_JsonFormatter())
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+    )
+    file_handler.setFormatter(_JsonFormatter())
+
+    handler = TelemetryQueueHandler(queue_size)
+    handler.addFilter(FrameSampler(sample_every))
+    handler.listener = _TelemetryListener(handler.queue, file_handler)
+    handler.listener.start()
+
     logger.addHandler(handler)
     logger.propagate = False
     return logger
+
+
+def shutdown_telemetry_logger() -> None:
+    """Write out queued records, stop the writer thread and close the file."""
+    logger = logging.getLogger(TELEMETRY_LOGGER)
+    handler = _queue_handler(logger)
+    if handler is None:
+        return
+    logger.removeHandler(handler)
+    if handler.listener is not None:
+        handler.listener.stop()
+        for target in handler.listener.handlers:
+            target.close()
+        handler.listener = None
+    handler.close()
+
+
+def telemetry_stats() -> Dict[str, int]:
+    """Queue depth, queue-full drops and sampled-out frame records."""
+    handler = _queue_handler(logging.getLogger(TELEMETRY_LOGGER))
+    if handler is None:
+        return {"queued": 0, "dropped": 0, "sampled_out": 0}
+    skipped = sum(getattr(f, "skipped", 0) for f in handler.filters)
+    return {"queued": handler.queue.qsize(), "dropped": handler.dropped, "sampled_out": skipped}
+
+
+atexit.register(shutdown_telemetry_logger)
+
+__all__ = [
+    "FrameSampler",
+    "TelemetryQueueHandler",
+    "setup_telemetry_logger",
+    "shutdown_telemetry_logger",
+    "telemetry_stats",
+]
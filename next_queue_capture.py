@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, List
+from typing import Any, List, Tuple
 
 import mss  # type: ignore
 
 from capture import ScreenCapture
-from roi_capture import load_roi_config
+from frame_bus import BusFrame
+from roi_capture import QUEUE_SIDES, Rect, roi_config
 
 log = logging.getLogger(__name__)
 
@@ -26,40 +27,42 @@ def _get_full_capture() -> ScreenCapture:
     if _FULL_CAPTURE is None:
         rect = _full_rect()
         log.debug("Initializing full-screen capture for next queue: %s", rect)
-        _FULL_CAPTURE = ScreenCapture(rect)
+        _FULL_CAPTURE = ScreenCapture(rect, mode="bgra")
     return _FULL_CAPTURE
 
 
-def _grab_full_frame():
-    return _get_full_capture().grab()
+def _grab_full_frame() -> BusFrame:
+    capture = _get_full_capture()
+    # zero-copy BGRA view; crops stay numpy views in screen coordinates
+    return BusFrame(capture.grab(), (capture.region["left"], capture.region["top"]))
 
 
-def _crop(image, rect: list[int]):
+def _crop(image, rect):
     left, top, width, height = rect
     return image.crop((left, top, left + width, top + height))
 
 
-def _queue_entry() -> dict:
-    for entry in load_roi_config():
-        if entry.get("name") == "next_queue":
-            return entry
-    raise KeyError("next_queue entry missing from roi_config.json")
+def _queue_slots(side: str = "left") -> Tuple[Rect, ...]:
+    if side not in QUEUE_SIDES:
+        raise ValueError(f"side must be one of {QUEUE_SIDES}, got {side!r}")
+    slots = roi_config().queues.get(side)
+    if not slots:
+        raise KeyError(f"no {side} next-queue slots in roi_config.json – run calibration")
+    return slots
 
 
-def capture_next_queue(frame=None) -> List[Any]:
-    """Capture the queue rectangles in order and return a list of images."""
-    entry = _queue_entry()
-    rects = entry.get("rect", [])
-    if not isinstance(rects, list):
-        raise ValueError("next_queue rect must be a list of rectangles")
+def capture_next_queue(frame=None, side: str = "left") -> List[Any]:
+    """Capture the queue rectangles in order and return a list of images.
+
+    ``side`` selects the player: ``"right"`` is the opponent's queue in
+    dual-player matches.
+    """
+    rects = _queue_slots(side)
     frame = frame or _grab_full_frame()
     images: List[Any] = []
     for rect in rects:
-        if not isinstance(rect, list) or len(rect) != 4:
-            log.warning("Skipping malformed next_queue rect: %s", rect)
-            continue
         try:
-            images.append(_crop(frame, [int(v) for v in rect]))
+            images.append(_crop(frame, rect))
         except Exception as exc:  # pragma: no cover
             log.error("Failed to capture queue rect %s: %s", rect, exc)
     return images
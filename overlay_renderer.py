@@ -1,47 +1,65 @@
 import logging
+from typing import NamedTuple, Optional, Tuple
+
 import pygame
 
 from tetris_overlay_core import window_filter, ScreenCapture
+from roi_capture import roi_config
 from window_manager import load_cache
+from src.dirty_rects import DirtyRectRenderer
+from src.agents.bitboard import BOARD_COLS, BOARD_ROWS
+from src.agents.prediction_agent_dellacherie import PIECE_SHAPES as AGENT_PIECE_SHAPES
+from src.render_assets import RenderAssets
 
 pygame.init()
 
-# Tetromino shapes (same as in prediction_agent_dellacherie.py)
-PIECE_SHAPES = {
-    "I": [
-        [(0, 0), (1, 0), (2, 0), (3, 0)],
-        [(0, 0), (0, 1), (0, 2), (0, 3)],
-    ],
-    "O": [
-        [(0, 0), (1, 0), (0, 1), (1, 1)],
-    ],
-    "T": [
-        [(1, 0), (0, 1), (1, 1), (2, 1)],
-        [(1, 0), (0, 1), (1, 1), (1, 2)],
-        [(0, 0), (1, 0), (2, 0), (1, 1)],
-        [(1, 0), (1, 1), (2, 1), (1, 2)],
-    ],
-    "S": [
-        [(1, 0), (2, 0), (0, 1), (1, 1)],
-        [(0, 0), (0, 1), (1, 1), (1, 2)],
-    ],
-    "Z": [
-        [(0, 0), (1, 0), (1, 1), (2, 1)],
-        [(1, 0), (0, 1), (1, 1), (0, 2)],
-    ],
-    "J": [
-        [(0, 0), (0, 1), (1, 1), (2, 1)],
-        [(1, 0), (2, 0), (1, 1), (1, 2)],
-        [(0, 0), (1, 0), (2, 0), (2, 1)],
-        [(1, 0), (1, 1), (0, 2), (1, 2)],
-    ],
-    "L": [
-        [(2, 0), (0, 1), (1, 1), (2, 1)],
-        [(1, 0), (1, 1), (1, 2), (2, 2)],
-        [(0, 0), (1, 0), (2, 0), (0, 1)],
-        [(0, 0), (1, 0), (1, 1), (1, 2)],
-    ],
-}
+# Tetromino shapes shared with the prediction agent, so ``target_rot`` indexes
+# the same rotation the agent searched
+PIECE_SHAPES = AGENT_PIECE_SHAPES
+
+
+GHOST_CELL = 30  # px per board cell when the boards are not calibrated
+LABEL_COLOUR = (255, 255, 255)
+
+
+class BoardGeometry(NamedTuple):
+    """Pixel layout of one board on the overlay, precomputed once per calibration.
+
+    ``xs``/``ys`` are the left/top edges of every column/row relative to
+    ``origin`` (rounded from the exact ROI cell size, so the grid does not
+    drift), and ``cell`` is the integer sprite cell size.
+    """
+
+    origin: Tuple[int, int]
+    cell: Tuple[int, int]
+    xs: Tuple[int, ...]
+    ys: Tuple[int, ...]
+
+    @classmethod
+    def from_rect(cls, rect, offset=(0, 0)) -> "BoardGeometry":
+        """Geometry for a board ROI ``(left, top, width, height)`` in screen pixels.
+
+        ``offset`` is the overlay window's top-left corner on screen.
+        """
+        left, top, width, height = rect
+        cell_w, cell_h = width / BOARD_COLS, height / BOARD_ROWS
+        return cls(
+            (int(left) - int(offset[0]), int(top) - int(offset[1])),
+            (max(1, round(cell_w)), max(1, round(cell_h))),
+            tuple(round(c * cell_w) for c in range(BOARD_COLS)),
+            tuple(round(r * cell_h) for r in range(BOARD_ROWS)),
+        )
+
+    @classmethod
+    def uniform(cls, origin, cell=GHOST_CELL) -> "BoardGeometry":
+        return cls.from_rect((origin[0], origin[1], cell * BOARD_COLS, cell * BOARD_ROWS))
+
+    def cell_pos(self, column: int, row: int, origin: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        """Top-left pixel of board cell (``column``, ``row``); row 0 is the top."""
+        ox, oy = origin or self.origin
+        column = min(max(column, 0), BOARD_COLS - 1)
+        row = min(max(row, 0), BOARD_ROWS - 1)
+        return ox + self.xs[column], oy + self.ys[row]
 
 
 class OverlayRenderer:
@@ -53,8 +71,35 @@ class OverlayRenderer:
         
         # Default ghost style - will be overwritten by settings
         self._ghost_colour = (255, 255, 255, 128)  # RGBA
+
+        # Board layout until calibrated ROIs are applied by _update_surface
+        self.boards = {
+            "left": BoardGeometry.uniform((0, 0)),
+            "right": BoardGeometry.uniform((self.screen.get_width() // 2, 0)),
+        }
+
+        # Fonts, labels and ghost sprites are built once, not per frame
+        self.assets = RenderAssets(PIECE_SHAPES)
+        self._prebuild_ghosts()
+
+        # With dirty rects, draws onto self.screen are collected and present()
+        # updates only the regions that changed; otherwise present() flips
+        self.use_dirty_rects = True
+        self.dirty = DirtyRectRenderer()
         logging.info("OverlayRenderer initialized (hidden)")
 
+    def _blit(self, surface, key, image, pos, token=None):
+        if self.use_dirty_rects and surface is self.screen:
+            return self.dirty.blit(key, image, pos, token)
+        return surface.blit(image, pos)
+
+    def present(self):
+        """Show this frame: changed regions only (dirty rects) or a full flip."""
+        if self.use_dirty_rects:
+            return self.dirty.present(self.screen)
+        pygame.display.flip()
+        return None
+
     def update_counters(self, combo=0, b2b=False):
         """Update combo and B2B counters for display."""
         self.combo_counter = combo
@@ -62,20 +107,33 @@ class OverlayRenderer:
 
     def update_ghost_style(self, colour: tuple[int, int, int], opacity: float):
         """Update ghost piece colour and opacity."""
-        self._ghost_colour = (*colour, int(opacity * 255))
+        ghost_colour = (*colour, int(opacity * 255))
+        if ghost_colour != self._ghost_colour:
+            self._ghost_colour = ghost_colour
+            self.assets.clear_sprites()
+            self._prebuild_ghosts()
+
+    def set_board_geometry(self, name: str, rect, offset=(0, 0)):
+        """Lay out board ``name`` from its calibrated ROI (screen pixels)."""
+        geometry = BoardGeometry.from_rect(rect, offset)
+        if geometry != self.boards.get(name):
+            self.boards[name] = geometry
+            self._prebuild_ghosts()
+
+    def _prebuild_ghosts(self):
+        for cell in {board.cell for board in self.boards.values()}:
+            self.assets.prebuild_ghosts(cell, self._ghost_colour)
 
     def draw_stats(self, surface):
         """Draw combo and B2B stats on the overlay."""
         if self.combo_counter > 1 or self.b2b_counter > 0:
-            font = pygame.font.Font(None, 24)
-            
             if self.combo_counter > 1:
-                combo_text = font.render(f"Combo x{self.combo_counter}", True, (0, 255, 255))
-                surface.blit(combo_text, (10, 10))
+                combo_text = self.assets.text(f"Combo x{self.combo_counter}", 24, (0, 255, 255))
+                self._blit(surface, "combo", combo_text, (10, 10))
             
             if self.b2b_counter > 0:
-                b2b_text = font.render(f"B2B x{self.b2b_counter}", True, (255, 215, 0))
-                surface.blit(b2b_text, (10, 40))
+                b2b_text = self.assets.text(f"B2B x{self.b2b_counter}", 24, (255, 215, 0))
+                self._blit(surface, "b2b", b2b_text, (10, 40))
 
     def draw_performance(self, surface):
         """Draw FPS and performance info on the overlay."""
@@ -93,50 +151,58 @@ class OverlayRenderer:
         else:
             color = (255, 0, 0)  # Red - poor
         
-        font = pygame.font.Font(None, 20)
-        fps_text = font.render(f"FPS: {fps:.1f}", True, color)
-        frame_text = font.render(f"Frame: {avg_frame_time:.1f}ms", True, color)
-        
-        # Draw in top-right corner
-        surface.blit(fps_text, (surface.get_width() - 100, 10))
-        surface.blit(frame_text, (surface.get_width() - 100, 30))
-
-    def draw_ghost(self, surface, column, rotation, piece_type="T", is_tspin=False, is_b2b=False, combo=0):
-        """Draw a semi-transparent ghost piece with special move indicators."""
-        cell_w = 30
-        cell_h = 30
-        
-        # Use the current ghost style
-        ghost_surface = pygame.Surface((cell_w, cell_h), pygame.SRCALPHA)
-        ghost_surface.fill(self._ghost_colour)
-        
-        # Draw the ghost piece (simple rectangle for now - can be enhanced with real shapes)
-        x = column * cell_w
-        y = (20 - 1) * cell_h  # Position at bottom of board
-        surface.blit(ghost_surface, (x, y))
+        # numbers change every frame – render with the cached font, don't memoize
+        font = self.assets.font(20)
+        fps_label = f"FPS: {fps:.1f}"
+        frame_label = f"Frame: {avg_frame_time:.1f}ms"
+        fps_text = font.render(fps_label, True, color)
+        frame_text = font.render(frame_label, True, color)
         
+        # Draw in top-right corner (the label text is the dirty-rect token)
+        self._blit(surface, "fps", fps_text, (surface.get_width() - 100, 10), (fps_label, color))
+        self._blit(surface, "frame_time", frame_text, (surface.get_width() - 100, 30), (frame_label, color))
+
+    def draw_ghost(self, surface, column, rotation, piece_type="T", is_tspin=False, is_b2b=False, combo=0,
+                   origin=None, colour=None, row=None, board="left"):
+        """Draw a semi-transparent ghost piece with special move indicators.
+
+        The whole piece is one cached sprite placed at (``column``, ``row``) on
+        ``board``'s calibrated grid; without a ``row`` it rests on the floor.
+        ``origin`` overrides the board's top-left corner on ``surface`` and
+        ``colour`` the ghost style (used for the opponent's board).
+        """
+        geometry = self.boards[board]
+        sprite = self.assets.ghost_sprite(piece_type, rotation, geometry.cell, colour or self._ghost_colour)
+        width = sprite.get_width() // geometry.cell[0]
+        height = sprite.get_height() // geometry.cell[1]
+        if row is None:
+            row = BOARD_ROWS - height
+        column = min(max(column, 0), BOARD_COLS - width)
+        row = min(max(row, 0), BOARD_ROWS - height)
+        x, y = geometry.cell_pos(column, row, origin)
+        key_origin = origin or geometry.origin
+        self._blit(surface, ("ghost", key_origin), sprite, (x, y))
+
         # Draw special move indicators above the ghost
+        centre_x = x + sprite.get_width() // 2
         indicator_y = y - 10
         
         if is_tspin:
-            font = pygame.font.Font(None, 20)
-            text = font.render("TSPIN", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(x + cell_w // 2, indicator_y))
-            surface.blit(text, text_rect)
+            text = self.assets.text("TSPIN", 20, LABEL_COLOUR)
+            text_rect = text.get_rect(center=(centre_x, indicator_y))
+            self._blit(surface, ("ghost_tspin", key_origin), text, text_rect.topleft)
             indicator_y -= 15
         
         if is_b2b:
-            font = pygame.font.Font(None, 20)
-            text = font.render("B2B", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(x + cell_w // 2, indicator_y))
-            surface.blit(text, text_rect)
+            text = self.assets.text("B2B", 20, LABEL_COLOUR)
+            text_rect = text.get_rect(center=(centre_x, indicator_y))
+            self._blit(surface, ("ghost_b2b", key_origin), text, text_rect.topleft)
             indicator_y -= 15
         
         if combo > 0:
-            font = pygame.font.Font(None, 20)
-            text = font.render(f"x{combo}", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(x + cell_w // 2, indicator_y))
-            surface.blit(text, text_rect)
+            text = self.assets.text(f"x{combo}", 20, LABEL_COLOUR)
+            text_rect = text.get_rect(center=(centre_x, indicator_y))
+            self._blit(surface, ("ghost_combo", key_origin), text, text_rect.topleft)
 
     def toggle(self):
         self.visible = not self.visible
@@ -164,13 +230,15 @@ class OverlayRenderer:
             else:
                 capture_rect = tuple(roi)
 
-            capture = ScreenCapture(capture_rect)
-            img = capture.grab()
-            surface = pygame.image.fromstring(img.tobytes(), img.size, "RGB")
+            with ScreenCapture(capture_rect, mode="bgra") as capture:
+                img = capture.grab()
+            surface = pygame.image.frombuffer(img, (img.shape[1], img.shape[0]), "BGRA")
             size = surface.get_size()
             self.screen = pygame.display.set_mode(
                 size, pygame.NOFRAME | pygame.SRCALPHA
             )
+            self.dirty.invalidate()
+            self._layout_boards(capture_rect)
             self.screen.blit(surface, (0, 0))
             ghost = pygame.Surface((80, 40), pygame.SRCALPHA)
             ghost.fill((0, 255, 0, 96))
@@ -182,6 +250,18 @@ class OverlayRenderer:
             logging.error(f"Failed to update overlay surface: {e}")
             self.visible = False
 
+    def _layout_boards(self, capture_rect):
+        """Place both boards from roi_config.json relative to the overlay window."""
+        try:
+            rects = roi_config().rects
+        except (OSError, ValueError) as e:
+            logging.warning("Board ROIs unavailable, keeping default ghost grid: %s", e)
+            return
+        for name, roi_name in (("left", "player_left_board"), ("right", "player_right_board")):
+            rect = rects.get(roi_name)
+            if rect is not None and rect[2] > 0 and rect[3] > 0:
+                self.set_board_geometry(name, rect, capture_rect[:2])
+
     def run_loop(self):
         while True:
             pygame.event.pump()
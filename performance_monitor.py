@@ -11,6 +11,9 @@ class PerformanceMonitor:
     def __init__(self, history_size: int = 60):
         self.history_size = history_size
         self.frame_times = deque(maxlen=history_size)
+        self.frame_ages = deque(maxlen=history_size)  # capture-to-analysis delay
+        self.dedup_hits = 0  # ROI work skipped because the pixels were unchanged
+        self.dedup_lookups = 0
         self.last_frame_time = time.time()
         self.frame_count = 0
         self.start_time = time.time()
@@ -22,10 +25,28 @@ class PerformanceMonitor:
     def end_frame(self) -> float:
         """Mark the end of a frame and return the frame time."""
         frame_time = time.time() - self.last_frame_time
+        self.record_frame_time(frame_time)
+        return frame_time
+
+    def record_frame_time(self, frame_time: float):
+        """Record a frame measured elsewhere (e.g. capture-to-render in the staged pipeline)."""
         self.frame_times.append(frame_time)
         self.frame_count += 1
-        return frame_time
     
+    def record_frame_age(self, age: float):
+        """Record how old a captured frame was when analysis picked it up."""
+        self.frame_ages.append(age)
+
+    def record_dedup(self, hit: bool):
+        """Count one fingerprint lookup on the capture path."""
+        self.dedup_lookups += 1
+        if hit:
+            self.dedup_hits += 1
+
+    @property
+    def dedup_hit_ratio(self) -> float:
+        return self.dedup_hits / self.dedup_lookups if self.dedup_lookups else 0.0
+
     def get_stats(self) -> Dict[str, Any]:
         """Get current performance statistics."""
         if not self.frame_times:
@@ -41,7 +62,7 @@ class PerformanceMonitor:
         current_time = time.time()
         uptime = current_time - self.start_time
         
-        return {
+        stats = {
             "fps": len(self.frame_times) / uptime if uptime > 0 else 0,
             "avg_frame_time": sum(self.frame_times) / len(self.frame_times),
             "min_frame_time": min(self.frame_times),
@@ -49,6 +70,12 @@ class PerformanceMonitor:
             "total_frames": self.frame_count,
             "uptime": uptime
         }
+        if self.dedup_lookups:
+            stats["dedup_hit_ratio"] = self.dedup_hit_ratio
+        if self.frame_ages:
+            stats["avg_frame_age"] = sum(self.frame_ages) / len(self.frame_ages)
+            stats["max_frame_age"] = max(self.frame_ages)
+        return stats
     
     def is_target_fps_met(self, target_fps: float = 30.0) -> bool:
         """Check if we're meeting the target FPS."""
@@ -22,16 +22,14 @@ PIECE_TEMPLATES = {
 }
 
 def detect_piece_from_image(image) -> Optional[str]:
-    """Detect piece type from a PIL image using simple color analysis."""
+    """Detect piece type from a PIL image or a BGRA frame-bus view."""
     try:
-        # Convert PIL to numpy array (OpenCV format)
-        img_array = np.array(image)
-        
-        # Convert RGB to BGR for OpenCV
-        if img_array.shape[2] == 3:  # RGB
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        if isinstance(image, np.ndarray):
+            # Frame-bus views are already BGR(A); drop alpha without copying
+            img_bgr = image[:, :, :3]
         else:
-            img_bgr = img_array
+            # Convert PIL RGB to BGR for OpenCV
+            img_bgr = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
         
         # Get average color
         avg_color = np.mean(img_bgr, axis=(0, 1))
@@ -70,10 +68,15 @@ def detect_piece_from_image(image) -> Optional[str]:
         log.error(f"Error detecting piece: {e}")
         return None
 
-def get_current_piece() -> Optional[str]:
-    """Get the current piece from the next queue (first slot)."""
+def get_current_piece(queue_images: Optional[List] = None) -> Optional[str]:
+    """Get the current piece from the next queue (first slot).
+
+    Pass ``queue_images`` from an earlier ``capture_next_queue`` call to
+    avoid grabbing the screen again.
+    """
     try:
-        queue_images = capture_next_queue()
+        if queue_images is None:
+            queue_images = capture_next_queue()
         if not queue_images:
             log.warning("No queue images captured")
             return None
@@ -92,11 +95,12 @@ def get_current_piece() -> Optional[str]:
         log.error(f"Error getting current piece: {e}")
         return None
 
-def get_next_pieces(count: int = 3) -> List[str]:
+def get_next_pieces(count: int = 3, queue_images: Optional[List] = None) -> List[str]:
     """Get the next pieces from the queue."""
     pieces = []
     try:
-        queue_images = capture_next_queue()
+        if queue_images is None:
+            queue_images = capture_next_queue()
         
         for i in range(min(count, len(queue_images))):
             piece = detect_piece_from_image(queue_images[i])
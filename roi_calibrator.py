@@ -6,6 +6,7 @@ from PIL import ImageTk
 import mss
 
 from capture import ScreenCapture
+from config_cache import reload_all
 from dual_roi_manager import set_roi_pair
 
 ROI_CONFIG_PATH = Path("config/roi_config.json")
@@ -107,6 +108,8 @@ def _save_roi_config(entries, left_queue_rects, right_queue_rects):
     }
     with ROI_CONFIG_PATH.open("w", encoding="utf-8") as fh:
         json.dump(data, fh, indent=2)
+    # capture helpers pick the new rects up on their next frame
+    reload_all()
     total_rois = len(entries) + len(left_queue_rects) + len(right_queue_rects)
     print(f"Saved {total_rois} ROIs to {ROI_CONFIG_PATH}")
 
@@ -4,28 +4,119 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet, NamedTuple, Tuple
 
 from capture import ScreenCapture
+from config_cache import FileCache
 
 CONFIG_PATH = Path("config/roi_config.json")
+QUEUE_SIDES = ("left", "right")
+_QUEUE_SLOT = re.compile(r"^(left|right)_next_queue_slot_(\d+)$")
 
 log = logging.getLogger(__name__)
 
+Rect = Tuple[int, int, int, int]
 
-def load_roi_config() -> list[dict]:
-    """Return the ROI list stored in roi_config.json."""
-    if not CONFIG_PATH.is_file():
+
+class RoiConfig(NamedTuple):
+    """roi_config.json parsed and validated once.
+
+    ``rects`` maps single-rectangle ROIs and ``slots`` composite ones (such as
+    ``next_queue``) to int tuples; names whose rect is malformed are listed in
+    ``invalid``.  ``flat`` is every positive-size rectangle, in file order.
+    ``queues`` holds each side's next-queue slots ("left" / "right"), ordered
+    by the ``<side>_next_queue_slot_<n>`` entries the calibrator writes; a
+    legacy ``next_queue`` list stands in for a left queue without slots.
+    """
+
+    entries: Tuple[dict, ...]
+    rects: Dict[str, Rect]
+    slots: Dict[str, Tuple[Rect, ...]]
+    invalid: FrozenSet[str]
+    flat: Tuple[Rect, ...]
+    queues: Dict[str, Tuple[Rect, ...]]
+
+
+def _as_rect(value) -> Rect | None:
+    if not isinstance(value, (list, tuple)) or len(value) != 4:
+        return None
+    try:
+        return tuple(int(v) for v in value)  # type: ignore[return-value]
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_roi_config(path: Path) -> RoiConfig:
+    if not path.is_file():
         raise FileNotFoundError(
-            f"{CONFIG_PATH} missing – run calibration (Ctrl+Alt+C) to generate it"
+            f"{path} missing – run calibration (Ctrl+Alt+C) to generate it"
         )
-    with CONFIG_PATH.open("r", encoding="utf-8") as fh:
+    with path.open("r", encoding="utf-8") as fh:
         data = json.load(fh)
     rois = data.get("rois", [])
     if not isinstance(rois, list):
         raise ValueError("Invalid ROI config – expected 'rois' list")
-    return rois
+
+    rects: Dict[str, Rect] = {}
+    slots: Dict[str, Tuple[Rect, ...]] = {}
+    invalid = set()
+    flat = []
+    for entry in rois:
+        name = entry.get("name")
+        rect = entry.get("rect")
+        if not rect:
+            continue
+        if isinstance(rect, list) and isinstance(rect[0], list):
+            parsed = []
+            for candidate in rect:
+                slot = _as_rect(candidate)
+                if slot is None:
+                    log.warning("Skipping malformed rect in '%s': %s", name, candidate)
+                    continue
+                parsed.append(slot)
+            slots[name] = tuple(parsed)
+        else:
+            single = _as_rect(rect)
+            if single is None:
+                log.warning("Malformed rect for ROI '%s': %s", name, rect)
+                invalid.add(name)
+                continue
+            rects[name] = single
+            parsed = [single]
+        flat.extend(r for r in parsed if r[2] > 0 and r[3] > 0)
+    return RoiConfig(tuple(rois), rects, slots, frozenset(invalid), tuple(flat), _queues(rects, slots))
+
+
+def _queues(rects: Dict[str, Rect], slots: Dict[str, Tuple[Rect, ...]]) -> Dict[str, Tuple[Rect, ...]]:
+    numbered: Dict[str, list] = {side: [] for side in QUEUE_SIDES}
+    for name, rect in rects.items():
+        match = _QUEUE_SLOT.match(name)
+        if match:
+            numbered[match.group(1)].append((int(match.group(2)), rect))
+    queues = {side: tuple(rect for _, rect in sorted(found)) for side, found in numbered.items() if found}
+    if "left" not in queues and slots.get("next_queue"):
+        queues["left"] = slots["next_queue"]
+    return queues
+
+
+_ROI_CACHE = FileCache(lambda: CONFIG_PATH, _parse_roi_config)
+
+
+def roi_config() -> RoiConfig:
+    """Typed ROI config, re-parsed only when roi_config.json changes."""
+    return _ROI_CACHE.get()
+
+
+def reload_roi_config() -> None:
+    """Drop the cached ROI config (called after calibration saves)."""
+    _ROI_CACHE.reload()
+
+
+def load_roi_config() -> list[dict]:
+    """Return the ROI list stored in roi_config.json (cached; do not mutate)."""
+    return list(roi_config().entries)
 
 
 def _instantiate_capture(rect: list[int]) -> ScreenCapture:
@@ -54,4 +145,4 @@ def capture_all() -> Dict[str, Any]:
     return frames
 
 
-__all__ = ["load_roi_config", "capture_all"]
+__all__ = ["QUEUE_SIDES", "Rect", "RoiConfig", "capture_all", "load_roi_config", "reload_roi_config", "roi_config"]
@@ -4,6 +4,7 @@ import logging
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
@@ -13,16 +14,23 @@ import pygame
 from tetris_overlay_core import run_overlay, toggle_overlay, reset_calibration, graceful_exit
 from overlay_renderer import OverlayRenderer
 from tools.calibration.calibration_ui import start_calibration
-from dual_capture import DualScreenCapture
+from dual_capture import CaptureSession, DualScreenCapture
+from capture_thread import CapturedFrame, CaptureThread
+from src.config import AppConfig
+from src.agents.prediction_backend import ProcessPredictionBackend, load_prediction_agent, make_prediction_backend
 from roi_calibrator import start_calibrator
 from shared_ui_capture import capture_shared_ui
 from next_queue_capture import capture_next_queue
-from piece_detector import get_current_piece
+from piece_detector import get_current_piece, get_next_pieces
+from board_tracker import BoardStateTracker
+from board_sampler import sample_board
+from frame_dedup import FrameDeduper
+from frame_scheduler import FrameScheduler
+from src.pipeline import BLOCK, DROP_OLDEST, Pipeline
 from performance_monitor import performance_monitor
-import pygame  # Required for pygame.display.flip()
 import threading
 import time
-from logger_config import setup_telemetry_logger
+from logger_config import setup_telemetry_logger, shutdown_telemetry_logger, telemetry_stats
 from error_handler import error_handler
 from feature_toggles import is_feature_enabled
 
@@ -31,13 +39,54 @@ from ui.settings_storage import load as load_settings, save as save_settings
 from ui.settings_dialog import SettingsDialog
 from ui.stats_dashboard import StatsDashboard
 from stats.db import init_db
-from stats.collector import start_new_match, end_current_match, record_event
+from stats.collector import start_new_match, end_current_match, record_event, writer_stats
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
-LOGGER = setup_telemetry_logger()
 FRAME_COUNTER = 0
 
+# Created once, rebuilt only when the ROI config changes; the lambda keeps
+# DualScreenCapture looked up at call time so tests can patch it
+CAPTURE_SESSION = CaptureSession(lambda: DualScreenCapture())
+
+# When started, grabs run on their own thread and process_frames consumes
+# the newest frame; otherwise process_frames captures inline
+APP_CONFIG = AppConfig.load()
+# Records are serialized and written by a background thread
+LOGGER = setup_telemetry_logger(
+    sample_every=APP_CONFIG.telemetry_sample_every,
+    max_bytes=APP_CONFIG.telemetry_max_bytes,
+    backup_count=APP_CONFIG.telemetry_backup_count,
+    queue_size=APP_CONFIG.telemetry_queue_size,
+)
+CAPTURE_THREAD = CaptureThread(
+    lambda: CaptureSession(lambda: DualScreenCapture()),
+    min_interval=1.0 / APP_CONFIG.dxgi_target_fps,
+    pool_size=APP_CONFIG.dxgi_pool_size,
+)
+CAPTURE_TIMEOUT_S = 0.5
+LAST_CAPTURE_SEQ = 0
+
+# Unchanged ROIs (piece between rows, pause screens) reuse the last result
+FRAME_DEDUP = FrameDeduper(monitor=performance_monitor)
+
+# Prediction and stats only run when the settled stack changes
+BOARD_TRACKER = BoardStateTracker()
+LAST_PREDICTION = None
+
+# Set when the staged_pipeline_enabled toggle runs the stages on their own threads
+OVERLAY_PIPELINE = None
+
+# The right board is analysed on this pool while the calling thread handles
+# the left one (numpy / OpenCV release the GIL)
+ANALYSIS_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="analysis")
+
+# Opponent (right board) prediction, behind the opponent_prediction_enabled toggle
+OPPONENT_TRACKER = BoardStateTracker()
+OPPONENT_AGENT = None
+LAST_OPPONENT_PREDICTION = None
+OPPONENT_GHOST_COLOUR = (255, 80, 80, 110)
+
 # Load settings as global CURRENT singleton
 CURRENT_SETTINGS = load_settings()
 
@@ -58,12 +107,7 @@ if not error_handler.check_roi_config():
 
 # Create global overlay renderer instance
 overlay_renderer = OverlayRenderer()
-
-# Initialize database
-init_db()
-
-# Start a new match
-start_new_match(CURRENT_SETTINGS.prediction_agent)
+overlay_renderer.use_dirty_rects = is_feature_enabled("dirty_rect_rendering_enabled")
 
 def _toggle_logging():
     root = logging.getLogger()
@@ -77,7 +121,17 @@ def _toggle_logging():
 def _graceful_exit():
     """Handle graceful exit with stats cleanup."""
     end_current_match()
+    if OVERLAY_PIPELINE is not None:
+        OVERLAY_PIPELINE.stop()
+    CAPTURE_THREAD.stop()
+    CAPTURE_SESSION.close()
+    for agent in (prediction_agent, OPPONENT_AGENT):
+        close_agent = getattr(agent, "close", None)
+        if close_agent is not None:
+            close_agent()
+    ANALYSIS_POOL.shutdown(wait=False)
     logging.info("Esc pressed – shutting down")
+    shutdown_telemetry_logger()
     from tetris_overlay_core import graceful_exit
     graceful_exit()
 
@@ -121,30 +175,34 @@ def _on_settings_changed(new_settings):
         opacity=new_settings.ghost.opacity,
     )
 
-# Register initial hotkeys
-_register_dynamic_hotkeys()
-
-
-def load_prediction_agent(agent_name: str) -> Any:
-    """Dynamically import and instantiate a prediction agent."""
-    if agent_name == "dellacherie":
-        from src.agents.prediction_agent_dellacherie import PredictionAgent
-        return PredictionAgent()
-    elif agent_name == "onnx":
-        from src.agents.prediction_agent_onnx import PredictionAgent
-        return PredictionAgent()
-    elif agent_name == "simple":
-        from src.agents.prediction_agent_simple import PredictionAgent
-        return PredictionAgent()
-    elif agent_name == "mock":
-        from src.agents.prediction_agent_mock_perfect import PredictionAgent
-        return PredictionAgent()
-    else:
-        raise ValueError(f"Unknown prediction_agent: {agent_name}")
+# Prediction agent chosen in the settings (in a worker process when
+# AppConfig.prediction_backend == "process"); set by _start_prediction_agents()
+prediction_agent = None
+
 
+def _start_prediction_agents():
+    """Create the prediction backends and wait for their workers.
 
-# Load prediction agent based on settings
-prediction_agent = load_prediction_agent(CURRENT_SETTINGS.prediction_agent)
+    Only called under ``__main__``: a ``spawn`` worker re-imports this script
+    as ``__mp_main__``, so nothing at module level may open the database,
+    register hotkeys or start another worker.
+    """
+    global prediction_agent
+    prediction_agent = make_prediction_backend(
+        CURRENT_SETTINGS.prediction_agent,
+        APP_CONFIG.prediction_backend,
+        timeout_ms=APP_CONFIG.prediction_timeout_ms,
+    )
+    if isinstance(prediction_agent, ProcessPredictionBackend):
+        prediction_agent.start()
+    if is_feature_enabled("opponent_prediction_enabled"):
+        opponent = _opponent_agent()
+        if isinstance(opponent, ProcessPredictionBackend):
+            try:
+                opponent.start()
+            except Exception as e:
+                # handle() keeps retrying the start in the background
+                LOGGER.warning(f"Opponent prediction worker did not start: {e}")
 
 
 def roi_to_binary_matrix(roi_image):
@@ -159,128 +217,316 @@ def roi_to_binary_matrix(roi_image):
 
 
 def extract_board(image):
-    """Extract board state from PIL Image using existing board processing logic."""
+    """Extract the 20×10 board from a BGRA frame-bus view or a PIL Image."""
+    return sample_board(image)
+
+
+def _image_size(image):
+    """Return (width, height) for a PIL image or a numpy view; (0, 0) if missing."""
     import numpy as np
-    import cv2
 
-    # Convert PIL to numpy array
-    frame = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+    if image is None:
+        return 0, 0
+    if isinstance(image, np.ndarray):
+        return image.shape[1], image.shape[0]
+    return image.size[0], image.size[1]
 
-    # Use existing board processing logic
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-    thresh = cv2.adaptiveThreshold(
-        blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-    )
-    mask_resized = cv2.resize(thresh, (10, 20), interpolation=cv2.INTER_NEAREST)
-    mask_binary = np.where(mask_resized > 0, 255, 0).astype(np.uint8)
 
-    return mask_binary
+def _detect_queue(queue_images):
+    """Return (current piece or None, upcoming pieces) from the queue slot images."""
+    current = get_current_piece(queue_images)
+    # Remaining queue slots feed the agent's lookahead (ignored by agents without one)
+    upcoming = get_next_pieces(len(queue_images) - 1, queue_images[1:]) if queue_images else []
+    return current, upcoming
 
 
-def process_frames():
-    """Process a single frame of the overlay."""
-    global FRAME_COUNTER
-    
-    performance_monitor.start_frame()
-    capture_start_ts = time.time()
-    
+def _next_capture():
+    """Return the next CapturedFrame from the capture thread or an inline grab.
+
+    The caller must ``release()`` it once the views are no longer needed.
+    """
+    global LAST_CAPTURE_SEQ
+
+    if not CAPTURE_THREAD.running:
+        capture = CAPTURE_SESSION.get()
+        left_img, right_img = capture.grab()
+        return CapturedFrame(0, time.perf_counter(), left_img, right_img, capture.frame)
+
+    captured = CAPTURE_THREAD.next_frame(LAST_CAPTURE_SEQ, timeout=CAPTURE_TIMEOUT_S)
+    if captured is None:
+        raise TimeoutError("Capture thread produced no new frame")
+    LAST_CAPTURE_SEQ = captured.seq
+    performance_monitor.record_frame_age(captured.age)
+    return captured
+
+
+def _extract_stage(captured):
+    """Pipeline stage 1: turn a CapturedFrame into boards, queue and UI sizes.
+
+    Everything read from the frame is copied out, so the pooled buffer is
+    released before the state moves downstream.
+    """
+    opponent = is_feature_enabled("opponent_prediction_enabled")
+    right_future = ANALYSIS_POOL.submit(_analyse_right, captured, opponent)
     try:
-        left_img, right_img = DualScreenCapture().grab()
-        left_board = extract_board(left_img)
-        right_board = extract_board(right_img)
-        shared = capture_shared_ui()
-        queue_images = capture_next_queue()
+        # One grab per tick: boards, shared UI and queue all read the same frame
+        left_board = FRAME_DEDUP.get_or_compute("left_board", captured.left, extract_board)
+        shared = capture_shared_ui(captured.frame)
+        queue_images = capture_next_queue(captured.frame)
+        queue = FRAME_DEDUP.get_or_compute("next_queue", queue_images, _detect_queue)
+        right_board, opponent_queue = right_future.result()
+    finally:
+        # The right-hand analysis reads the frame too – let it finish first
+        right_future.exception()
+        # Hand the pooled frame buffer back to the capture thread
+        captured.release()
+    return {
+        "start_ts": captured.timestamp,
+        "left_board": left_board,
+        "right_board": right_board,
+        "shared_sizes": {name: _image_size(shared.get(name)) for name in ("score", "wins", "timer")},
+        "queue": queue,
+        "opponent_queue": opponent_queue,
+    }
+
+
+def _analyse_right(captured, opponent):
+    """Right board (and, for opponent prediction, its queue) on the analysis pool."""
+    right_board = FRAME_DEDUP.get_or_compute("right_board", captured.right, extract_board)
+    if not opponent:
+        return right_board, (None, [])
+    try:
+        queue_images = capture_next_queue(captured.frame, side="right")
+    except KeyError:
+        queue_images = []  # no opponent queue calibrated – fall back to a "T"
+    return right_board, FRAME_DEDUP.get_or_compute("opponent_queue", queue_images, _detect_queue)
+
+
+def _fallback_state(start_ts):
+    """Empty frame state used when the capture fails."""
+    return {
+        "start_ts": start_ts,
+        "left_board": [[0] * 10 for _ in range(20)],
+        "right_board": [[0] * 10 for _ in range(20)],
+        "shared_sizes": {name: (0, 0) for name in ("score", "wins", "timer")},
+        "queue": (None, []),
+        "opponent_queue": (None, []),
+    }
+
+
+def _opponent_agent():
+    """Separate agent instance: combo / B2B state must not mix between players.
+
+    Created by _start_prediction_agents() when the toggle is on at startup;
+    a process backend created here later starts its worker in the background,
+    and until it is ready ``handle`` raises TimeoutError and the last
+    prediction stays.
+    """
+    global OPPONENT_AGENT
+    if OPPONENT_AGENT is None:
+        OPPONENT_AGENT = make_prediction_backend(
+            CURRENT_SETTINGS.prediction_agent,
+            APP_CONFIG.prediction_backend,
+            timeout_ms=APP_CONFIG.prediction_timeout_ms,
+        )
+    return OPPONENT_AGENT
+
 
+def _predict_opponent(state):
+    """Track the right board; return a fresh opponent prediction or None to keep the last."""
+    board_event = OPPONENT_TRACKER.update(state["right_board"])
+    if board_event is None and LAST_OPPONENT_PREDICTION is not None:
+        return None
+    piece = state["opponent_queue"][0] or "T"
+    try:
+        pred = _opponent_agent().handle(
+            {"board": state["right_board"], "piece": piece, "orientation": 0, "queue": state["opponent_queue"][1]}
+        )
     except Exception as e:
-        # Handle screen capture errors gracefully
-        if not error_handler.handle_critical_error(e, "Screen Capture"):
-            raise  # Re-raise if user chose to exit
-        
-        # Fallback: use dummy data
-        left_board = [[0] * 10 for _ in range(20)]
-        right_board = [[0] * 10 for _ in range(20)]
-        shared = {}
-        queue_images = []
-        error_handler.handle_warning("Using fallback data due to capture error", "Frame Processing")
+        LOGGER.warning(f"Opponent prediction error: {e}")
+        return None
+    pred.setdefault("piece", piece)
+    return pred
 
-        # Get current piece from queue (fallback to "T" if detection fails)
-        current_piece = get_current_piece() or "T"
+
+def _predict_stage(state):
+    """Pipeline stage 2: track the board and predict on lock / clear events.
+
+    With opponent_prediction_enabled the right board is predicted on the
+    analysis pool at the same time.
+    """
+    global LAST_PREDICTION, LAST_OPPONENT_PREDICTION
+
+    opponent_future = None
+    if is_feature_enabled("opponent_prediction_enabled"):
+        opponent_future = ANALYSIS_POOL.submit(_predict_opponent, state)
+
+    # Frames between piece locks keep the previous prediction
+    board_event = BOARD_TRACKER.update(state["left_board"])
+    if board_event is not None or LAST_PREDICTION is None:
+        # Current piece from the queue (fallback to "T" if detection fails)
+        current_piece, upcoming = state["queue"]
+        current_piece = current_piece or "T"
 
         try:
-            pred = prediction_agent.handle({"board": left_board, "piece": current_piece, "orientation": 0})
+            pred = prediction_agent.handle(
+                {"board": state["left_board"], "piece": current_piece, "orientation": 0, "queue": upcoming}
+            )
         except Exception as e:
             # Handle prediction errors gracefully
             error_handler.handle_warning(f"Prediction error: {e}", "AI Prediction")
             # Fallback prediction
             pred = {"piece": current_piece, "target_col": 3, "target_rot": 0, "combo": 0, "is_b2b": False, "is_tspin": False}
+        pred.setdefault("piece", current_piece)
+        LAST_PREDICTION = pred
 
-        # Draw ghost on overlay (reuse global renderer instance)
-        if overlay_renderer.visible and is_feature_enabled("ghost_pieces_enabled") and CURRENT_SETTINGS.show_combo:
-            # Extract piece type from prediction if available, otherwise use detected piece
-            piece_type = pred.get("piece", current_piece)
-            
-            # Get special move indicators from prediction
-            is_tspin = pred.get("is_tspin", False)
-            is_b2b = pred.get("is_b2b", False)
-            combo = pred.get("combo", 0)
-            
-            # Update overlay counters
-            overlay_renderer.update_counters(combo, is_b2b)
-            
-            # Draw ghost piece
+    state["event"] = board_event
+    state["prediction"] = LAST_PREDICTION
+    if opponent_future is not None:
+        LAST_OPPONENT_PREDICTION = opponent_future.result() or LAST_OPPONENT_PREDICTION
+        state["opponent_prediction"] = LAST_OPPONENT_PREDICTION
+    return state
+
+
+def _render_stage(state):
+    """Pipeline stage 3: draw the ghost, record statistics and telemetry."""
+    global FRAME_COUNTER
+
+    pred = state["prediction"]
+    board_event = state["event"]
+    current_piece = pred["piece"]
+
+    # Draw ghost on overlay (reuse global renderer instance)
+    if overlay_renderer.visible and is_feature_enabled("ghost_pieces_enabled") and CURRENT_SETTINGS.show_combo:
+        # Extract piece type from prediction if available, otherwise use detected piece
+        piece_type = pred.get("piece", current_piece)
+        
+        # Get special move indicators from prediction
+        is_tspin = pred.get("is_tspin", False)
+        is_b2b = pred.get("is_b2b", False)
+        combo = pred.get("combo", 0)
+        
+        # Update overlay counters
+        overlay_renderer.update_counters(combo, is_b2b)
+        
+        # Draw ghost piece
+        overlay_renderer.draw_ghost(
+            overlay_renderer.screen, 
+            pred["target_col"], 
+            pred["target_rot"], 
+            piece_type,
+            is_tspin,
+            is_b2b,
+            combo,
+            row=pred.get("target_row"),
+        )
+
+        # Opponent's best placement on the calibrated right board
+        opponent_pred = state.get("opponent_prediction")
+        if opponent_pred is not None:
             overlay_renderer.draw_ghost(
-                overlay_renderer.screen, 
-                pred["target_col"], 
-                pred["target_rot"], 
-                piece_type,
-                is_tspin,
-                is_b2b,
-                combo
-            )
-            
-            # Draw stats (combo, B2B)
-            if is_feature_enabled("combo_indicators_enabled") or is_feature_enabled("b2b_indicators_enabled"):
-                overlay_renderer.draw_stats(overlay_renderer.screen)
-            
-            # Draw performance info (FPS)
-            if is_feature_enabled("performance_monitor_enabled"):
-                overlay_renderer.draw_performance(overlay_renderer.screen)
-            
-            pygame.display.flip()
-
-        # Record statistics
-        if is_feature_enabled("statistics_enabled"):
-            latency_ms = (time.time() - capture_start_ts) * 1000
-            record_event(
-                frame=FRAME_COUNTER,
-                piece=pred.get("piece", current_piece),
-                orientation=pred.get("target_rot", 0),
-                lines_cleared=shared.get("lines_cleared", 0),
-                combo=pred.get("combo", 0),
-                b2b=pred.get("is_b2b", False),
-                tspin=pred.get("is_tspin", False),
-                latency_ms=latency_ms
+                overlay_renderer.screen,
+                opponent_pred["target_col"],
+                opponent_pred["target_rot"],
+                opponent_pred["piece"],
+                colour=OPPONENT_GHOST_COLOUR,
+                row=opponent_pred.get("target_row"),
+                board="right",
             )
         
-        FRAME_COUNTER += 1
-
-        LOGGER.info(
-            {
-                "ts": datetime.datetime.utcnow().isoformat(),
-                "frame_id": FRAME_COUNTER,
-                "score_w": shared["score"].size[0],
-                "score_h": shared["score"].size[1],
-                "wins_w": shared["wins"].size[0],
-                "wins_h": shared["wins"].size[1],
-                "timer_w": shared["timer"].size[0],
-                "timer_h": shared["timer"].size[1],
-                "piece": current_piece,
-                "prediction": pred
-            }
-        )
+        # Draw stats (combo, B2B)
+        if is_feature_enabled("combo_indicators_enabled") or is_feature_enabled("b2b_indicators_enabled"):
+            overlay_renderer.draw_stats(overlay_renderer.screen)
+        
+        # Draw performance info (FPS)
+        if is_feature_enabled("performance_monitor_enabled"):
+            overlay_renderer.draw_performance(overlay_renderer.screen)
         
-        FRAME_COUNTER += 1
+        # Only regions that changed since the last frame (nothing if unchanged)
+        overlay_renderer.present()
+
+    # Record statistics (one row per lock / clear, not per frame)
+    if board_event is not None and is_feature_enabled("statistics_enabled"):
+        latency_ms = (time.perf_counter() - state["start_ts"]) * 1000
+        record_event(
+            frame=FRAME_COUNTER,
+            piece=pred.get("piece", current_piece),
+            orientation=pred.get("target_rot", 0),
+            lines_cleared=board_event.lines_cleared,
+            combo=pred.get("combo", 0),
+            b2b=pred.get("is_b2b", False),
+            tspin=pred.get("is_tspin", False),
+            latency_ms=latency_ms
+        )
+    
+    FRAME_COUNTER += 1
+
+    sizes = state["shared_sizes"]
+    score_w, score_h = sizes["score"]
+    wins_w, wins_h = sizes["wins"]
+    timer_w, timer_h = sizes["timer"]
+    LOGGER.info(
+        {
+            "ts": datetime.datetime.utcnow().isoformat(),
+            "frame_id": FRAME_COUNTER,
+            "score_w": score_w,
+            "score_h": score_h,
+            "wins_w": wins_w,
+            "wins_h": wins_h,
+            "timer_w": timer_w,
+            "timer_h": timer_h,
+            "piece": current_piece,
+            "prediction": pred
+        }
+    )
+    
+    FRAME_COUNTER += 1
+
+
+def _log_periodic_stats():
+    """Log performance, scheduler/pipeline and cache stats every 100 frames."""
+    if performance_monitor.frame_count % 100 == 0:
+        LOGGER.info({"performance": performance_monitor.get_stats()})
+        if OVERLAY_PIPELINE is not None and OVERLAY_PIPELINE.running:
+            LOGGER.info({"pipeline": OVERLAY_PIPELINE.stats()})
+        else:
+            LOGGER.info({"scheduler": FRAME_SCHEDULER.stats()})
+        cache_stats = getattr(prediction_agent, "cache_stats", None)
+        if cache_stats is not None:
+            LOGGER.info({"prediction_cache": cache_stats()})
+        LOGGER.info({"stats_writer": writer_stats()})
+        backend_stats = getattr(prediction_agent, "stats", None)
+        if backend_stats is not None:
+            LOGGER.info({"prediction_backend": backend_stats()})
+        LOGGER.info({"telemetry": telemetry_stats()})
+
+
+def process_frames():
+    """Process a single frame of the overlay (all stages, serially)."""
+    performance_monitor.start_frame()
+    start_ts = time.perf_counter()
+    
+    try:
+        try:
+            captured = _next_capture()
+        except Exception as e:
+            # Rebuild the capture next tick (monitor change, stale handle, ...);
+            # a capture-thread timeout only means no new frame yet
+            if not isinstance(e, TimeoutError):
+                CAPTURE_SESSION.invalidate()
+            # Handle screen capture errors gracefully
+            if not error_handler.handle_critical_error(e, "Screen Capture"):
+                raise  # Re-raise if user chose to exit
+            
+            # Fallback: use dummy data
+            state = _fallback_state(start_ts)
+            error_handler.handle_warning("Using fallback data due to capture error", "Frame Processing")
+        else:
+            # Extraction / ROI-config errors are not capture failures: the
+            # session stays and the frame is reported below
+            state = _extract_stage(captured)
+
+        _render_stage(_predict_stage(state))
         
     except Exception as e:
         LOGGER.error(f"Error in frame {FRAME_COUNTER}: {e}")
@@ -293,23 +539,66 @@ def process_frames():
         if frame_time > 0.050:  # 50ms threshold
             LOGGER.warning(f"Slow frame: {frame_time*1000:.1f}ms")
         
-        # Log performance stats every 100 frames
+        _log_periodic_stats()
+
+
+def _process_frames_safely():
+    try:
+        process_frames()
+    except Exception as exc:  # never let the thread crash
+        logging.error("Frame error: %s", exc, exc_info=True)
+
+
+def _on_frame_period_change(period):
+    """Don't capture faster than the analysis loop can consume."""
+    CAPTURE_THREAD.min_interval = max(1.0 / APP_CONFIG.dxgi_target_fps, period)
+
+
+FRAME_SCHEDULER = FrameScheduler(
+    target_fps=APP_CONFIG.target_fps,
+    min_fps=min(10, APP_CONFIG.target_fps),
+    on_period_change=_on_frame_period_change,
+)
 
 
 def _frame_worker():
-    """Runs process_frames in a loop, respects target FPS."""
-    target_fps = 30
-    frame_time = 1.0 / target_fps
-    while True:
-        start = time.time()
-        try:
-            process_frames()
-        except Exception as exc:  # never let the thread crash
-            logging.error("Frame error: %s", exc, exc_info=True)
-        # sleep to keep ~30 FPS
-        elapsed = time.time() - start
-        sleep = max(0.0, frame_time - elapsed)
-        time.sleep(sleep)
+    """Runs process_frames on FRAME_SCHEDULER's deadline grid (AppConfig.target_fps)."""
+    FRAME_SCHEDULER.run(_process_frames_safely)
+
+
+def _capture_source():
+    """Pipeline source: the next CapturedFrame, or None if none arrived in time."""
+    try:
+        return _next_capture()
+    except TimeoutError:
+        return None
+    except Exception:
+        CAPTURE_SESSION.invalidate()
+        raise
+
+
+def _render_sink(state):
+    """Pipeline sink: render, then account the frame's capture-to-render latency."""
+    try:
+        _render_stage(state)
+    finally:
+        performance_monitor.record_frame_time(time.perf_counter() - state["start_ts"])
+        _log_periodic_stats()
+
+
+def build_overlay_pipeline():
+    """Capture -> extract -> predict -> render, one thread per stage.
+
+    Only the capture queue drops (oldest first, releasing the pooled buffer);
+    later queues apply back-pressure so no lock / clear event is lost between
+    prediction and statistics.
+    """
+    pipeline = Pipeline("overlay")
+    pipeline.stage("capture", _capture_source, policy=DROP_OLDEST, on_drop=lambda frame: frame.release())
+    pipeline.stage("extract", _extract_stage, policy=BLOCK)
+    pipeline.stage("predict", _predict_stage, policy=BLOCK)
+    pipeline.stage("render", _render_sink)
+    return pipeline
 
 
 if __name__ == "__main__":
@@ -317,10 +606,22 @@ if __name__ == "__main__":
     _register_dynamic_hotkeys()
     
     # Start stats tracking for the current run
+    init_db()
     start_new_match(CURRENT_SETTINGS.prediction_agent)
+
+    # Before any capture or frame thread, so the frame loop never waits for a
+    # worker to spawn
+    _start_prediction_agents()
     
-    # Start frame processing thread
-    threading.Thread(target=_frame_worker, daemon=True).start()
+    # Capture on its own thread so grabs overlap with analysis
+    CAPTURE_THREAD.start()
+
+    if is_feature_enabled("staged_pipeline_enabled"):
+        # Each stage on its own thread, overlapping consecutive frames
+        OVERLAY_PIPELINE = build_overlay_pipeline().start()
+    else:
+        # Start frame processing thread
+        threading.Thread(target=_frame_worker, daemon=True).start()
     
     # Run the main overlay loop
     run_overlay()
@@ -0,0 +1,79 @@
+"""Compare the full-ROI threshold extractor with the cell-sampling extractor.
+
+Renders synthetic BGRA board ROIs (dark well, coloured and grey blocks with a
+little noise), then reports per-call time and cell accuracy for both.
+
+    python scripts/bench_board_extract.py --width 300 --height 600 --frames 200
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from board_sampler import sample_board, threshold_board  # noqa: E402
+
+COLOURS = [
+    (255, 255, 0),  # I – cyan (BGR)
+    (0, 255, 255),  # O – yellow
+    (255, 0, 160),  # T – purple
+    (0, 255, 0),  # S – green
+    (0, 0, 255),  # Z – red
+    (255, 0, 0),  # J – blue
+    (0, 128, 255),  # L – orange
+    (128, 128, 128),  # garbage
+]
+
+
+def render_board(truth, width, height, rng):
+    """Draw a 20×10 truth mask as a BGRA ROI of the given size."""
+    frame = np.full((height, width, 4), 20, dtype=np.uint8)
+    frame[..., 3] = 255
+    cell_h, cell_w = height / 20, width / 10
+    for r, c in zip(*np.nonzero(truth)):
+        y0, y1 = int(r * cell_h) + 1, int((r + 1) * cell_h) - 1
+        x0, x1 = int(c * cell_w) + 1, int((c + 1) * cell_w) - 1
+        frame[y0:y1, x0:x1, :3] = COLOURS[rng.integers(len(COLOURS))]
+    noise = rng.integers(-12, 13, size=frame.shape[:2] + (3,))
+    frame[..., :3] = np.clip(frame[..., :3].astype(np.int16) + noise, 0, 255)
+    return frame
+
+
+def random_truth(rng):
+    truth = np.zeros((20, 10), dtype=bool)
+    for col in range(10):
+        truth[20 - rng.integers(0, 14):, col] = True
+    truth &= rng.random((20, 10)) > 0.1
+    return truth
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=300)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    truths = [random_truth(rng) for _ in range(args.frames)]
+    frames = [render_board(t, args.width, args.height, rng) for t in truths]
+
+    for name, extract in (("threshold", threshold_board), ("sampling", sample_board)):
+        extract(frames[0])  # warm caches
+        seconds = min(
+            timeit.repeat(lambda: [extract(f) for f in frames], number=1, repeat=3)
+        )
+        correct = sum(np.count_nonzero((extract(f) > 0) == t) for f, t in zip(frames, truths))
+        print(
+            f"{name:>10}: {seconds / len(frames) * 1e6:8.1f} µs/frame, "
+            f"cell accuracy {correct / (200 * len(frames)):.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
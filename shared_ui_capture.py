@@ -8,7 +8,8 @@ from typing import Any, Dict
 import mss  # type: ignore
 
 from capture import ScreenCapture
-from roi_capture import load_roi_config
+from frame_bus import BusFrame
+from roi_capture import roi_config
 
 log = logging.getLogger(__name__)
 
@@ -27,34 +28,36 @@ def _get_full_capture() -> ScreenCapture:
     if _FULL_CAPTURE is None:
         rect = _full_rect()
         log.debug("Initializing full-screen capture for shared UI: %s", rect)
-        _FULL_CAPTURE = ScreenCapture(rect)
+        _FULL_CAPTURE = ScreenCapture(rect, mode="bgra")
     return _FULL_CAPTURE
 
 
-def _grab_full_frame():
-    return _get_full_capture().grab()
+def _grab_full_frame() -> BusFrame:
+    capture = _get_full_capture()
+    # zero-copy BGRA view; crops stay numpy views in screen coordinates
+    return BusFrame(capture.grab(), (capture.region["left"], capture.region["top"]))
 
 
-def _crop(image, rect: list[int]):
+def _crop(image, rect):
     left, top, width, height = rect
     return image.crop((left, top, left + width, top + height))
 
 
 def capture_shared_ui(frame=None) -> Dict[str, Any]:
     """Capture score/wins/timer once per frame and return them in a dict."""
-    rois = {entry["name"]: entry.get("rect") for entry in load_roi_config()}
-    missing = [name for name in _SHARED_NAMES if name not in rois]
+    config = roi_config()
+    missing = [name for name in _SHARED_NAMES if name not in config.rects and name not in config.invalid]
     if missing:
         raise KeyError(f"Shared ROI(s) missing from config: {missing}")
+    malformed = [name for name in _SHARED_NAMES if name in config.invalid]
+    if malformed:
+        raise ValueError(f"ROI(s) {malformed} must be a [left, top, width, height] list")
 
     frame = frame or _grab_full_frame()
     result: Dict[str, Any] = {}
     for name in _SHARED_NAMES:
-        rect = rois[name]
-        if not isinstance(rect, list) or len(rect) != 4:
-            raise ValueError(f"ROI '{name}' must be a [left, top, width, height] list")
         try:
-            result[name] = _crop(frame, [int(v) for v in rect])
+            result[name] = _crop(frame, config.rects[name])
         except Exception as exc:  # pragma: no cover
             log.error("Failed to capture %s: %s", name, exc)
     return result
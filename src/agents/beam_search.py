@@ -0,0 +1,80 @@
+"""Next-queue lookahead beam search for the Dellacherie agent."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import time
+from typing import List, Optional, Sequence
+
+from .prediction_agent_dellacherie import Placement, PredictionAgent, next_state
+
+log = logging.getLogger(__name__)
+
+
+class BeamSearch:
+    """Search the current piece plus queued pieces, keeping ``beam_width`` nodes per level.
+
+    A node is ranked by the line/bonus rewards collected along its path plus
+    the shape score of its board.  Shape scores come from the agent's
+    ``eval_cache``, so boards reached through different move orders (or on
+    earlier frames) are evaluated once.
+    """
+
+    def __init__(self, agent: PredictionAgent, beam_width: int = 6, depth: int = 2):
+        self.agent = agent
+        self.beam_width = beam_width
+        self.depth = depth
+        self.last_depth = 0  # deepest level fully searched by the last run()
+
+    def run(
+        self,
+        board: tuple,
+        pieces: Sequence[str],
+        state: tuple,
+        deadline: Optional[float] = None,
+    ) -> Placement:
+        """Return the first placement of the best line found before ``deadline``.
+
+        ``pieces[0]`` is the current piece; up to ``depth`` further pieces are
+        searched.  The first level always completes so there is a move to
+        return; deeper levels stop as soon as ``time.perf_counter()`` passes
+        ``deadline`` and the last completed level decides.
+        """
+        agent = self.agent
+
+        # level 0 – (value, reward, board, state, first placement)
+        beam: List[tuple] = []
+        for move in agent.placements(board, pieces[0], state):
+            reward = move.score - move.shape
+            child_state = next_state(state, move.lines_cleared, move.is_tspin)
+            beam.append((move.score, reward, move.board, child_state, move))
+        beam = heapq.nlargest(self.beam_width, beam, key=lambda node: node[0])
+        self.last_depth = 0
+
+        for level, piece in enumerate(pieces[1 : self.depth + 1], start=1):
+            children: dict = {}
+            timed_out = False
+            for _, reward, node_board, node_state, first in beam:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    timed_out = True
+                    break
+                for move in agent.placements(node_board, piece, node_state):
+                    child_reward = reward + move.score - move.shape
+                    value = child_reward + move.shape
+                    child_state = next_state(node_state, move.lines_cleared, move.is_tspin)
+                    # converging branches: keep only the best path to each position
+                    key = (move.board, child_state)
+                    known = children.get(key)
+                    if known is None or value > known[0]:
+                        children[key] = (value, child_reward, move.board, child_state, first)
+            if timed_out or not children:
+                log.debug("Beam search stopped at level %d (deadline)", level)
+                break
+            beam = heapq.nlargest(self.beam_width, children.values(), key=lambda node: node[0])
+            self.last_depth = level
+
+        return beam[0][4]
+
+
+__all__ = ["BeamSearch"]
@@ -0,0 +1,216 @@
+"""Bitboard placement engine for the heuristic prediction agents.
+
+The 20×10 board is stored as a tuple of twenty 10-bit row integers (row 0 is
+the top of the well, bit ``x`` is column ``x``).  Drop, lock and line-clear
+are plain integer operations, so a placement costs a few microseconds instead
+of a numpy copy plus nested Python loops.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+BOARD_ROWS = 20
+BOARD_COLS = 10
+FULL_ROW = (1 << BOARD_COLS) - 1
+
+Rows = Tuple[int, ...]
+
+_COL_WEIGHTS = 1 << np.arange(BOARD_COLS, dtype=np.int64)
+_COL_SHIFTS = np.arange(BOARD_COLS, dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class PieceMask:
+    """One piece rotation as ``(dy, row_bits)`` pairs anchored at column 0.
+
+    ``bottom`` holds ``(dx, lowest dy)`` for each column the piece occupies,
+    which is all a hard drop needs to know about the shape.
+    """
+
+    rows: Tuple[Tuple[int, int], ...]
+    width: int
+    height: int
+    bottom: Tuple[Tuple[int, int], ...]
+
+
+def piece_mask(shape: Iterable[Tuple[int, int]]) -> PieceMask:
+    """Build a :class:`PieceMask` from a list of ``(x, y)`` cells."""
+    cells = list(shape)
+    by_row: dict[int, int] = {}
+    for x, y in cells:
+        by_row[y] = by_row.get(y, 0) | (1 << x)
+    width = max(x for x, _ in cells) + 1
+    height = max(y for _, y in cells) + 1
+    bottom = tuple(
+        (dx, max(y for x, y in cells if x == dx)) for dx in sorted({x for x, _ in cells})
+    )
+    return PieceMask(tuple(sorted(by_row.items())), width, height, bottom)
+
+
+def from_array(board) -> Rows:
+    """Pack a 20×10 board (0 = empty, non-zero = block) into row integers."""
+    occupied = np.asarray(board) > 0
+    return tuple((occupied.astype(np.int64) @ _COL_WEIGHTS).tolist())
+
+
+def to_array(rows: Sequence[int]) -> np.ndarray:
+    """Unpack row integers into the 20×10 uint8 0/255 matrix used elsewhere."""
+    bits = (np.asarray(rows, dtype=np.int64)[:, None] >> _COL_SHIFTS) & 1
+    return (bits * 255).astype(np.uint8)
+
+
+def pack(rows: Sequence[int]) -> int:
+    """Pack all rows into one 200-bit integer – a compact, hashable cache key."""
+    key = 0
+    for row in rows:
+        key = (key << BOARD_COLS) | row
+    return key
+
+
+def is_occupied(rows: Sequence[int], x: int, y: int) -> bool:
+    return 0 <= x < BOARD_COLS and 0 <= y < BOARD_ROWS and bool(rows[y] >> x & 1)
+
+
+def drop_row(rows: Sequence[int], piece: PieceMask, col: int) -> int:
+    """Return the landing row of the piece's top edge for a hard drop at ``col``.
+
+    The piece enters fully above the well; cells in negative rows never
+    collide, so a negative result means the placement tops out.
+    """
+    cells = [(dy, bits << col) for dy, bits in piece.rows]
+    y = -piece.height
+    while True:
+        below = y + 1
+        for dy, bits in cells:
+            r = below + dy
+            if r >= BOARD_ROWS or (r >= 0 and rows[r] & bits):
+                return y
+        y = below
+
+
+def column_tops(rows: Sequence[int]) -> List[int]:
+    """Return the first occupied row per column (``BOARD_ROWS`` when empty)."""
+    tops = [BOARD_ROWS] * BOARD_COLS
+    seen = 0
+    for r, row in enumerate(rows):
+        new = row & ~seen
+        while new:
+            low = new & -new
+            tops[low.bit_length() - 1] = r
+            new ^= low
+        seen |= row
+        if seen == FULL_ROW:
+            break
+    return tops
+
+
+def landing_row(tops: Sequence[int], piece: PieceMask, col: int) -> int:
+    """Same result as :func:`drop_row`, read from column tops and the bottom profile."""
+    return min(tops[col + dx] - 1 - dy for dx, dy in piece.bottom)
+
+
+def lock(rows: Sequence[int], piece: PieceMask, col: int, y: int) -> List[int]:
+    """Return a new row list with the piece locked at ``(col, y)``."""
+    board = list(rows)
+    for dy, bits in piece.rows:
+        r = y + dy
+        if r >= 0:  # cells above the well are lost (top-out)
+            board[r] |= bits << col
+    return board
+
+
+def clear_lines(rows: Sequence[int]) -> Tuple[Rows, int]:
+    """Remove full rows, shifting everything above down; return (rows, cleared)."""
+    kept = [row for row in rows if row != FULL_ROW]
+    cleared = BOARD_ROWS - len(kept)
+    if cleared:
+        kept = [0] * cleared + kept
+    return tuple(kept), cleared
+
+
+def board_metrics(rows: Sequence[int]) -> Tuple[int, int, int, int]:
+    """Return (aggregate height, holes, bumpiness, deepest well)."""
+    heights = [0] * BOARD_COLS
+    seen = 0
+    holes = 0
+    for r, row in enumerate(rows):
+        new = row & ~seen
+        if new:
+            h = BOARD_ROWS - r
+            while new:
+                low = new & -new
+                heights[low.bit_length() - 1] = h
+                new ^= low
+            seen |= row
+        holes += (seen & ~row).bit_count()
+
+    bumpiness = sum(abs(heights[i] - heights[i + 1]) for i in range(BOARD_COLS - 1))
+
+    well = 0
+    for i, h in enumerate(heights):
+        left = heights[i - 1] if i > 0 else BOARD_ROWS
+        right = heights[i + 1] if i < BOARD_COLS - 1 else BOARD_ROWS
+        if h < left and h < right:
+            well = max(well, min(left, right) - h)
+
+    return sum(heights), holes, bumpiness, well
+
+
+def stack(boards: Sequence[Sequence[int]]) -> np.ndarray:
+    """Unpack K row-integer boards into one K×20×10 boolean occupancy array."""
+    rows = np.asarray(boards, dtype=np.int64).reshape(-1, BOARD_ROWS)
+    return ((rows[:, :, None] >> _COL_SHIFTS) & 1).astype(bool)
+
+
+def batch_metrics(boards) -> np.ndarray:
+    """Board metrics for a K×20×10 stack at once; returns a K×4 int array.
+
+    Columns match :func:`board_metrics`: aggregate height, holes, bumpiness
+    and deepest well.  Any non-zero cell counts as a block.
+    """
+    occupied = np.asarray(boards) > 0
+    if occupied.ndim == 2:
+        occupied = occupied[None]
+
+    # first occupied row per column; argmax is 0 for empty columns, so mask them
+    has_block = occupied.any(axis=1)
+    heights = np.where(has_block, BOARD_ROWS - occupied.argmax(axis=1), 0)
+
+    # a hole is an empty cell with any block above it in the same column
+    covered = np.logical_or.accumulate(occupied, axis=1)
+    holes = np.count_nonzero(covered & ~occupied, axis=(1, 2))
+
+    bumpiness = np.abs(np.diff(heights, axis=1)).sum(axis=1)
+
+    # walls count as full-height neighbours
+    padded = np.pad(heights, ((0, 0), (1, 1)), constant_values=BOARD_ROWS)
+    left, right = padded[:, :-2], padded[:, 2:]
+    depth = np.minimum(left, right) - heights
+    well = np.where((heights < left) & (heights < right), depth, 0).max(axis=1)
+
+    return np.stack([heights.sum(axis=1), holes, bumpiness, well], axis=1)
+
+
+__all__ = [
+    "BOARD_COLS",
+    "BOARD_ROWS",
+    "FULL_ROW",
+    "PieceMask",
+    "batch_metrics",
+    "board_metrics",
+    "clear_lines",
+    "column_tops",
+    "drop_row",
+    "from_array",
+    "is_occupied",
+    "landing_row",
+    "lock",
+    "pack",
+    "piece_mask",
+    "stack",
+    "to_array",
+]
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import logging
-import queue
-import threading
 from typing import Optional
 
 import cv2
 import numpy as np
 
+from ..pipeline import DROP_OLDEST, BoundedQueue, Pipeline
 from .base_agent import BaseAgent
 from .capture_agent import CaptureAgent
 
@@ -29,43 +28,32 @@ class BoardProcessorAgent(BaseAgent):
         self.capture_agent = capture_agent
         self.board_width = board_width
         self.board_height = board_height
-        self.mask_queue: queue.Queue[np.ndarray] = queue.Queue(maxsize=queue_maxsize)
-        self._stop_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
-
-    def _process_loop(self) -> None:
-        log.info("BoardProcessorAgent started.")
-        while not self._stop_event.is_set():
-            try:
-                frame = self.capture_agent.frame_queue.get(timeout=0.2)
-            except queue.Empty:
-                continue
-
-            mask = self._create_mask(frame)
-            try:
-                self.mask_queue.put(mask, timeout=0.1)
-            except queue.Full:
-                try:
-                    _ = self.mask_queue.get_nowait()
-                    self.mask_queue.put_nowait(mask)
-                except queue.Empty:
-                    pass
-
-        log.info("BoardProcessorAgent stopped.")
+        self.mask_queue = BoundedQueue(queue_maxsize, DROP_OLDEST)
+        self._pipeline: Optional[Pipeline] = None
 
     def start(self) -> None:
         self.capture_agent.start()
-        if self._thread and self._thread.is_alive():
+        if self._pipeline and self._pipeline.running:
             log.debug("BoardProcessorAgent already running.")
             return
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._process_loop, daemon=True)
-        self._thread.start()
+        if self.capture_agent.frame_queue is None:
+            log.warning("CaptureAgent has no frame queue – BoardProcessorAgent idle.")
+            return
+        self._pipeline = Pipeline("board_processor")
+        self._pipeline.stage(
+            "board_processor",
+            self._create_mask,
+            inbox=self.capture_agent.frame_queue,
+            outbox=self.mask_queue,
+        )
+        self._pipeline.start()
 
     def stop(self) -> None:
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join()
+        if self._pipeline:
+            self._pipeline.stop()
+
+    def stats(self) -> dict:
+        return self._pipeline.stats() if self._pipeline else {}
 
     def handle(self, params: Optional[dict] = None) -> None:
         self.capture_agent.start()
@@ -0,0 +1,96 @@
+"""LRU-bounded transposition table for board evaluations and move searches."""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+# Rough per-entry cost of an OrderedDict slot (hash table entry + linked-list node)
+_ENTRY_OVERHEAD = 100
+
+
+class EvalCache:
+    """Least-recently-used cache with hit-rate and memory accounting.
+
+    Keys should be compact (see :func:`bitboard.pack`) – the cache is meant
+    to live for a whole session, so its footprint is tracked per entry.
+    """
+
+    def __init__(self, max_entries: int = 65536):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it recently used) or ``default``."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or refresh ``key``, evicting the least recently used entry when full."""
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._bytes -= self._entry_size(key, old)
+        self._data[key] = value
+        self._bytes += self._entry_size(key, value)
+        while len(self._data) > self.max_entries:
+            old_key, old_value = self._data.popitem(last=False)
+            self._bytes -= self._entry_size(old_key, old_value)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters, so stats describe the new contents."""
+        self._data.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by keys, values and table slots."""
+        return self._bytes
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "memory_bytes": self._bytes,
+        }
+
+    @staticmethod
+    def _entry_size(key: Hashable, value: Any) -> int:
+        size = _ENTRY_OVERHEAD + sys.getsizeof(key) + sys.getsizeof(value)
+        if isinstance(key, tuple):
+            size += sum(sys.getsizeof(part) for part in key)
+        if isinstance(value, tuple):
+            size += sum(sys.getsizeof(part) for part in value)
+        return size
+
+
+__all__ = ["EvalCache"]
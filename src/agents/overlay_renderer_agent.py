@@ -13,6 +13,10 @@ from typing import List, Optional, Tuple
 import numpy as np
 import pygame
 
+from ..dirty_rects import DirtyRectRenderer
+from ..mask_renderer import MaskRenderer
+from ..pipeline import Pipeline
+from ..render_assets import RenderAssets
 from .base_agent import BaseAgent
 from .board_processor_agent import BoardProcessorAgent
 from .prediction_agent import PredictionAgent
@@ -27,6 +31,7 @@ _cfg = json.load(_CFG_PATH.open())
 _AUTO_FIT = _cfg.get("auto_fit", True)  # default to the new behaviour
 _BOARD_W = _cfg.get("board_width", 20)
 _BOARD_H = _cfg.get("board_height", 10)
+_RENDER_FPS = 30
 
 
 class OverlayRendererAgent(BaseAgent):
@@ -60,6 +65,11 @@ class OverlayRendererAgent(BaseAgent):
         self.board_processor: BoardProcessorAgent | None = None
         self.prediction_agent: PredictionAgent | None = None
         self.capture = CaptureAgent()
+        # SysFont lookups, markers and the mask surface are cached, not redone per frame
+        self._assets = RenderAssets()
+        self._mask = MaskRenderer((255, 255, 255, 120))
+        self._dirty = DirtyRectRenderer()
+        self._markers: dict = {}
 
         # ----------------------------------------------------------
         # 1️⃣ Grab the ROI size from the CaptureAgent (it is always set)
@@ -94,8 +104,9 @@ class OverlayRendererAgent(BaseAgent):
         pygame.display.set_caption("Tetris Ghost Overlay")
 
         self._stop_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
+        self._pipeline: Optional[Pipeline] = None
         self._initialized = False
+        self._last_mask = self._last_preds = None
 
     # -----------------------------------------------------------------
     # Public API used by HotkeyAgent
@@ -153,69 +164,72 @@ class OverlayRendererAgent(BaseAgent):
                 self._stop_upstream()
 
     def _start_render_loop(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if self._pipeline and self._pipeline.running:
             log.debug("OverlayRendererAgent already running.")
             return
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._render_loop, daemon=True)
-        self._thread.start()
+        self._dirty.invalidate()
+        self._last_mask = self._last_preds = None
+        log.info(
+            "OverlayRendererAgent rendering with auto_fit=%s, cell_px=%d",
+            _AUTO_FIT,
+            self.cell_px,
+        )
+        # sink of the capture -> board_processor -> prediction chain; it reads
+        # both upstream queues, so it runs paced at the frame rate, not per item
+        self._pipeline = Pipeline("overlay_renderer")
+        self._pipeline.stage("overlay_renderer", self._render_frame, interval=1.0 / _RENDER_FPS)
+        self._pipeline.start()
 
     def stop(self) -> None:
         self._stop_event.set()
-        if self._thread:
-            self._thread.join()
+        if self._pipeline:
+            self._pipeline.stop()
         if self._initialized:
             pygame.quit()
             self._initialized = False
-        self._thread = None
+        log.info("OverlayRendererAgent stopped.")
 
-    def _render_loop(self) -> None:
+    def stats(self) -> dict:
+        return self._pipeline.stats() if self._pipeline else {}
+
+    def _render_frame(self) -> None:
+        """Render stage: draw whatever mask / predictions arrived since the last frame."""
         if not self._initialized:
             pygame.init()
             self._initialized = True
 
-        clock = pygame.time.Clock()
-        log.info(
-            "OverlayRendererAgent rendering with auto_fit=%s, cell_px=%d",
-            _AUTO_FIT,
-            self.cell_px,
-        )
+        # Early‑out if the user hid the overlay.
+        if not self._visible:
+            return
 
-        while not self._stop_event.is_set():
-            # Early‑out if the user hid the overlay.
-            if not self._visible:
-                clock.tick(30)  # Default FPS when hidden
-                continue
-
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    self._stop_event.set()
-                elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
-                    self._stop_event.set()
-
-            try:
-                mask = self.board_processor.mask_queue.get_nowait()
-            except queue.Empty:
-                mask = None
-
-            try:
-                preds = self.prediction_agent.prediction_queue.get_nowait()
-            except queue.Empty:
-                preds = None
-
-            self.screen.fill((0, 0, 0, 0))
-            if mask is not None:
-                self._draw_mask(self.screen, mask)
-            if preds is not None:
-                self._draw_predictions(self.screen, preds)
-
-            pygame.display.flip()
-            clock.tick(30)
+        for ev in pygame.event.get():
+            if ev.type == pygame.QUIT or (ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE):
+                self._stop_event.set()
+                self._pipeline.request_stop()
+                return
 
-        if self._initialized:
-            pygame.quit()
-            self._initialized = False
-        log.info("OverlayRendererAgent stopped.")
+        # Keep showing the last mask / predictions until new ones arrive
+        changed = False
+        try:
+            self._last_mask = self.board_processor.mask_queue.get_nowait()
+            changed = True
+        except queue.Empty:
+            pass
+
+        try:
+            self._last_preds = self.prediction_agent.prediction_queue.get_nowait()
+            changed = True
+        except queue.Empty:
+            pass
+
+        if changed:
+            if self._last_mask is not None:
+                self._draw_mask(self.screen, self._last_mask)
+            if self._last_preds is not None:
+                self._draw_predictions(self.screen, self._last_preds)
+            # only cells / labels that differ from the last frame are redrawn
+            self._dirty.present(self.screen)
 
     def _wait_until(self, duration: Optional[float]) -> None:
         start = time.perf_counter()
@@ -234,25 +248,31 @@ class OverlayRendererAgent(BaseAgent):
                 capture.stop()
 
     def _draw_mask(self, surface: pygame.Surface, mask: np.ndarray) -> None:
-        rows, cols = mask.shape
-        cell_w = self.cell_px
-        cell_h = self.cell_px
-        for r in range(rows):
-            for c in range(cols):
-                if mask[r, c] == 255:
-                    rect = pygame.Rect(c * cell_w, r * cell_h, cell_w, cell_h)
-                    s = pygame.Surface((cell_w, cell_h), pygame.SRCALPHA)
-                    s.fill((255, 255, 255, 120))
-                    surface.blit(s, rect.topleft)
+        # one scaled surface for the whole board; the mask bytes tell the
+        # dirty-rect renderer whether it changed
+        overlay = self._mask.render(mask, self.cell_px)
+        self._dirty.blit("mask", overlay, (0, 0), token=mask.tobytes())
 
     def _draw_predictions(
         self, surface: pygame.Surface, preds: List[Tuple[int, int, str]]
     ) -> None:
-        font = pygame.font.SysFont("Arial", max(12, self.cell_px // 2))
+        font_size = max(12, self.cell_px // 2)
         for r, c, piece in preds:
             cx = c * self.cell_px + self.cell_px // 2
             cy = r * self.cell_px + self.cell_px // 2
             colour = tuple(((hash(piece) >> shift) & 0xFF) for shift in (0, 8, 16))
-            pygame.draw.circle(surface, colour, (cx, cy), self.cell_px // 3)
-            label = font.render(piece, True, (255, 255, 255))
-            surface.blit(label, label.get_rect(center=(cx, cy)))
+            marker = self._marker(colour)
+            self._dirty.blit(("marker", r, c), marker, marker.get_rect(center=(cx, cy)).topleft)
+            label = self._assets.text(piece, font_size, (255, 255, 255), name="Arial")
+            self._dirty.blit(("label", r, c), label, label.get_rect(center=(cx, cy)).topleft)
+
+    def _marker(self, colour) -> pygame.Surface:
+        """Prediction dot, cached per colour so unchanged markers stay clean."""
+        key = (self.cell_px, colour)
+        marker = self._markers.get(key)
+        if marker is None:
+            radius = self.cell_px // 3
+            marker = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(marker, colour, (radius, radius), radius)
+            self._markers[key] = marker
+        return marker
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import logging
-import queue
-import threading
 from typing import Optional, Tuple
 
 import numpy as np
 
+from ..pipeline import DROP_OLDEST, BoundedQueue, Pipeline
 from .base_agent import BaseAgent
 from .board_processor_agent import BoardProcessorAgent
 
@@ -20,48 +19,33 @@ class PredictionAgent(BaseAgent):
 
     def __init__(self, board_processor: BoardProcessorAgent, queue_maxsize: int = 5):
         self.board_processor = board_processor
-        self.prediction_queue: queue.Queue[list[Tuple[int, int, str]]] = queue.Queue(
-            maxsize=queue_maxsize
-        )
-        self._stop_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
+        self.prediction_queue = BoundedQueue(queue_maxsize, DROP_OLDEST)
+        self._pipeline: Optional[Pipeline] = None
 
     def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if self._pipeline and self._pipeline.running:
             log.debug("PredictionAgent already running.")
             return
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._pipeline = Pipeline("prediction")
+        self._pipeline.stage(
+            "prediction",
+            self._fake_predict,
+            inbox=self.board_processor.mask_queue,
+            outbox=self.prediction_queue,
+        )
+        self._pipeline.start()
 
     def stop(self) -> None:
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join()
+        if self._pipeline:
+            self._pipeline.stop()
+
+    def stats(self) -> dict:
+        return self._pipeline.stats() if self._pipeline else {}
 
     def handle(self, params: Optional[dict] = None) -> None:
         self.board_processor.start()
         self.start()
 
-    def _run(self) -> None:
-        log.info("PredictionAgent started.")
-        while not self._stop_event.is_set():
-            try:
-                mask = self.board_processor.mask_queue.get(timeout=0.2)
-            except queue.Empty:
-                continue
-
-            preds = self._fake_predict(mask)
-            try:
-                self.prediction_queue.put(preds, timeout=0.1)
-            except queue.Full:
-                try:
-                    _ = self.prediction_queue.get_nowait()
-                    self.prediction_queue.put_nowait(preds)
-                except queue.Empty:
-                    pass
-        log.info("PredictionAgent stopped.")
-
     def _fake_predict(self, mask: np.ndarray) -> list[Tuple[int, int, str]]:
         import random
 
@@ -1,12 +1,19 @@
 # ---- prediction_agent_dellacherie.py ---------------------------------
+import time
+from typing import NamedTuple
+
 import numpy as np
+
+from . import bitboard
 from .base_agent import BaseAgent
+from .eval_cache import EvalCache
 
 # ----------------------------------------------------------------------
 # Helper: generate all legal placements for a given piece & orientation
 # ----------------------------------------------------------------------
 PIECE_SHAPES = {
-    # Each piece: list of rotations; each rotation is a list of (x,y) cells
+    # Each piece: list of rotations; each rotation is a list of (x,y) cells,
+    # anchored at x = 0 so target_col is the leftmost occupied column
     "I": [
         [(0, 0), (1, 0), (2, 0), (3, 0)],
         [(0, 0), (0, 1), (0, 2), (0, 3)],
@@ -30,18 +37,52 @@ PIECE_SHAPES = {
     ],
     "J": [
         [(0, 0), (0, 1), (1, 1), (2, 1)],
-        [(1, 0), (2, 0), (1, 1), (1, 2)],
+        [(0, 0), (1, 0), (0, 1), (0, 2)],
         [(0, 0), (1, 0), (2, 0), (2, 1)],
         [(1, 0), (1, 1), (0, 2), (1, 2)],
     ],
     "L": [
         [(2, 0), (0, 1), (1, 1), (2, 1)],
-        [(1, 0), (1, 1), (1, 2), (2, 2)],
+        [(0, 0), (0, 1), (0, 2), (1, 2)],
         [(0, 0), (1, 0), (2, 0), (0, 1)],
         [(0, 0), (1, 0), (1, 1), (1, 2)],
     ],
 }
 
+# Bit masks for every rotation, built once at import
+PIECE_MASKS = {
+    piece: [bitboard.piece_mask(shape) for shape in rotations]
+    for piece, rotations in PIECE_SHAPES.items()
+}
+
+
+def _unique_rotations(rotations):
+    """Indices of rotations whose normalised cell sets are distinct."""
+    seen = set()
+    unique = []
+    for rot, shape in enumerate(rotations):
+        min_x = min(x for x, _ in shape)
+        min_y = min(y for _, y in shape)
+        key = frozenset((x - min_x, y - min_y) for x, y in shape)
+        if key not in seen:
+            seen.add(key)
+            unique.append(rot)
+    return unique
+
+
+# Every (col, rot, mask) a piece can be hard-dropped at, built once at import
+PLACEMENTS = {
+    piece: tuple(
+        (col, rot, PIECE_MASKS[piece][rot])
+        for rot in _unique_rotations(rotations)
+        for col in range(bitboard.BOARD_COLS - PIECE_MASKS[piece][rot].width + 1)
+    )
+    for piece, rotations in PIECE_SHAPES.items()
+}
+
+# A full search for one piece must finish inside this budget (see tests)
+SEARCH_BUDGET_US = 1500
+
 # ----------------------------------------------------------------------
 # Scoring terms (weights tuned for Tetris Effect style play)
 # ----------------------------------------------------------------------
@@ -54,6 +95,53 @@ W_TSPIN = 1.0  # bonus for a successful T‑Spin
 W_B2B = 0.8  # back‑to‑back bonus (T‑Spin or Tetris)
 W_COMBO = 0.3  # incremental combo reward
 
+# Same order as bitboard.batch_metrics columns
+_SHAPE_WEIGHTS = np.array([W_HEIGHT, W_HOLES, W_BUMPINESS, W_WELL_DEPTH])
+
+
+def special_bonus(state, lines_cleared, is_tspin):
+    """T‑Spin / B2B / combo bonus for a placement; returns (bonus, is_b2b).
+
+    ``state`` is ``(prev_clear, prev_was_tspin, combo)`` before the placement.
+    """
+    prev_clear, prev_was_tspin, combo = state
+    bonus = 0.0
+    is_b2b = False
+    if is_tspin:
+        bonus += W_TSPIN
+        # B2B is granted when this T‑Spin follows another T‑Spin or a Tetris
+        if prev_was_tspin or prev_clear == 4:
+            bonus += W_B2B
+            is_b2b = True
+    elif lines_cleared == 4 and prev_clear == 4:
+        # regular line clear – B2B for back-to-back Tetrises
+        bonus += W_B2B
+        is_b2b = True
+
+    # combo: every successive line‑clear adds a small bump
+    if lines_cleared > 0:
+        bonus += W_COMBO * (combo + 1)
+    return bonus, is_b2b
+
+
+def next_state(state, lines_cleared, is_tspin):
+    """Return the ``(prev_clear, prev_was_tspin, combo)`` after a placement."""
+    combo = state[2] + 1 if lines_cleared > 0 else 0
+    return lines_cleared, bool(is_tspin), combo
+
+
+class Placement(NamedTuple):
+    """One scored candidate; ``score - shape`` is the line/bonus reward."""
+
+    score: float
+    shape: float
+    col: int
+    rot: int
+    board: tuple
+    lines_cleared: int
+    is_tspin: bool
+    is_b2b: bool
+
 
 class PredictionAgent(BaseAgent):
     """
@@ -61,17 +149,38 @@ class PredictionAgent(BaseAgent):
     Input params (dict):
         board          – 20×10 uint8 binary matrix (0 = empty, 255 = block)
         piece          – one‑character string: I,O,T,S,Z,J,L
-        orientation    – 0‑3 (index into PIECE_SHAPES[piece])
+        orientation    – ignored; every rotation in PIECE_SHAPES[piece] is searched
         hold           – optional held piece (unused here, kept for future extensions)
+        queue          – optional upcoming pieces; enables the beam-search lookahead
+        deadline_ms    – optional per-call lookahead budget (defaults to the agent's)
     Returns dict:
-        target_col, target_rot, is_tspin, is_b2b, combo (int)
+        target_col, target_rot, target_row (landing row of the piece's top
+        edge, 0 = top of the well), is_tspin, is_b2b, combo (int)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        lookahead_depth=2,
+        beam_width=6,
+        deadline_ms=12.0,
+        eval_cache_size=65536,
+        move_cache_size=4096,
+    ):
         self.prev_clear = 0  # lines cleared in previous move (for B2B)
         self.prev_was_tspin = False  # for B2B chain detection
         self.combo = 0  # ongoing combo counter
 
+        # Transposition tables: shape score per board, best move per position
+        self.eval_cache = EvalCache(eval_cache_size)
+        self.move_cache = EvalCache(move_cache_size)
+
+        # Lookahead over the next queue (0 disables it)
+        self.lookahead_depth = lookahead_depth
+        self.deadline_ms = deadline_ms
+        from .beam_search import BeamSearch
+
+        self._beam = BeamSearch(self, beam_width=beam_width, depth=lookahead_depth)
+
     def start(self):
         """No-op for compatibility with existing orchestrator."""
         pass
@@ -80,118 +189,114 @@ class PredictionAgent(BaseAgent):
         """No-op for compatibility with existing orchestrator."""
         pass
 
+    @property
+    def state(self):
+        return self.prev_clear, self.prev_was_tspin, self.combo
+
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
     def handle(self, params):
-        board = params["board"]
+        board = bitboard.from_array(params["board"])
         piece = params["piece"]
-        orient = params["orientation"]
         hold = params.get("hold")  # not used now
+        queue = tuple(params.get("queue") or ())[: self.lookahead_depth]
 
-        best = None
-        best_score = -float("inf")
-        best_is_tspin = False
-        best_is_b2b = False
-
-        # --------------------------------------------------------------
-        # iterate every legal column for this rotation
-        # --------------------------------------------------------------
-        shape = PIECE_SHAPES[piece][orient]
-        max_x = max(x for x, _ in shape)
-        for col in range(10 - max_x):
-            # simulate dropping the piece
-            landed_board, lines_cleared, is_tspin = self._drop_piece(
-                board, shape, col, piece
-            )
-
-            # ----------------------------------------------------------------
-            # evaluate the resulting board
-            # ----------------------------------------------------------------
-            agg_h, holes, bumpiness, well = self._board_metrics(landed_board)
-            score = (
-                W_HEIGHT * agg_h
-                + W_LINES * lines_cleared
-                + W_HOLES * holes
-                + W_BUMPINESS * bumpiness
-                + W_WELL_DEPTH * well
-            )
-
-            # ---- T‑Spin / B2B / Combo bonuses ----
-            if is_tspin:
-                score += W_TSPIN
-                # B2B is granted when this T‑Spin follows another T‑Spin or a Tetris
-                if self.prev_was_tspin or self.prev_clear == 4:
-                    score += W_B2B
-                    best_is_b2b = True
-                self.prev_was_tspin = True
-                self.prev_clear = lines_cleared
+        # unchanged frames and repeated positions reuse the previous answer
+        key = (bitboard.pack(board), piece, self.state, queue)
+        move = self.move_cache.get(key)
+        if move is None:
+            if queue:
+                deadline_ms = params.get("deadline_ms", self.deadline_ms)
+                deadline = time.perf_counter() + deadline_ms / 1000.0
+                move = self._beam.run(board, [piece, *queue], self.state, deadline)
             else:
-                # regular line clear – check B2B for Tetris (4 lines)
-                if lines_cleared == 4:
-                    if self.prev_clear == 4:
-                        score += W_B2B
-                        best_is_b2b = True
-                    self.prev_was_tspin = False
-                else:
-                    self.prev_was_tspin = False
-                self.prev_clear = lines_cleared
-
-            # combo: every successive line‑clear adds a small bump
-            if lines_cleared > 0:
-                self.combo += 1
-                score += W_COMBO * self.combo
-            else:
-                self.combo = 0
+                move = self.search(board, piece, self.state)
+            self.move_cache.put(key, move)
 
-            if score > best_score:
-                best_score = score
-                best = (col, orient)
-                best_is_tspin = is_tspin
-                best_is_b2b = best_is_b2b
+        # only the chosen placement advances the B2B / combo chain
+        self.prev_clear, self.prev_was_tspin, self.combo = next_state(
+            self.state, move.lines_cleared, move.is_tspin
+        )
 
         # --------------------------------------------------------------------
         # Return the best move
         # --------------------------------------------------------------------
-        col, rot = best
         return {
-            "target_col": col,
-            "target_rot": rot,
-            "is_tspin": bool(best_is_tspin),
-            "is_b2b": bool(best_is_b2b),
+            "target_col": move.col,
+            "target_rot": move.rot,
+            "target_row": bitboard.drop_row(board, PIECE_MASKS[piece][move.rot], move.col),
+            "is_tspin": bool(move.is_tspin),
+            "is_b2b": bool(move.is_b2b),
             "combo": self.combo,
         }
 
+    # ------------------------------------------------------------------
+    # Exhaustive search over every unique rotation and column
+    # ------------------------------------------------------------------
+    def search(self, board, piece, state):
+        """Score every placement of ``piece`` on a bitboard; return the best."""
+        return max(self.placements(board, piece, state), key=lambda p: p.score)
+
+    def placements(self, board, piece, state):
+        """Return a :class:`Placement` for every (col, rot) of ``piece``.
+
+        Shape scores go through ``eval_cache``, so boards reached again – on
+        the next frame or by another lookahead branch – are not re-evaluated.
+        The remaining boards are scored together in one batched metrics call.
+        """
+        tops = bitboard.column_tops(board)
+        cache = self.eval_cache
+        landed = []
+        missing = {}
+        for col, rot, mask in PLACEMENTS[piece]:
+            landed_board, lines_cleared, is_tspin = self._drop_piece(
+                board, mask, col, piece, tops
+            )
+            key = bitboard.pack(landed_board)
+            shape = cache.get(key)
+            if shape is None:
+                missing.setdefault(key, landed_board)
+            landed.append((col, rot, landed_board, lines_cleared, is_tspin, key, shape))
+
+        if missing:
+            scores = self._shape_scores(list(missing.values()))
+            for key, shape in zip(missing, scores):
+                cache.put(key, shape)
+                missing[key] = shape
+
+        result = []
+        for col, rot, landed_board, lines_cleared, is_tspin, key, shape in landed:
+            if shape is None:
+                shape = missing[key]
+            bonus, is_b2b = special_bonus(state, lines_cleared, is_tspin)
+            score = shape + W_LINES * lines_cleared + bonus
+            result.append(
+                Placement(
+                    score, shape, col, rot, landed_board, lines_cleared, is_tspin, is_b2b
+                )
+            )
+        return result
+
+    def cache_stats(self):
+        """Hit rate / memory of both transposition tables (for telemetry)."""
+        return {"eval": self.eval_cache.stats(), "moves": self.move_cache.stats()}
+
+    def _shape_scores(self, boards):
+        """Shape scores for a list of bitboards from one batched metrics call."""
+        metrics = bitboard.batch_metrics(bitboard.stack(boards))
+        return (metrics @ _SHAPE_WEIGHTS).tolist()
+
     # ------------------------------------------------------------------
     # Drop a piece onto the board, return new board + cleared lines + tspin flag
     # ------------------------------------------------------------------
-    def _drop_piece(self, board, shape, col, piece):
-        # Copy board to avoid mutating the original
-        b = board.copy()
-        # piece starts high enough (y = -max_y)
-        max_y = max(y for _, y in shape)
-        y = -max_y
-        # keep moving down until collision
-        while True:
-            collision = False
-            for dx, dy in shape:
-                bx = col + dx
-                by = y + dy + 1
-                if by >= 20:  # bottom of the well
-                    collision = True
-                    break
-                if b[by, bx] == 255:  # block already present
-                    collision = True
-                    break
-            if collision:
-                break
-            y += 1
-
-        # lock piece at final (col, y)
-        for dx, dy in shape:
-            bx = col + dx
-            by = y + dy
-            b[by, bx] = 255
+    def _drop_piece(self, board, mask, col, piece, tops=None):
+        # board is a bitboard row tuple, so nothing is copied until lock
+        if tops is None:
+            y = bitboard.drop_row(board, mask, col)
+        else:
+            y = bitboard.landing_row(tops, mask, col)
+        locked = bitboard.lock(board, mask, col, y)
 
         # ---- T‑Spin detection (only for T piece) -----------------------
         is_tspin = False
@@ -201,58 +306,15 @@ class PredictionAgent(BaseAgent):
             cy = y + 1
             corners = 0
             for ox, oy in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
-                nx, ny = cx + ox, cy + oy
-                if 0 <= nx < 10 and 0 <= ny < 20 and b[ny, nx] == 255:
+                if bitboard.is_occupied(locked, cx + ox, cy + oy):
                     corners += 1
             if corners >= 3:  # 3‑corner T‑Spin (standard)
                 is_tspin = True
 
         # ---- line clear -------------------------------------------------
-        cleared = 0
-        new_rows = []
-        for row in b:
-            if np.all(row == 255):
-                cleared += 1
-            else:
-                new_rows.append(row)
-        # fill missing rows at top with empty rows
-        while len(new_rows) < 20:
-            new_rows.insert(0, np.zeros(10, dtype=np.uint8))
-        new_board = np.stack(new_rows)
+        new_board, cleared = bitboard.clear_lines(locked)
 
         return new_board, cleared, is_tspin
 
-    # ------------------------------------------------------------------
-    # Compute classic board metrics (height, holes, bumpiness, well depth)
-    # ------------------------------------------------------------------
-    def _board_metrics(self, board):
-        heights = []
-        holes = 0
-        for col in range(10):
-            column = board[:, col]
-            # height = first occupied cell from top
-            occupied = np.where(column == 255)[0]
-            if len(occupied) == 0:
-                h = 0
-            else:
-                h = 20 - occupied[0]
-                # count holes below the top occupied cell
-                holes += np.sum(column[occupied[0] :] == 0)
-            heights.append(h)
-
-        agg_height = sum(heights)
-        # bumpiness = sum |h_i - h_{i+1}|
-        bumpiness = sum(abs(heights[i] - heights[i + 1]) for i in range(9))
-
-        # well depth – deepest column surrounded by taller neighbours
-        well = 0
-        for i, h in enumerate(heights):
-            left = heights[i - 1] if i > 0 else 20
-            right = heights[i + 1] if i < 9 else 20
-            if h < left and h < right:
-                well = max(well, min(left, right) - h)
-
-        return agg_height, holes, bumpiness, well
-
 
 # ----------------------------------------------------------------------
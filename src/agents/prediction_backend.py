@@ -0,0 +1,282 @@
+"""Prediction agent loading and an out-of-process prediction backend.
+
+:class:`ProcessPredictionBackend` runs the agent chosen by
+:func:`load_prediction_agent` in a worker process, so a deep heuristic search
+no longer holds the GIL that the capture and render threads need.  Boards
+cross the process boundary bit-packed (25 bytes for 20×10), every request
+carries an id, and answers to anything but the newest request are dropped.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+AGENT_NAMES = ("dellacherie", "onnx", "simple", "mock")
+BACKENDS = ("inline", "process")
+
+
+def load_prediction_agent(agent_name: str) -> Any:
+    """Dynamically import and instantiate a prediction agent."""
+    if agent_name == "dellacherie":
+        from .prediction_agent_dellacherie import PredictionAgent
+        return PredictionAgent()
+    elif agent_name == "onnx":
+        from .prediction_agent_onnx import PredictionAgent
+        return PredictionAgent()
+    elif agent_name == "simple":
+        from .prediction_agent_simple import PredictionAgent
+        return PredictionAgent()
+    elif agent_name == "mock":
+        from .prediction_agent_mock_perfect import PredictionAgent
+        return PredictionAgent()
+    else:
+        raise ValueError(f"Unknown prediction_agent: {agent_name}")
+
+
+def pack_board(board) -> Tuple[Tuple[int, int], bytes]:
+    """Bit-pack a board (0 = empty, non-zero = block) into ``(shape, bytes)``."""
+    occupied = np.asarray(board) > 0
+    return occupied.shape, np.packbits(occupied).tobytes()
+
+
+def unpack_board(shape: Tuple[int, int], payload: bytes) -> np.ndarray:
+    """Inverse of :func:`pack_board`: the uint8 0/255 matrix agents expect."""
+    bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8), count=shape[0] * shape[1])
+    return (bits.reshape(shape) * 255).astype(np.uint8)
+
+
+def _worker_main(agent_name: str, conn) -> None:
+    """Worker process: answer only the newest pending request, until ``None``."""
+    try:
+        agent = load_prediction_agent(agent_name)
+    except Exception as exc:
+        conn.send((0, None, f"{type(exc).__name__}: {exc}"))
+        return
+    conn.send((0, None, None))  # ready
+
+    while True:
+        try:
+            message = conn.recv()
+            # a backlog means the caller already moved on – skip to the newest
+            while message is not None and conn.poll():
+                message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+
+        request_id, shape, payload, params = message
+        try:
+            result = agent.handle({**params, "board": unpack_board(shape, payload)})
+            conn.send((request_id, result, None))
+        except Exception as exc:
+            conn.send((request_id, None, f"{type(exc).__name__}: {exc}"))
+
+
+class ProcessPredictionBackend:
+    """Drop-in ``handle()`` for a prediction agent running in a worker process.
+
+    ``handle`` waits at most ``timeout_ms`` for the answer (the wait releases
+    the GIL); on timeout it raises :class:`TimeoutError` and the late answer is
+    discarded when it arrives.  Call :meth:`start` before the frame loop: it
+    blocks until the worker is ready.  A worker that dies is restarted on a
+    background thread, and ``handle`` fails fast with :class:`TimeoutError`
+    until it is back (retrying a failed start every ``retry_interval`` s).
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        timeout_ms: float = 50.0,
+        startup_timeout: float = 15.0,
+        start_method: str = "spawn",
+        retry_interval: float = 5.0,
+    ):
+        if agent_name not in AGENT_NAMES:
+            raise ValueError(f"Unknown prediction_agent: {agent_name}")
+        self.agent_name = agent_name
+        self.timeout_ms = timeout_ms
+        self.startup_timeout = startup_timeout
+        self.retry_interval = retry_interval
+        self._ctx = multiprocessing.get_context(start_method)
+        self._process = None
+        self._conn = None
+        self._starter = None
+        self._start_error = None
+        self._retry_at = 0.0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.unavailable = 0  # requests refused while the worker was (re)starting
+        self.stale = 0  # answers that arrived after their request timed out
+        self.errors = 0
+        self.restarts = 0
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def starting(self) -> bool:
+        return self._starter is not None and self._starter.is_alive()
+
+    def start(self) -> "ProcessPredictionBackend":
+        """Start the worker and wait until it has loaded the agent."""
+        with self._lock:
+            self._retry_at = 0.0
+            self._ensure_worker()
+            starter = self._starter
+        if starter is not None:
+            starter.join()
+        if not self.running:
+            raise self._start_error or RuntimeError(f"Prediction worker for {self.agent_name} did not start")
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        starter = self._starter
+        if starter is not None:
+            starter.join()
+        with self._lock:
+            self._shutdown(timeout)
+
+    def close(self) -> None:
+        self.stop()
+
+    def handle(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send ``params`` to the worker and return its prediction dict."""
+        with self._lock:
+            if not self._ensure_worker():
+                self.unavailable += 1
+                raise TimeoutError(f"{self.agent_name} prediction worker is not running yet")
+            request_id = next(self._ids)
+            shape, payload = pack_board(params["board"])
+            rest = {key: value for key, value in params.items() if key != "board"}
+            self._conn.send((request_id, shape, payload, rest))
+            self.requests += 1
+
+            deadline = time.perf_counter() + self.timeout_ms / 1000.0
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._conn.poll(remaining):
+                    self.timeouts += 1
+                    raise TimeoutError(
+                        f"{self.agent_name} prediction took longer than {self.timeout_ms:.0f} ms"
+                    )
+                try:
+                    answer_id, result, error = self._conn.recv()
+                except (EOFError, OSError) as exc:
+                    self._shutdown()
+                    raise RuntimeError(f"Prediction worker died: {exc}") from exc
+                if answer_id != request_id:
+                    self.stale += 1
+                    continue
+                if error is not None:
+                    self.errors += 1
+                    raise RuntimeError(f"Prediction worker failed: {error}")
+                self.completed += 1
+                return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "agent": self.agent_name,
+            "running": self.running,
+            "requests": self.requests,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "unavailable": self.unavailable,
+            "stale": self.stale,
+            "errors": self.errors,
+            "restarts": self.restarts,
+        }
+
+    def _ensure_worker(self) -> bool:
+        """Under the lock: True if the worker is up, else (re)start it in the background."""
+        if self.running:
+            return True
+        if self.starting or time.monotonic() < self._retry_at:
+            return False
+        if self._process is not None:
+            log.warning("Prediction worker exited (code %s) – restarting", self._process.exitcode)
+            self.restarts += 1
+            self._shutdown()
+        self._start_error = None
+        self._starter = threading.Thread(
+            target=self._start_worker, name=f"predict-{self.agent_name}-start", daemon=True
+        )
+        self._starter.start()
+        return False
+
+    def _start_worker(self) -> None:
+        """Starter thread: spawn the worker and wait for its ready message."""
+        parent, child = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main, args=(self.agent_name, child), name=f"predict-{self.agent_name}", daemon=True
+        )
+        try:
+            process.start()
+            child.close()
+            if not parent.poll(self.startup_timeout):
+                process.terminate()
+                raise TimeoutError(f"Prediction worker for {self.agent_name} did not start")
+            _, _, error = parent.recv()
+            if error is not None:
+                process.join(1.0)
+                raise RuntimeError(f"Prediction worker could not load {self.agent_name}: {error}")
+        except Exception as exc:
+            parent.close()
+            self._start_error = exc
+            self._retry_at = time.monotonic() + self.retry_interval
+            log.error("%s", exc)
+            return
+        with self._lock:
+            self._process, self._conn = process, parent
+        log.info("Prediction worker started for %s (pid %s)", self.agent_name, process.pid)
+
+    def _shutdown(self, timeout: float = 2.0) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+    def __enter__(self) -> "ProcessPredictionBackend":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def make_prediction_backend(agent_name: str, backend: str = "inline", timeout_ms: float = 50.0) -> Any:
+    """Return the agent itself (``inline``) or a :class:`ProcessPredictionBackend`."""
+    if backend == "inline":
+        return load_prediction_agent(agent_name)
+    if backend == "process":
+        return ProcessPredictionBackend(agent_name, timeout_ms=timeout_ms)
+    raise ValueError(f"prediction_backend must be one of {BACKENDS}, got {backend!r}")
+
+
+__all__ = [
+    "ProcessPredictionBackend",
+    "load_prediction_agent",
+    "make_prediction_backend",
+    "pack_board",
+    "unpack_board",
+]
@@ -1,4 +1,5 @@
-import pathlib, cv2, numpy as np, queue, threading, time
+import pathlib, cv2, numpy as np
+from ..pipeline import DROP_OLDEST, BoundedQueue, Pipeline
 from .base_agent import BaseAgent
 
 
@@ -10,9 +11,8 @@ class SyntheticCaptureAgent(BaseAgent):
 
     def __init__(self, fps: int = 60):
         self.fps = fps
-        self.frame_queue = queue.Queue(maxsize=10)
-        self._stop = threading.Event()
-        self._thread = None
+        self.frame_queue = BoundedQueue(10, DROP_OLDEST)
+        self._pipeline = None
 
         # Load the dummy board image generated by create_dummy_board.py
         img_path = (
@@ -25,35 +25,22 @@ class SyntheticCaptureAgent(BaseAgent):
         # Resize to a realistic size (optional)
         self._frame = cv2.resize(self._frame, (640, 1280))  # width×height
 
-    def _run(self):
-        period = 1.0 / self.fps
-        while not self._stop.is_set():
-            start = time.perf_counter()
-            try:
-                self.frame_queue.put(self._frame, timeout=0.1)
-            except queue.Full:
-                # drop oldest frame
-                try:
-                    _ = self.frame_queue.get_nowait()
-                    self.frame_queue.put_nowait(self._frame)
-                except queue.Empty:
-                    pass
-            # enforce FPS
-            elapsed = time.perf_counter() - start
-            if elapsed < period:
-                time.sleep(period - elapsed)
+    def _emit(self):
+        return self._frame
 
     def start(self):
-        if self._thread and self._thread.is_alive():
+        if self._pipeline and self._pipeline.running:
             return
-        self._stop.clear()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        # source stage: one frame per 1/fps, oldest dropped when nobody reads
+        self._pipeline = Pipeline("synthetic_capture")
+        self._pipeline.stage(
+            "synthetic_capture", self._emit, outbox=self.frame_queue, interval=1.0 / self.fps
+        )
+        self._pipeline.start()
 
     def stop(self):
-        self._stop.set()
-        if self._thread:
-            self._thread.join()
+        if self._pipeline:
+            self._pipeline.stop()
 
     def handle(self, params: dict | None = None) -> None:
         """Start/stop capture based on orchestrator request."""
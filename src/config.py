@@ -22,10 +22,22 @@ class AppConfig:
     # ---- NEW DXGI SETTINGS -------------------------------------------------
     use_dxgi: bool = True  # auto‑detect, can be forced off
     dxgi_target_fps: int = 60  # desired capture FPS
-    dxgi_pool_size: int = 3  # number of pre‑allocated frames
+    # Frames in the capture thread's pool; 0 (default) keeps the zero-copy
+    # path.  With mss this is NOT allocation-free: mss cannot grab into a
+    # caller's buffer, so every grab still allocates its screenshot and the
+    # pool adds a full-frame copy.  It only bounds how many frames are alive.
+    dxgi_pool_size: int = 0
     use_overlay: bool = False  # console by default
     roi: dict | None = None  # {"tl":[0,0],"br":[w,h]} – full frame by default
     # -------------------------------------------------------------------------
+    prediction_backend: str = "inline"  # "inline" or "process" (worker process)
+    prediction_timeout_ms: float = 50.0  # per-prediction wait for the worker
+    # -------------------------------------------------------------------------
+    telemetry_sample_every: int = 1  # log one in N per-frame telemetry records
+    telemetry_max_bytes: int = 10 * 1024 * 1024  # rotate telemetry.log at this size
+    telemetry_backup_count: int = 3  # rotated telemetry files to keep
+    telemetry_queue_size: int = 10000  # records buffered before new ones are dropped
+    # -------------------------------------------------------------------------
 
     @classmethod
     def load(cls) -> "AppConfig":
@@ -0,0 +1,89 @@
+"""Dirty-rectangle presentation for the pygame overlays.
+
+Renderers declare each frame's scene as keyed blits instead of drawing onto
+the screen directly.  :meth:`DirtyRectRenderer.present` compares the scene
+with the previous frame, erases and redraws only the items that appeared,
+moved, changed or disappeared, and passes just those rectangles to
+``pygame.display.update``.  An unchanged scene presents nothing.
+
+Items are compared by a ``token``, which defaults to the identity of the
+blitted surface.  This pairs with :class:`~src.render_assets.RenderAssets`,
+which returns the same surface for the same label or sprite.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pygame
+
+log = logging.getLogger(__name__)
+
+
+class DirtyRectRenderer:
+    """Retained scene of keyed blits, presented as dirty rectangles."""
+
+    def __init__(self, background: Sequence[int] = (0, 0, 0, 0)):
+        self.background = tuple(background)
+        self._scene: Dict[Hashable, Tuple[pygame.Surface, pygame.Rect, Any]] = {}
+        self._shown: Dict[Hashable, Tuple[pygame.Rect, Any]] = {}
+        self.presented = 0
+        self.skipped = 0
+
+    def blit(self, key: Hashable, image: pygame.Surface, pos: Tuple[int, int], token: Any = None) -> pygame.Rect:
+        """Add ``image`` at ``pos`` to this frame's scene under ``key``."""
+        rect = image.get_rect(topleft=pos)
+        self._scene[key] = (image, rect, id(image) if token is None else token)
+        return rect
+
+    def invalidate(self) -> None:
+        """Forget what is on screen (e.g. after ``set_mode``); the next present redraws every item."""
+        self._shown = {}
+
+    def dirty_rects(self) -> List[pygame.Rect]:
+        """Rectangles that differ between the shown frame and the pending scene."""
+        dirty = []
+        for key, (rect, token) in self._shown.items():
+            current = self._scene.get(key)
+            if current is None or current[1] != rect or current[2] != token:
+                dirty.append(rect)
+        for key, (_, rect, token) in self._scene.items():
+            if self._shown.get(key) != (rect, token):
+                dirty.append(rect)
+        return dirty
+
+    def present(
+        self,
+        screen: pygame.Surface,
+        update: Optional[Callable[..., None]] = None,
+    ) -> List[pygame.Rect]:
+        """Draw the changed parts of the scene onto ``screen`` and show them.
+
+        Returns the rectangles that were updated (empty if the frame was skipped).
+        """
+        update = update or pygame.display.update
+        dirty = self.dirty_rects()
+        if not dirty:
+            self.skipped += 1
+            self._scene = {}
+            return []
+        for rect in dirty:
+            screen.fill(self.background, rect)
+
+        # repaint everything that touches a cleared area, in draw order
+        for image, rect, _ in self._scene.values():
+            if rect.collidelist(dirty) != -1:
+                screen.blit(image, rect)
+
+        update(dirty)
+        self._shown = {key: (rect, token) for key, (_, rect, token) in self._scene.items()}
+        self._scene = {}
+        self.presented += 1
+        return dirty
+
+    def stats(self) -> Dict[str, int]:
+        return {"presented": self.presented, "skipped": self.skipped}
+
+
+__all__ = ["DirtyRectRenderer"]
@@ -0,0 +1,56 @@
+"""Board-mask overlay rendered as one scaled surface.
+
+The mask is written into a cached ``rows×cols`` RGBA array that backs a tiny
+pygame surface (``pygame.image.frombuffer`` shares the memory, so nothing is
+copied), scaled to the board size with one nearest-neighbour
+``transform.scale`` into a reused destination surface and blitted once.  The
+cost is the same for an empty and a full board, instead of one cell blit per
+occupied cell.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional, Sequence
+
+import numpy as np
+import pygame
+
+log = logging.getLogger(__name__)
+
+
+class MaskRenderer:
+    """Scales a 0/255 board mask into a translucent overlay surface."""
+
+    def __init__(self, colour: Sequence[int] = (255, 255, 255, 120)):
+        self.colour = tuple(colour)
+        self._rgba: Optional[np.ndarray] = None
+        self._small: Optional[pygame.Surface] = None
+        self._scaled: Optional[pygame.Surface] = None
+        self.rendered = 0
+
+    def render(self, mask: np.ndarray, cell_px: int) -> pygame.Surface:
+        """Return the overlay for ``mask`` with square cells of ``cell_px`` pixels.
+
+        The returned surface is reused by the next call; blit it before then.
+        """
+        rows, cols = mask.shape
+        if self._rgba is None or self._rgba.shape[:2] != (rows, cols):
+            self._rgba = np.zeros((rows, cols, 4), dtype=np.uint8)
+            self._rgba[..., :3] = self.colour[:3]
+            self._small = pygame.image.frombuffer(self._rgba, (cols, rows), "RGBA")
+            self._scaled = None
+
+        alpha = self._rgba[..., 3]
+        alpha.fill(0)
+        alpha[mask == 255] = self.colour[3]
+
+        size = (cols * cell_px, rows * cell_px)
+        if self._scaled is None or self._scaled.get_size() != size:
+            self._scaled = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.transform.scale(self._small, size, self._scaled)
+        self.rendered += 1
+        return self._scaled
+
+
+__all__ = ["MaskRenderer"]
@@ -0,0 +1,283 @@
+"""Staged pipeline runtime: worker threads connected by bounded queues.
+
+Stages are declared once on a :class:`Pipeline`; each runs ``fn`` on its own
+worker thread(s), reading from the previous stage's queue and offering its
+result to the next.  A stage without an inbox is a source and calls ``fn()``
+in a loop.  Returning ``None`` emits nothing, so sinks and filters need no
+special casing.
+
+Queues are :class:`BoundedQueue` instances with an explicit policy for a full
+queue, which replaces the drop-oldest block every agent used to carry:
+
+* ``DROP_OLDEST`` – evict the oldest item (live video: newest frame wins)
+* ``DROP_NEWEST`` – discard the item being offered
+* ``BLOCK`` – wait for space (back-pressure), re-checking for shutdown
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+BLOCK = "block"
+POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+class BoundedQueue(queue.Queue):
+    """``queue.Queue`` with a drop policy applied by :meth:`offer`.
+
+    ``on_drop`` is called with every item the policy discards, e.g. to hand a
+    pooled frame buffer back.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1,
+        policy: str = DROP_OLDEST,
+        on_drop: Optional[Callable[[Any], None]] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("BoundedQueue needs maxsize >= 1")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+        super().__init__(maxsize)
+        self.policy = policy
+        self.on_drop = on_drop
+        self.dropped = 0
+
+    def offer(self, item: Any, stop: Optional[threading.Event] = None, poll: float = 0.1) -> bool:
+        """Enqueue ``item`` according to the policy; return False if it was dropped."""
+        if self.policy == BLOCK:
+            while not (stop is not None and stop.is_set()):
+                try:
+                    self.put(item, timeout=poll)
+                    return True
+                except queue.Full:
+                    continue
+            self._drop(item)
+            return False
+
+        while True:
+            try:
+                self.put_nowait(item)
+                return True
+            except queue.Full:
+                pass
+            if self.policy == DROP_NEWEST:
+                self._drop(item)
+                return False
+            try:
+                self._drop(self.get_nowait())
+            except queue.Empty:
+                pass  # a consumer emptied it meanwhile – retry the put
+
+    def _drop(self, item: Any) -> None:
+        self.dropped += 1
+        if self.on_drop is not None:
+            self.on_drop(item)
+
+
+class StageStats:
+    """Throughput / latency counters for one stage (updated under a lock)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.processed = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency: float, ok: bool = True) -> None:
+        with self._lock:
+            if ok:
+                self.processed += 1
+            else:
+                self.errors += 1
+            self.busy += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            calls = self.processed + self.errors
+            elapsed = time.perf_counter() - self.started_at
+            return {
+                "processed": self.processed,
+                "errors": self.errors,
+                "throughput_per_s": self.processed / elapsed if elapsed > 0 else 0.0,
+                "avg_latency_ms": self.busy / calls * 1000.0 if calls else 0.0,
+                "max_latency_ms": self.max_latency * 1000.0,
+            }
+
+
+class Stage:
+    """One step of a pipeline; see :meth:`Pipeline.stage`."""
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        inbox: Optional[queue.Queue] = None,
+        outbox: Optional[BoundedQueue] = None,
+        workers: int = 1,
+        interval: float = 0.0,
+        poll: float = 0.2,
+    ):
+        self.name = name
+        self.fn = fn
+        self.inbox = inbox
+        self.outbox = outbox
+        self.workers = workers
+        self.interval = interval
+        self.poll = poll
+        self.stats = StageStats()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def is_source(self) -> bool:
+        return self.inbox is None
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self, stop: threading.Event) -> None:
+        self.stats = StageStats()
+        self._threads = [
+            threading.Thread(target=self._loop, args=(stop,), name=f"{self.name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def snapshot(self) -> Dict[str, float]:
+        stats = self.stats.snapshot()
+        if self.outbox is not None:
+            stats["queue_depth"] = self.outbox.qsize()
+            stats["dropped"] = self.outbox.dropped
+        return stats
+
+    def _loop(self, stop: threading.Event) -> None:
+        log.info("Stage %s started", self.name)
+        while not stop.is_set():
+            if self.is_source:
+                args = ()
+            else:
+                try:
+                    args = (self.inbox.get(timeout=self.poll),)
+                except queue.Empty:
+                    continue
+
+            started = time.perf_counter()
+            try:
+                result = self.fn(*args)
+            except Exception as exc:
+                self.stats.record(time.perf_counter() - started, ok=False)
+                log.error("Stage %s failed: %s", self.name, exc, exc_info=True)
+                continue
+            elapsed = time.perf_counter() - started
+            self.stats.record(elapsed)
+
+            if result is not None and self.outbox is not None:
+                self.outbox.offer(result, stop)
+            if self.interval > elapsed:
+                stop.wait(self.interval - elapsed)
+        log.info("Stage %s stopped", self.name)
+
+
+class Pipeline:
+    """A chain of :class:`Stage` objects sharing one stop event."""
+
+    def __init__(self, name: str = "pipeline"):
+        self.name = name
+        self.stages: List[Stage] = []
+        self._stop = threading.Event()
+
+    def stage(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *,
+        maxsize: int = 1,
+        policy: str = DROP_OLDEST,
+        on_drop: Optional[Callable[[Any], None]] = None,
+        workers: int = 1,
+        interval: float = 0.0,
+        inbox: Optional[queue.Queue] = None,
+        outbox: Optional[BoundedQueue] = None,
+    ) -> Stage:
+        """Append a stage.
+
+        ``inbox`` defaults to the previous stage's outbox (the first stage
+        without one is a source).  ``outbox`` defaults to a new
+        :class:`BoundedQueue` of ``maxsize`` with ``policy``/``on_drop``.
+        """
+        if self.running:
+            raise RuntimeError("Cannot add stages to a running pipeline")
+        if inbox is None and self.stages:
+            inbox = self.stages[-1].outbox
+        if outbox is None:
+            outbox = BoundedQueue(maxsize, policy, on_drop)
+        stage = Stage(name, fn, inbox, outbox, workers=workers, interval=interval)
+        self.stages.append(stage)
+        return stage
+
+    @property
+    def output(self) -> Optional[BoundedQueue]:
+        """Queue receiving the last stage's results."""
+        return self.stages[-1].outbox if self.stages else None
+
+    @property
+    def running(self) -> bool:
+        return any(stage.running for stage in self.stages)
+
+    def start(self) -> "Pipeline":
+        if self.running:
+            return self
+        self._stop.clear()
+        for stage in self.stages:
+            stage.start(self._stop)
+        log.info("Pipeline %s started with stages %s", self.name, [s.name for s in self.stages])
+        return self
+
+    def request_stop(self) -> None:
+        """Tell every stage to finish without waiting; safe from a stage thread."""
+        self._stop.set()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self.request_stop()
+        for stage in self.stages:
+            stage.join(timeout)
+        log.info("Pipeline %s stopped", self.name)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {stage.name: stage.snapshot() for stage in self.stages}
+
+    def __enter__(self) -> "Pipeline":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+__all__ = [
+    "BLOCK",
+    "DROP_NEWEST",
+    "DROP_OLDEST",
+    "BoundedQueue",
+    "Pipeline",
+    "Stage",
+    "StageStats",
+]
@@ -0,0 +1,129 @@
+"""Cached fonts, text and sprites for the pygame overlays.
+
+``pygame.font.Font`` loads the font file and ``SysFont`` scans the system
+font list, so both are created once per (name, size).  Rendered labels are
+memoized in a small LRU – the recurring ones ("B2B", "TSPIN", "Combo x3")
+are rendered once per session – and filled cells / whole-piece ghost sprites
+are built once per size and colour.  Changing the ghost style only drops
+the sprites; fonts and text stay cached.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Tuple, Union
+
+import pygame
+
+log = logging.getLogger(__name__)
+
+Colour = Tuple[int, ...]
+CellSize = Union[int, Tuple[int, int]]
+
+
+def _cell_size(cell: CellSize) -> Tuple[int, int]:
+    return (cell, cell) if isinstance(cell, int) else (int(cell[0]), int(cell[1]))
+
+
+class RenderAssets:
+    """Per-renderer asset cache; create after ``pygame.init()``."""
+
+    def __init__(
+        self,
+        shapes: Optional[Dict[str, Sequence[Sequence[Tuple[int, int]]]]] = None,
+        max_text: int = 256,
+    ):
+        self.shapes = shapes or {}
+        self.max_text = max_text
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._text: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._cells: Dict[Tuple[int, int, Colour], pygame.Surface] = {}
+        self._sprites: Dict[Tuple[str, int, Tuple[int, int], Colour], pygame.Surface] = {}
+        self.text_hits = 0
+        self.text_misses = 0
+
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Default font (``name=None``) or a system font, loaded once per size."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+        return font
+
+    def text(self, label: str, size: int, colour: Colour, name: Optional[str] = None) -> pygame.Surface:
+        """Rendered (antialiased) ``label``; treat the returned surface as read-only."""
+        key = (name, size, label, tuple(colour))
+        surface = self._text.get(key)
+        if surface is not None:
+            self.text_hits += 1
+            self._text.move_to_end(key)
+            return surface
+        self.text_misses += 1
+        surface = self.font(size, name).render(label, True, colour)
+        self._text[key] = surface
+        if len(self._text) > self.max_text:
+            self._text.popitem(last=False)
+        return surface
+
+    def cell(self, width: int, height: int, colour: Colour) -> pygame.Surface:
+        """A filled ``width``×``height`` SRCALPHA surface."""
+        key = (width, height, tuple(colour))
+        surface = self._cells.get(key)
+        if surface is None:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.fill(colour)
+            self._cells[key] = surface
+        return surface
+
+    def ghost_sprite(self, piece: str, rotation: int, cell: CellSize, colour: Colour) -> pygame.Surface:
+        """Whole-piece sprite for ``piece`` at ``rotation`` (wrapped to the shape count).
+
+        ``cell`` is the board cell size in pixels, square or ``(width, height)``.
+        """
+        rotations = self.shapes[piece]
+        rotation %= len(rotations)
+        cell = _cell_size(cell)
+        key = (piece, rotation, cell, tuple(colour))
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._build_sprite(rotations[rotation], cell, colour)
+            self._sprites[key] = sprite
+        return sprite
+
+    def prebuild_ghosts(self, cell: CellSize, colour: Colour) -> None:
+        """Build every piece/rotation sprite up front for the given style."""
+        for piece, rotations in self.shapes.items():
+            for rotation in range(len(rotations)):
+                self.ghost_sprite(piece, rotation, cell, colour)
+
+    def clear_sprites(self) -> None:
+        """Drop cell and ghost sprites (called when the ghost style changes)."""
+        self._cells.clear()
+        self._sprites.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "fonts": len(self._fonts),
+            "text": len(self._text),
+            "text_hits": self.text_hits,
+            "text_misses": self.text_misses,
+            "sprites": len(self._sprites),
+        }
+
+    def _build_sprite(self, cells: Iterable[Tuple[int, int]], cell: Tuple[int, int], colour: Colour) -> pygame.Surface:
+        cells = list(cells)
+        cell_w, cell_h = cell
+        width = (max(x for x, _ in cells) + 1) * cell_w
+        height = (max(y for _, y in cells) + 1) * cell_h
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        for x, y in cells:
+            # fill, not blit: blending onto the transparent sprite would darken the colour
+            sprite.fill(colour, pygame.Rect(x * cell_w, y * cell_h, cell_w, cell_h))
+        return sprite
+
+
+__all__ = ["RenderAssets"]
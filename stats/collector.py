@@ -1,13 +1,21 @@
 """Statistics collector for per-frame events."""
 
+import logging
 import time
 import uuid
+from sqlalchemy import case, func
 from sqlmodel import select
 from .db import get_session, Match, Event
+from .writer import StatsWriter
+
+log = logging.getLogger(__name__)
 
 _current_match_id: str | None = None
 _frame_counter = 0
 
+# Events are committed in batches off the frame loop
+_writer = StatsWriter()
+
 def start_new_match(agent_name: str):
     """Start tracking a new match."""
     global _current_match_id, _frame_counter
@@ -23,20 +31,31 @@ def end_current_match():
     if not _current_match_id:
         return
     
+    # Final stats below are computed from the events, so write them first
+    if not flush_events():
+        log.warning("Stats writer did not flush in time; final match stats may be incomplete")
+
     with get_session() as s:
         stmt = select(Match).where(Match.id == _current_match_id)
         m = s.exec(stmt).first()
         if m:
             m.end_ts = time.time()
-            # Calculate final stats from events
-            events_stmt = select(Event).where(Event.match_id == _current_match_id)
-            events = s.exec(events_stmt).all()
+            # Calculate final stats from events (aggregated in SQL over the
+            # (match_id, frame) index instead of loading every row)
+            count, max_lines, max_combo, b2b_count = s.exec(
+                select(
+                    func.count(),
+                    func.max(Event.lines_cleared),
+                    func.max(Event.combo),
+                    func.sum(case((Event.b2b, 1), else_=0)),
+                ).where(Event.match_id == _current_match_id)
+            ).one()
             
-            if events:
-                m.total_score = max(e.lines_cleared for e in events) * 100  # Simple scoring
-                m.total_lines = max(e.lines_cleared for e in events)
-                m.max_combo = max(e.combo for e in events)
-                m.max_b2b = sum(1 for e in events if e.b2b)
+            if count:
+                m.total_score = max_lines * 100  # Simple scoring
+                m.total_lines = max_lines
+                m.max_combo = max_combo
+                m.max_b2b = b2b_count
             
             s.add(m)
             s.commit()
@@ -51,24 +70,30 @@ def record_event(frame: int,
                  b2b: bool,
                  tspin: bool,
                  latency_ms: float):
-    """Record a single frame event."""
+    """Queue a single frame event for the background writer (never blocks)."""
     if not _current_match_id:
         return
     
-    with get_session() as s:
-        s.add(Event(
-            match_id=_current_match_id,
-            frame=frame,
-            ts=time.time(),
-            piece=piece,
-            orientation=orientation,
-            lines_cleared=lines_cleared,
-            combo=combo,
-            b2b=b2b,
-            tspin=tspin,
-            latency_ms=latency_ms
-        ))
-        s.commit()
+    _writer.submit(
+        match_id=_current_match_id,
+        frame=frame,
+        ts=time.time(),
+        piece=piece,
+        orientation=orientation,
+        lines_cleared=lines_cleared,
+        combo=combo,
+        b2b=b2b,
+        tspin=tspin,
+        latency_ms=latency_ms
+    )
+
+def flush_events(timeout: float = 5.0) -> bool:
+    """Wait until every recorded event is committed; False on timeout."""
+    return _writer.flush(timeout)
+
+def writer_stats() -> dict:
+    """Pending / written / dropped counters of the background writer."""
+    return _writer.stats()
 
 def get_current_match_id() -> str | None:
     """Get the current match ID."""
@@ -5,8 +5,11 @@ from pathlib import Path
 from typing import Optional
 import uuid
 
+from .sqlite_setup import install_pragmas, migrate
+
 DB_PATH = Path("stats.db")
-engine = create_engine(f"sqlite:///{DB_PATH}")
+# WAL / synchronous / cache pragmas on every connection
+engine = install_pragmas(create_engine(f"sqlite:///{DB_PATH}"))
 
 class Match(SQLModel, table=True):
     id: str = Field(primary_key=True)   # uuid4 string
@@ -32,8 +35,9 @@ class Event(SQLModel, table=True):
     latency_ms: float
 
 def init_db():
-    """Initialize the database tables."""
+    """Initialize the database tables and apply pending migrations (indexes)."""
     SQLModel.metadata.create_all(engine)
+    migrate(engine)
 
 def get_session() -> Session:
     """Get a database session."""
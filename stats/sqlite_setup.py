@@ -0,0 +1,87 @@
+"""SQLite tuning and versioned schema migrations for stats.db.
+
+Pragmas are applied to every new connection: WAL lets the dashboard read
+while the stats writer commits, ``synchronous=NORMAL`` is durable enough
+under WAL without an fsync per transaction, and a larger page cache plus
+memory-mapped I/O keep long match histories fast.
+
+Migrations are numbered and recorded in SQLite's ``user_version`` header, so
+each runs once per database file.  Statements must be idempotent (``IF NOT
+EXISTS``) so a migration interrupted before its version was recorded can
+simply run again.  Append new ones to :data:`MIGRATIONS`; never edit an
+applied one.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Tuple, Union
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+log = logging.getLogger(__name__)
+
+PRAGMAS: Dict[str, Union[int, str]] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,  # negative = KiB, i.e. ~16 MB page cache
+    "mmap_size": 64 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+# (version, description, statements)
+MIGRATIONS: List[Tuple[int, str, Tuple[str, ...]]] = [
+    (
+        1,
+        "index events by match and frame",
+        ("CREATE INDEX IF NOT EXISTS ix_event_match_frame ON event (match_id, frame)",),
+    ),
+    (
+        2,
+        "index matches by start time",
+        ("CREATE INDEX IF NOT EXISTS ix_match_start_ts ON match (start_ts)",),
+    ),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def _apply_pragmas(dbapi_connection, _record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def install_pragmas(engine: Engine) -> Engine:
+    """Apply :data:`PRAGMAS` to every connection ``engine`` opens."""
+    if engine.dialect.name == "sqlite" and not event.contains(engine, "connect", _apply_pragmas):
+        event.listen(engine, "connect", _apply_pragmas)
+    return engine
+
+
+def schema_version(engine: Engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def migrate(engine: Engine) -> int:
+    """Run pending migrations in order; return the resulting schema version."""
+    current = schema_version(engine)
+    for version, description, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+            # PRAGMA does not take bound parameters; version is an int literal
+            conn.execute(text(f"PRAGMA user_version={int(version)}"))
+        log.info("stats.db migrated to v%d: %s", version, description)
+        current = version
+    return current
+
+
+__all__ = ["MIGRATIONS", "PRAGMAS", "SCHEMA_VERSION", "install_pragmas", "migrate", "schema_version"]
@@ -0,0 +1,153 @@
+"""Background writer that batches per-event inserts into few transactions.
+
+``submit`` never blocks: rows go onto a bounded queue (a full queue drops the
+new row and counts it) and a daemon thread commits them in one transaction
+once ``batch_size`` rows are pending or the oldest has waited
+``flush_interval`` seconds.  :meth:`StatsWriter.flush` waits until every row
+submitted before the call is on disk.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.pipeline import DROP_NEWEST, BoundedQueue
+
+from .db import Event, get_session
+
+log = logging.getLogger(__name__)
+
+
+class _Flush:
+    """Queue marker: commit everything before it, then set ``done``."""
+
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class StatsWriter:
+    """Asynchronous, batching writer for :class:`~stats.db.Event` rows."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] = get_session,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        maxsize: int = 4096,
+        model: type = Event,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.model = model
+        self.queue = BoundedQueue(maxsize, DROP_NEWEST)
+        self.written = 0
+        self.batches = 0
+        self.failed = 0  # rows lost to a failed commit
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def dropped(self) -> int:
+        return self.queue.dropped
+
+    def start(self) -> "StatsWriter":
+        with self._lock:
+            if not self.running:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="stats-writer", daemon=True)
+                self._thread.start()
+        return self
+
+    def submit(self, **fields: Any) -> bool:
+        """Queue one row; returns False (and counts a drop) if the queue is full."""
+        self.start()
+        return self.queue.offer(fields)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until rows submitted so far are committed; False on timeout."""
+        if not self.running:
+            return self.queue.empty()
+        marker = _Flush()
+        try:
+            self.queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush pending rows and stop the thread."""
+        self.flush(timeout)
+        self._stop.set()
+        try:
+            self.queue.put(_Flush(), timeout=timeout)  # wake the thread
+        except queue.Full:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    close = stop
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": self.queue.qsize(),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        first_at = 0.0
+        while not self._stop.is_set():
+            timeout = self.flush_interval
+            if batch:
+                timeout = max(0.0, first_at + self.flush_interval - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, _Flush):
+                self._commit(batch)
+                batch = []
+                item.done.set()
+                continue
+            if item is not None:
+                if not batch:
+                    first_at = time.monotonic()
+                batch.append(item)
+            if batch and (len(batch) >= self.batch_size or time.monotonic() - first_at >= self.flush_interval):
+                self._commit(batch)
+                batch = []
+        self._commit(batch)
+
+    def _commit(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        try:
+            with self.session_factory() as session:
+                session.add_all([self.model(**row) for row in rows])
+                session.commit()
+        except Exception as exc:
+            self.failed += len(rows)
+            log.error("Dropping %d stats rows after failed commit: %s", len(rows), exc)
+            return
+        self.written += len(rows)
+        self.batches += 1
+
+
+__all__ = ["StatsWriter"]
@@ -0,0 +1,60 @@
+"""Next-queue lookahead for the Dellacherie agent."""
+
+import time
+
+import numpy as np
+
+from src.agents import bitboard
+from src.agents.beam_search import BeamSearch
+from src.agents.prediction_agent_dellacherie import PredictionAgent
+
+
+def _random_board(seed):
+    rng = np.random.default_rng(seed)
+    board = np.zeros((20, 10), dtype=np.uint8)
+    for col in range(10):
+        board[20 - rng.integers(0, 10):, col] = 255
+    board[rng.random((20, 10)) < 0.1] = 0
+    return board
+
+
+def test_depth_zero_matches_greedy_search():
+    agent = PredictionAgent()
+    for seed in range(5):
+        rows = bitboard.from_array(_random_board(seed))
+        greedy = agent.search(rows, "T", agent.state)
+        beam = BeamSearch(agent, beam_width=4, depth=0).run(rows, ["T", "I", "O"], agent.state)
+        assert (beam.col, beam.rot) == (greedy.col, greedy.rot)
+
+
+def test_lookahead_reaches_full_depth():
+    # Two O pieces fill the 2-wide gap on the right, each clearing two lines
+    board = np.zeros((20, 10), dtype=np.uint8)
+    board[16:, :8] = 255
+    agent = PredictionAgent()
+    search = BeamSearch(agent, beam_width=6, depth=2)
+    move = search.run(bitboard.from_array(board), ["O", "O", "I"], agent.state)
+    assert search.last_depth == 2
+    assert (move.col, move.lines_cleared) == (8, 2)
+
+
+def test_deadline_returns_first_level_move():
+    agent = PredictionAgent()
+    rows = bitboard.from_array(_random_board(3))
+    search = BeamSearch(agent, beam_width=8, depth=3)
+    expired = time.perf_counter() - 1.0
+    move = search.run(rows, ["T", "S", "Z", "L"], agent.state, deadline=expired)
+    assert search.last_depth == 0
+    greedy = agent.search(rows, "T", agent.state)
+    assert (move.col, move.rot) == (greedy.col, greedy.rot)
+
+
+def test_handle_uses_queue_within_deadline():
+    agent = PredictionAgent(lookahead_depth=2, beam_width=6, deadline_ms=30.0)
+    board = _random_board(4)
+    start = time.perf_counter()
+    pred = agent.handle({"board": board, "piece": "T", "orientation": 0, "queue": ["I", "L"]})
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    assert 0 <= pred["target_col"] <= 9
+    assert 0 <= pred["target_rot"] <= 3
+    assert elapsed_ms < 30.0 + 10.0  # one node expansion may overrun the deadline
@@ -0,0 +1,135 @@
+"""Bitboard placement engine must match the numpy reference placement."""
+
+import timeit
+
+import numpy as np
+import pytest
+
+from src.agents import bitboard
+from src.agents.prediction_agent_dellacherie import PIECE_MASKS, PIECE_SHAPES, PredictionAgent
+
+
+def _reference_place(board, shape, col):
+    """The agent's original numpy drop/lock/clear (cells above the well skipped)."""
+    b = board.copy()
+    y = -max(y for _, y in shape)
+    while True:
+        collision = False
+        for dx, dy in shape:
+            by = y + dy + 1
+            if by >= 20 or (by >= 0 and b[by, col + dx] == 255):
+                collision = True
+                break
+        if collision:
+            break
+        y += 1
+    for dx, dy in shape:
+        if y + dy >= 0:
+            b[y + dy, col + dx] = 255
+    cleared = 0
+    new_rows = []
+    for row in b:
+        if np.all(row == 255):
+            cleared += 1
+        else:
+            new_rows.append(row)
+    while len(new_rows) < 20:
+        new_rows.insert(0, np.zeros(10, dtype=np.uint8))
+    return np.stack(new_rows), cleared
+
+
+def _reference_metrics(board):
+    heights = []
+    holes = 0
+    for col in range(10):
+        column = board[:, col]
+        occupied = np.where(column == 255)[0]
+        if len(occupied) == 0:
+            h = 0
+        else:
+            h = 20 - occupied[0]
+            holes += np.sum(column[occupied[0]:] == 0)
+        heights.append(h)
+    bumpiness = sum(abs(heights[i] - heights[i + 1]) for i in range(9))
+    well = 0
+    for i, h in enumerate(heights):
+        left = heights[i - 1] if i > 0 else 20
+        right = heights[i + 1] if i < 9 else 20
+        if h < left and h < right:
+            well = max(well, min(left, right) - h)
+    return sum(heights), holes, bumpiness, well
+
+
+def _random_board(rng):
+    """Stack of random height per column with ~15% holes and a few full rows."""
+    board = np.zeros((20, 10), dtype=np.uint8)
+    for col in range(10):
+        h = rng.integers(0, 12)
+        board[20 - h:, col] = 255
+    board[rng.random((20, 10)) < 0.15] = 0
+    for row in rng.choice(20, size=2, replace=False):
+        if board[row].any():
+            board[row] = 255
+            board[row, rng.integers(0, 10)] = 0
+    return board
+
+
+def test_pack_roundtrip():
+    rng = np.random.default_rng(0)
+    board = _random_board(rng)
+    assert np.array_equal(bitboard.to_array(bitboard.from_array(board)), board)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_placements_match_reference(seed):
+    rng = np.random.default_rng(seed)
+    board = _random_board(rng)
+    rows = bitboard.from_array(board)
+    for piece, rotations in PIECE_SHAPES.items():
+        for rot, shape in enumerate(rotations):
+            mask = PIECE_MASKS[piece][rot]
+            for col in range(10 - mask.width + 1):
+                expected, expected_cleared = _reference_place(board, shape, col)
+                y = bitboard.drop_row(rows, mask, col)
+                new_rows, cleared = bitboard.clear_lines(bitboard.lock(rows, mask, col, y))
+                assert cleared == expected_cleared
+                assert np.array_equal(bitboard.to_array(new_rows), expected)
+                assert bitboard.board_metrics(new_rows) == _reference_metrics(expected)
+
+
+def test_batch_metrics_match_reference():
+    rng = np.random.default_rng(7)
+    boards = np.stack([_random_board(rng) for _ in range(32)])
+    boards[0] = 0  # empty board: no heights, no wells
+
+    expected = np.array([_reference_metrics(b) for b in boards])
+    assert np.array_equal(bitboard.batch_metrics(boards), expected)
+
+    rows = [bitboard.from_array(b) for b in boards]
+    assert np.array_equal(bitboard.batch_metrics(bitboard.stack(rows)), expected)
+
+
+def test_line_clear_shifts_rows_down():
+    board = np.zeros((20, 10), dtype=np.uint8)
+    board[19, :9] = 255
+    board[18, 0] = 255
+    rows = bitboard.from_array(board)
+    mask = PIECE_MASKS["I"][1]  # vertical I
+    y = bitboard.drop_row(rows, mask, 9)
+    assert y == 16
+    new_rows, cleared = bitboard.clear_lines(bitboard.lock(rows, mask, 9, y))
+    assert cleared == 1
+    assert new_rows[19] == 0b1000000001
+    assert new_rows[16] == 0
+
+
+def test_placement_is_an_order_of_magnitude_faster():
+    board = _random_board(np.random.default_rng(1))
+    rows = bitboard.from_array(board)
+    shape = PIECE_SHAPES["T"][0]
+    mask = PIECE_MASKS["T"][0]
+    agent = PredictionAgent()
+
+    reference = min(timeit.repeat(lambda: _reference_place(board, shape, 4), number=200, repeat=5))
+    engine = min(timeit.repeat(lambda: agent._drop_piece(rows, mask, 4, "T"), number=200, repeat=5))
+    assert engine * 10 <= reference
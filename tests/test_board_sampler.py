@@ -0,0 +1,39 @@
+"""Cell-sampling board extractor."""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from board_sampler import cell_grid, sample_board
+from scripts.bench_board_extract import random_truth, render_board
+
+
+@pytest.mark.parametrize("size", [(300, 600), (180, 360), (97, 203)])
+def test_sampling_matches_rendered_board(size):
+    width, height = size
+    rng = np.random.default_rng(width)
+    for _ in range(10):
+        truth = random_truth(rng)
+        board = sample_board(render_board(truth, width, height, rng))
+        assert board.shape == (20, 10) and board.dtype == np.uint8
+        assert np.array_equal(board > 0, truth)
+
+
+def test_pil_rgb_and_bgra_agree():
+    rng = np.random.default_rng(3)
+    frame = render_board(random_truth(rng), 200, 400, rng)
+    pil = Image.fromarray(frame[..., 2::-1].copy())  # BGRA -> RGB
+    assert np.array_equal(sample_board(pil), sample_board(frame))
+
+
+def test_grid_is_cached_and_read_only():
+    ys, xs = cell_grid(400, 200)
+    assert cell_grid(400, 200)[0] is ys
+    assert ys.shape == xs.shape == (20, 10, 9)
+    with pytest.raises(ValueError):
+        ys[0, 0, 0] = 1
+
+
+def test_roi_too_small():
+    with pytest.raises(ValueError):
+        sample_board(np.zeros((10, 5, 4), dtype=np.uint8))
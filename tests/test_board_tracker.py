@@ -0,0 +1,100 @@
+"""Settled-stack diffing and piece-lock / line-clear events."""
+
+import numpy as np
+import pytest
+
+from board_tracker import BoardStateTracker
+
+
+def _stack():
+    board = np.zeros((20, 10), dtype=np.uint8)
+    board[18:, :] = 255
+    board[18:, 9] = 0  # two rows waiting for an I piece
+    board[17, :3] = 255
+    return board
+
+
+def _feed(tracker, board, frames):
+    return [e for e in (tracker.update(board) for _ in range(frames)) if e is not None]
+
+
+def test_falling_piece_is_not_an_event():
+    tracker = BoardStateTracker(settle_frames=3)
+    board = _stack()
+    assert [e.kind for e in _feed(tracker, board, 5)] == ["reset"]
+
+    # an I piece falling one row per frame never settles
+    for y in range(0, 14):
+        frame = board.copy()
+        frame[y:y + 4, 5] = 255
+        assert tracker.update(frame) is None
+    assert tracker.events == 1
+
+
+def test_hovering_piece_is_not_a_lock():
+    tracker = BoardStateTracker(settle_frames=2)
+    board = _stack()
+    _feed(tracker, board, 3)
+
+    hovering = board.copy()
+    hovering[5:7, 4:6] = 255  # O piece paused mid-air under slow gravity
+    assert _feed(tracker, hovering, 10) == []
+
+
+def test_lock_event_reports_added_cells():
+    tracker = BoardStateTracker(settle_frames=2)
+    board = _stack()
+    _feed(tracker, board, 3)
+
+    locked = board.copy()
+    locked[16:18, 4:6] = 255  # O piece
+    events = _feed(tracker, locked, 5)
+    assert len(events) == 1
+    assert events[0].kind == "lock"
+    assert events[0].cells_added == 4
+    assert events[0].lines_cleared == 0
+    assert np.array_equal(events[0].board, locked)
+
+
+def test_lock_with_line_clear():
+    tracker = BoardStateTracker(settle_frames=2)
+    _feed(tracker, _stack(), 3)
+
+    # vertical I in column 9 completes rows 18-19; rows 16-17 shift down by two
+    cleared = np.zeros((20, 10), dtype=np.uint8)
+    cleared[19, :3] = 255
+    cleared[18:20, 9] = 255
+
+    (event,) = _feed(tracker, cleared, 5)
+    assert event.kind == "lock"
+    assert event.lines_cleared == 2
+    assert event.cells_added == 4
+
+
+def test_clear_after_reported_lock():
+    tracker = BoardStateTracker(settle_frames=2)
+    board = _stack()
+    _feed(tracker, board, 3)
+
+    full = board.copy()
+    full[16:20, 9] = 255  # rows flash before the clear animation ends
+    (lock,) = _feed(tracker, full, 5)
+    assert (lock.kind, lock.lines_cleared) == ("lock", 0)
+
+    after = np.zeros((20, 10), dtype=np.uint8)
+    after[19, :3] = 255
+    after[18:20, 9] = 255
+    (clear,) = _feed(tracker, after, 5)
+    assert (clear.kind, clear.lines_cleared) == ("clear", 2)
+
+
+def test_unexplained_change_is_a_reset():
+    tracker = BoardStateTracker(settle_frames=1)
+    tracker.update(_stack())
+    event = tracker.update(np.zeros((20, 10), dtype=np.uint8))
+    assert event.kind == "reset"
+
+
+def test_rejects_wrong_shape():
+    with pytest.raises(ValueError):
+        BoardStateTracker().update(np.zeros((10, 10)))
@@ -0,0 +1,108 @@
+"""Long-lived capture session and explicit mss cleanup."""
+
+import os
+
+import pytest
+
+import capture
+import dual_capture
+from dual_capture import CaptureSession
+
+
+class _FakeCapture:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeMss:
+    monitors = [
+        {"left": 0, "top": 0, "width": 1920, "height": 1080},
+        {"left": 0, "top": 0, "width": 1920, "height": 1080},
+    ]
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def roi_config(tmp_path, monkeypatch):
+    path = tmp_path / "roi_config.json"
+    path.write_text('{"rois": []}')
+    monkeypatch.setattr(dual_capture, "CONFIG_PATH", path)
+    return path
+
+
+def test_session_reuses_capture_until_config_changes(roi_config):
+    session = CaptureSession(_FakeCapture)
+    first = session.get()
+    assert session.get() is first
+    assert session.builds == 1
+
+    roi_config.write_text('{"rois": [{"name": "player_left_board"}]}')
+    st = roi_config.stat()
+    os.utime(roi_config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = session.get()
+    assert second is not first
+    assert first.closed
+    assert session.builds == 2
+
+
+def test_invalidate_and_context_manager_close(roi_config):
+    with CaptureSession(_FakeCapture) as session:
+        first = session.get()
+        session.invalidate()
+        assert first.closed
+        second = session.get()
+    assert second.closed
+    assert session.capture is None
+
+
+def test_screen_capture_releases_mss_handle(monkeypatch):
+    monkeypatch.setattr(capture.mss, "mss", _FakeMss)
+    with capture.ScreenCapture((0, 0, 100, 100)) as cap:
+        handle = cap.sct
+    assert handle.closed
+    cap.close()  # idempotent
+
+
+class _FakeShot:
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.size = (width, height)
+        self.raw = bytearray(range(256)) * (width * height * 4 // 256)
+        self.rgb = bytes(width * height * 3)
+
+
+def test_bgra_mode_wraps_raw_buffer_without_copy(monkeypatch):
+    shot = _FakeShot(8, 8)
+
+    class _GrabbingMss(_FakeMss):
+        def grab(self, region):
+            return shot
+
+    monkeypatch.setattr(capture.mss, "mss", _GrabbingMss)
+    with capture.ScreenCapture((0, 0, 8, 8), mode="bgra") as cap:
+        pixels = cap.grab()
+    assert pixels.shape == (8, 8, 4)
+    pixels[0, 0, 0] = 42
+    assert shot.raw[0] == 42  # a view, not a copy
+
+    with capture.ScreenCapture((0, 0, 8, 8), mode="gray") as cap:
+        assert cap.grab().shape == (8, 8)
+
+    image = capture.to_pil(pixels)
+    assert image.mode == "RGB" and image.size == (8, 8)
+    assert image.getpixel((0, 0)) == (2, 1, 42)
+
+
+def test_unknown_capture_mode(monkeypatch):
+    monkeypatch.setattr(capture.mss, "mss", _FakeMss)
+    with pytest.raises(ValueError, match="mode"):
+        capture.ScreenCapture((0, 0, 8, 8), mode="rgb")
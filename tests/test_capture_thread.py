@@ -0,0 +1,96 @@
+"""Background capture thread and latest-frame slot."""
+
+import threading
+import time
+
+from capture_thread import CaptureThread, LatestFrameSlot
+
+
+class _FakeCapture:
+    def __init__(self):
+        self.frame = None
+        self.grabs = 0
+
+    def grab(self):
+        self.grabs += 1
+        self.frame = self.grabs
+        return f"left{self.grabs}", f"right{self.grabs}"
+
+
+class _FakeSession:
+    def __init__(self, capture=None, fail_first=0):
+        self.capture = capture or _FakeCapture()
+        self.fail_first = fail_first
+        self.invalidated = 0
+        self.closed = False
+
+    def get(self):
+        if self.fail_first:
+            self.fail_first -= 1
+            raise OSError("grab failed")
+        return self.capture
+
+    def invalidate(self):
+        self.invalidated += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+def test_slot_keeps_latest_and_counts_drops():
+    slot = LatestFrameSlot()
+    assert slot.wait_newer(0, timeout=0.01) is None
+
+    slot.publish("l1", "r1", None)
+    slot.publish("l2", "r2", None)  # frame 1 never read
+    frame = slot.wait_newer(0, timeout=0.01)
+    assert (frame.seq, frame.left) == (2, "l2")
+    assert slot.dropped == 1
+
+    assert slot.wait_newer(frame.seq, timeout=0.01) is None
+    slot.publish("l3", "r3", None)
+    assert slot.dropped == 1  # frame 2 was consumed
+    assert frame.age >= 0
+
+
+def test_wait_newer_blocks_until_publish():
+    slot = LatestFrameSlot()
+    timer = threading.Timer(0.05, slot.publish, args=("l", "r", "frame"))
+    timer.start()
+    started = time.perf_counter()
+    frame = slot.wait_newer(0, timeout=2.0)
+    assert frame is not None and frame.frame == "frame"
+    assert time.perf_counter() - started >= 0.04
+
+
+def test_thread_produces_increasing_frames():
+    session = _FakeSession()
+    with CaptureThread(lambda: session, min_interval=0.001) as thread:
+        first = thread.next_frame(0, timeout=1.0)
+        second = thread.next_frame(first.seq, timeout=1.0)
+        assert second.seq > first.seq
+        assert second.left == f"left{second.frame}"
+    assert not thread.running
+    assert session.closed
+
+
+def test_thread_recovers_from_capture_errors():
+    session = _FakeSession(fail_first=2)
+    with CaptureThread(lambda: session, error_backoff=0.001) as thread:
+        assert thread.next_frame(0, timeout=1.0) is not None
+    assert thread.errors == 2
+    assert session.invalidated == 2
+
+
+def test_pool_is_opt_in():
+    from src.config import AppConfig
+
+    # pooling copies every grab, so the default stays on the zero-copy path
+    assert AppConfig().dxgi_pool_size == 0
+    session = _FakeSession()
+    with CaptureThread(lambda: session, min_interval=0.001) as thread:
+        assert thread.next_frame(0, timeout=1.0).lease is None
+    assert thread.pool is None
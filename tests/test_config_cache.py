@@ -0,0 +1,86 @@
+"""Parse-once config cache and the typed ROI config built on it."""
+
+import json
+import os
+
+import pytest
+
+import dual_roi_manager
+import roi_capture
+from config_cache import FileCache, reload_all
+
+
+def _touch(path, text):
+    """Rewrite ``path`` and bump its mtime so the change is always visible."""
+    old = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, max(st.st_mtime_ns, old + 1_000_000)))
+
+
+@pytest.fixture
+def roi_file(tmp_path, monkeypatch):
+    path = tmp_path / "roi_config.json"
+    monkeypatch.setattr(roi_capture, "CONFIG_PATH", path)
+    monkeypatch.setattr(dual_roi_manager, "CONFIG_PATH", path)
+    reload_all()
+    return path
+
+
+def test_file_is_parsed_once_until_it_changes(tmp_path):
+    path = tmp_path / "data.json"
+    _touch(path, '{"a": 1}')
+    calls = []
+
+    def parse(p):
+        calls.append(p)
+        return json.loads(p.read_text())
+
+    cache = FileCache(path, parse)
+    assert cache.get() == {"a": 1}
+    assert cache.get() == {"a": 1}
+    assert len(calls) == 1
+
+    _touch(path, '{"a": 22}')
+    assert cache.get() == {"a": 22}
+    cache.reload()
+    cache.get()
+    assert len(calls) == 3 == cache.loads
+
+
+def test_missing_file_errors_are_not_cached(roi_file):
+    with pytest.raises(FileNotFoundError):
+        roi_capture.roi_config()
+    _touch(roi_file, json.dumps({"rois": []}))
+    assert roi_capture.load_roi_config() == []
+
+
+def test_roi_config_is_typed_and_validated(roi_file):
+    rois = [
+        {"name": "wins", "rect": ["10", 20, 30, 40]},
+        {"name": "timer", "rect": [1, 2, 3]},
+        {"name": "next_queue", "rect": [[0, 0, 5, 5], [0, 10, 5], [0, 20, 5, 0]]},
+        {"name": "hwnd_only"},
+    ]
+    _touch(roi_file, json.dumps({"rois": rois}))
+
+    config = roi_capture.roi_config()
+    assert config.rects == {"wins": (10, 20, 30, 40)}
+    assert config.slots == {"next_queue": ((0, 0, 5, 5), (0, 20, 5, 0))}
+    assert config.invalid == {"timer"}
+    assert config.flat == ((10, 20, 30, 40), (0, 0, 5, 5))
+    assert roi_capture.roi_config() is config  # cached
+    assert [entry["name"] for entry in roi_capture.load_roi_config()] == [r["name"] for r in rois]
+
+
+def test_board_pair_is_cached_and_reloaded_on_save(roi_file):
+    rois = [
+        {"name": "player_left_board", "rect": [0, 0, 100, 200]},
+        {"name": "player_right_board", "rect": [300, 0, 100, 200]},
+    ]
+    _touch(roi_file, json.dumps({"rois": rois}))
+    assert dual_roi_manager.roi_pair() == ((0, 0, 100, 200), (300, 0, 100, 200))
+    assert dual_roi_manager.load_config()["roi"] == [[0, 0, 100, 200], [300, 0, 100, 200]]
+
+    _touch(roi_file, json.dumps({"rois": rois[:1]}))
+    assert dual_roi_manager.roi_pair() == ()
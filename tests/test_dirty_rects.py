@@ -0,0 +1,71 @@
+"""Dirty-rectangle presentation of the overlay scene."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from src.dirty_rects import DirtyRectRenderer
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.Surface((200, 100), pygame.SRCALPHA)
+    pygame.quit()
+
+
+def _sprite(colour, size=(10, 10)):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(colour)
+    return surface
+
+
+def _present(renderer, screen):
+    updates = []
+    renderer.present(screen, update=updates.append)
+    return [list(map(tuple, rects)) for rects in updates]
+
+
+def test_unchanged_scene_is_not_presented(screen):
+    renderer = DirtyRectRenderer()
+    ghost = _sprite((255, 255, 255, 128))
+
+    renderer.blit("ghost", ghost, (20, 30))
+    assert _present(renderer, screen) == [[(20, 30, 10, 10)]]
+    assert tuple(screen.get_at((25, 35))) == (255, 255, 255, 128)
+
+    renderer.blit("ghost", ghost, (20, 30))
+    assert _present(renderer, screen) == []
+    assert renderer.stats() == {"presented": 1, "skipped": 1}
+
+
+def test_moved_and_removed_items_are_erased(screen):
+    renderer = DirtyRectRenderer()
+    ghost, label = _sprite((0, 255, 0, 255)), _sprite((255, 0, 0, 255), (30, 8))
+    renderer.blit("ghost", ghost, (0, 0))
+    renderer.blit("label", label, (100, 50))
+    _present(renderer, screen)
+
+    renderer.blit("ghost", ghost, (40, 0))  # moved, label gone
+    assert _present(renderer, screen) == [[(0, 0, 10, 10), (100, 50, 30, 8), (40, 0, 10, 10)]]
+    assert screen.get_at((5, 5)).a == 0
+    assert screen.get_at((110, 52)).a == 0
+    assert tuple(screen.get_at((45, 5))) == (0, 255, 0, 255)
+
+
+def test_token_detects_changed_content_and_invalidate_redraws(screen):
+    renderer = DirtyRectRenderer()
+    renderer.blit("fps", _sprite((1, 1, 1, 255)), (0, 0), token="FPS: 30.0")
+    _present(renderer, screen)
+    # a freshly rendered surface with the same text is not dirty
+    renderer.blit("fps", _sprite((1, 1, 1, 255)), (0, 0), token="FPS: 30.0")
+    assert _present(renderer, screen) == []
+    renderer.blit("fps", _sprite((2, 2, 2, 255)), (0, 0), token="FPS: 29.5")
+    assert _present(renderer, screen) == [[(0, 0, 10, 10), (0, 0, 10, 10)]]
+
+    renderer.invalidate()
+    renderer.blit("fps", _sprite((2, 2, 2, 255)), (0, 0), token="FPS: 29.5")
+    assert _present(renderer, screen) == [[(0, 0, 10, 10)]]
@@ -0,0 +1,65 @@
+"""Transposition table in front of the Dellacherie board evaluation."""
+
+import numpy as np
+import pytest
+
+from src.agents import bitboard
+from src.agents.eval_cache import EvalCache
+from src.agents.prediction_agent_dellacherie import PredictionAgent
+
+
+def test_lru_eviction_and_hit_rate():
+    cache = EvalCache(max_entries=2)
+    cache.put(1, 1.0)
+    cache.put(2, 2.0)
+    assert cache.get(1) == 1.0  # 1 is now most recently used
+    cache.put(3, 3.0)  # evicts 2
+    assert 2 not in cache
+    assert cache.get(2) is None
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.hit_rate == pytest.approx(0.5)
+
+
+def test_memory_accounting_tracks_entries():
+    cache = EvalCache(max_entries=10)
+    assert cache.memory_bytes == 0
+    cache.put(bitboard.pack([1] * 20), 0.5)
+    one = cache.memory_bytes
+    assert one > 0
+    cache.put(bitboard.pack([1] * 20), 0.25)  # refresh does not grow
+    assert cache.memory_bytes == one
+    for i in range(20):
+        cache.put(i, float(i))
+    assert len(cache) == 10
+    assert cache.stats()["memory_bytes"] == cache.memory_bytes
+    cache.get("missing")
+    cache.clear()
+    assert cache.memory_bytes == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+def test_pack_is_unique_per_board():
+    empty = bitboard.from_array(np.zeros((20, 10), dtype=np.uint8))
+    top = list(empty)
+    top[0] = 1
+    bottom = list(empty)
+    bottom[19] = 1
+    assert len({bitboard.pack(empty), bitboard.pack(top), bitboard.pack(bottom)}) == 3
+
+
+def test_agent_reuses_evaluations_and_moves():
+    board = np.zeros((20, 10), dtype=np.uint8)
+    board[17:, :4] = 255
+    agent = PredictionAgent()
+
+    first = agent.handle({"board": board, "piece": "L", "orientation": 0})
+    misses = agent.eval_cache.misses
+    second = agent.handle({"board": board, "piece": "L", "orientation": 0})
+
+    assert second == first
+    assert agent.eval_cache.misses == misses  # nothing re-evaluated
+    assert agent.move_cache.hits == 1
+    stats = agent.cache_stats()
+    assert stats["eval"]["entries"] > 0
+    assert stats["moves"]["hit_rate"] == pytest.approx(0.5)
@@ -0,0 +1,109 @@
+"""Tests for the single-grab frame bus."""
+
+import numpy as np
+import pytest
+
+from frame_bus import BusFrame, roi_rects, union_rect
+from next_queue_capture import capture_next_queue
+from piece_detector import detect_piece_from_image
+
+
+def _bus_frame_for_config():
+    left, top, width, height = union_rect(roi_rects())
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    return BusFrame(pixels, (left, top))
+
+
+def test_roi_rects_flattens_queue_slots(tmp_path, monkeypatch):
+    _write_rois(tmp_path, monkeypatch, [
+        {"name": "player_left_board", "rect": [10, 20, 30, 40]},
+        {"name": "next_queue", "rect": [[0, 0, 5, 5], [0, 10, 5, 5]]},
+        {"name": "broken", "rect": [1, 2, 3]},
+    ])
+    assert roi_rects() == [(10, 20, 30, 40), (0, 0, 5, 5), (0, 10, 5, 5)]
+
+
+def test_union_rect():
+    assert union_rect([(10, 20, 30, 40), (0, 50, 5, 20)]) == (0, 20, 40, 50)
+    with pytest.raises(ValueError):
+        union_rect([])
+
+
+def test_bus_frame_views_share_memory():
+    pixels = np.arange(100 * 200 * 4, dtype=np.uint32).astype(np.uint8).reshape(100, 200, 4)
+    frame = BusFrame(pixels, (500, 300))
+
+    view = frame.view((510, 320, 40, 30))
+    assert view.shape == (30, 40, 4)
+    assert np.shares_memory(view, pixels)
+    assert np.array_equal(view, pixels[20:50, 10:50])
+
+    # PIL-style crop boxes are clipped to the grabbed area
+    assert frame.crop((450, 250, 520, 310)).shape == (10, 20, 4)
+    assert frame.size == (200, 100)
+
+
+def test_queue_consumer_reads_bus_frame():
+    frame = _bus_frame_for_config()
+    images = capture_next_queue(frame)
+
+    assert len(images) == 4
+    assert all(np.shares_memory(img, frame.pixels) for img in images)
+
+
+def test_piece_detector_accepts_bgra_view():
+    view = np.zeros((30, 20, 4), dtype=np.uint8)
+    view[..., :3] = (100, 100, 255)  # "I" template colour, already BGR
+    assert detect_piece_from_image(view) == "I"
+
+
+def _write_rois(tmp_path, monkeypatch, rois):
+    import json
+
+    import roi_capture
+
+    path = tmp_path / "roi_config.json"
+    path.write_text(json.dumps({"rois": rois}))
+    monkeypatch.setattr(roi_capture, "CONFIG_PATH", path)
+    return roi_capture
+
+
+def test_queue_capture_selects_side(tmp_path, monkeypatch):
+    # the layout roi_calibrator saves: numbered slots per side, in any order
+    roi_capture = _write_rois(tmp_path, monkeypatch, [
+        {"name": "left_next_queue_slot_1", "rect": [0, 0, 5, 5]},
+        {"name": "right_next_queue_slot_2", "rect": [10, 10, 5, 5]},
+        {"name": "right_next_queue_slot_1", "rect": [10, 0, 5, 5]},
+    ])
+    frame = BusFrame(np.zeros((20, 20, 4), dtype=np.uint8), (0, 0))
+
+    assert roi_capture.roi_config().queues == {
+        "left": ((0, 0, 5, 5),),
+        "right": ((10, 0, 5, 5), (10, 10, 5, 5)),
+    }
+    assert len(capture_next_queue(frame)) == 1
+    assert len(capture_next_queue(frame, side="right")) == 2
+    with pytest.raises(ValueError):
+        capture_next_queue(frame, side="middle")
+
+
+def test_legacy_queue_list_is_the_left_queue(tmp_path, monkeypatch):
+    _write_rois(tmp_path, monkeypatch, [{"name": "next_queue", "rect": [[0, 0, 5, 5], [0, 10, 5, 5]]}])
+    frame = BusFrame(np.zeros((20, 20, 4), dtype=np.uint8), (0, 0))
+    assert len(capture_next_queue(frame)) == 2
+    with pytest.raises(KeyError):
+        capture_next_queue(frame, side="right")
+
+
+def test_calibrated_right_queue_yields_the_opponent_piece(tmp_path, monkeypatch):
+    from piece_detector import get_current_piece
+
+    _write_rois(tmp_path, monkeypatch, [
+        {"name": "right_next_queue_slot_1", "rect": [40, 0, 20, 30]},
+        {"name": "right_next_queue_slot_2", "rect": [40, 30, 20, 30]},
+    ])
+    pixels = np.zeros((60, 60, 4), dtype=np.uint8)
+    pixels[0:30, 40:60, :3] = (100, 100, 255)  # "I" in the first opponent slot
+    frame = BusFrame(pixels, (0, 0))
+
+    assert get_current_piece(capture_next_queue(frame, side="right")) == "I"
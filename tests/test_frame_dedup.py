@@ -0,0 +1,78 @@
+"""Per-ROI fingerprints and result reuse for unchanged frames."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import numpy as np
+from PIL import Image
+
+from frame_dedup import FrameDeduper, fingerprint
+from performance_monitor import PerformanceMonitor
+
+
+def _roi():
+    roi = np.zeros((320, 160, 4), dtype=np.uint8)
+    roi[300:, :] = 200
+    return roi
+
+
+def test_fingerprint_tracks_content_and_shape():
+    roi = _roi()
+    assert fingerprint(roi) == fingerprint(roi.copy())
+
+    moved = roi.copy()
+    moved[100:116, 48:64] = 255  # one 16px cell appears
+    assert fingerprint(moved) != fingerprint(roi)
+
+    assert fingerprint(np.zeros((8, 8))) != fingerprint(np.zeros((8, 16)))
+    assert fingerprint(Image.new("RGB", (16, 16))) is not None
+    assert fingerprint([roi, moved]) != fingerprint([moved, roi])
+    assert fingerprint(Mock()) is None
+
+
+def test_unchanged_roi_reuses_result_and_reports_ratio():
+    monitor = PerformanceMonitor()
+    dedup = FrameDeduper(monitor=monitor)
+    compute = Mock(side_effect=lambda img: int(img.sum()))
+
+    roi = _roi()
+    first = dedup.get_or_compute("left_board", roi, compute)
+    again = dedup.get_or_compute("left_board", roi.copy(), compute)
+    assert again == first
+    assert compute.call_count == 1
+
+    changed = roi.copy()
+    changed[0:16, 0:16] = 255
+    dedup.get_or_compute("left_board", changed, compute)
+    assert compute.call_count == 2
+
+    assert dedup.hit_ratio == monitor.dedup_hit_ratio == 1 / 3
+    monitor.end_frame()
+    assert monitor.get_stats()["dedup_hit_ratio"] == 1 / 3
+
+
+def test_non_pixel_input_is_always_recomputed():
+    dedup = FrameDeduper()
+    compute = Mock(return_value="board")
+    fake = Mock()
+    dedup.get_or_compute("left_board", fake, compute)
+    dedup.get_or_compute("left_board", fake, compute)
+    assert compute.call_count == 2
+
+
+def test_rois_can_be_deduplicated_from_several_threads():
+    monitor = PerformanceMonitor()
+    dedup = FrameDeduper(monitor=monitor)
+    left, right = _roi(), _roi()
+    right[:8] = 255
+
+    def analyse(name, roi):
+        return [dedup.get_or_compute(name, roi, lambda img: int(img.sum())) for _ in range(200)]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(analyse, ["left_board", "right_board"], [left, right]))
+
+    assert results[0] == [int(left.sum())] * 200
+    assert results[1] == [int(right.sum())] * 200
+    assert dedup.hits + dedup.misses == monitor.dedup_lookups == 400
+    assert dedup.misses == 2
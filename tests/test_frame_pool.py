@@ -0,0 +1,104 @@
+"""Preallocated frame buffer pool and its use by the capture thread."""
+
+import gc
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from capture_thread import CaptureThread
+from frame_pool import FramePool, PoolExhausted
+
+
+def test_acquire_release_cycles_through_fixed_buffers():
+    pool = FramePool(2, (4, 4, 4))
+    seen = set()
+    for _ in range(10):
+        with pool.acquire() as lease:
+            seen.add(id(lease.array))
+    assert len(seen) == 2
+    assert pool.stats()["allocations"] == 2
+    assert pool.available == 2
+
+
+def test_exhaustion_names_the_holders():
+    pool = FramePool(1, (2, 2))
+    held = pool.acquire()
+    with pytest.raises(PoolExhausted, match="MainThread"):
+        pool.acquire(timeout=0.01)
+    assert pool.exhausted == 1
+    held.release()
+    held.release()  # idempotent
+    assert pool.available == 1
+
+
+def test_dropped_lease_is_reported_and_reclaimed(caplog):
+    pool = FramePool(1, (2, 2))
+    lease = pool.acquire()
+    assert pool.check_leaks(max_age=0.0) == [lease]
+    del lease
+    gc.collect()
+    assert pool.leaked == 1
+    assert pool.available == 1
+    assert "never released" in caplog.text
+
+
+def test_steady_state_reuses_memory():
+    pool = FramePool(3, (120, 160, 4))
+    source = np.full((120, 160, 4), 7, dtype=np.uint8)
+    for _ in range(5):  # warm up
+        with pool.acquire() as lease:
+            np.copyto(lease.array, source)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(200):
+        with pool.acquire() as lease:
+            np.copyto(lease.array, source)
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert growth < source.nbytes  # not even one frame's worth
+
+
+class _PooledCapture:
+    frame_shape = (6, 8, 4)
+
+    def __init__(self):
+        self.frame = None
+        self.count = 0
+
+    def grab(self, out=None):
+        self.count += 1
+        out[...] = self.count % 256
+        self.frame = out
+        return out[:, :4], out[:, 4:]
+
+
+class _Session:
+    def __init__(self):
+        self.capture = _PooledCapture()
+
+    def get(self):
+        return self.capture
+
+    def invalidate(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def test_capture_thread_writes_into_pool():
+    with CaptureThread(_Session, pool_size=3) as thread:
+        seq = 0
+        for _ in range(20):
+            frame = thread.next_frame(seq, timeout=1.0)
+            seq = frame.seq
+            assert frame.left.base is not None
+            frame.release()
+        pool = thread.pool
+    assert pool.allocations == 3
+    assert thread.slot.published >= 20
+    assert pool.leaked == 0
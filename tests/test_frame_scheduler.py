@@ -0,0 +1,77 @@
+"""Deadline-driven frame scheduler (driven by a fake clock)."""
+
+import pytest
+
+from frame_scheduler import FrameScheduler
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def _scheduler(clock, **kwargs):
+    return FrameScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_cadence_does_not_drift():
+    clock = _FakeClock()
+    scheduler = _scheduler(clock, target_fps=50)
+    starts = []
+
+    def step():
+        starts.append(clock.now)
+        clock.now += 0.003
+
+    scheduler.run(step, max_ticks=100)
+    assert starts[-1] == pytest.approx(99 * 0.02)
+    assert scheduler.missed == 0
+
+
+def test_overrun_skips_slots_instead_of_bursting():
+    clock = _FakeClock()
+    scheduler = _scheduler(clock, target_fps=50, min_fps=50)
+    costs = iter([0.005, 0.065, 0.005, 0.005])
+    starts = []
+
+    def step():
+        starts.append(clock.now)
+        clock.now += next(costs)
+
+    scheduler.run(step, max_ticks=4)
+    assert scheduler.missed == 1
+    assert scheduler.skipped == 3
+    # after the overrun the loop resumes on the 20 ms grid
+    assert starts == pytest.approx([0.0, 0.02, 0.1, 0.12])
+
+
+def test_period_stretches_under_load_and_recovers():
+    clock = _FakeClock()
+    changes = []
+    scheduler = _scheduler(clock, target_fps=60, min_fps=20, on_period_change=changes.append)
+    cost = {"value": 0.030}
+
+    def step():
+        clock.now += cost["value"]
+
+    scheduler.run(step, max_ticks=50)
+    assert scheduler.effective_fps == pytest.approx(1 / 0.036, rel=0.1)
+    assert changes
+
+    cost["value"] = 0.002
+    scheduler.run(step, max_ticks=150)
+    assert scheduler.period == pytest.approx(1 / 60)
+    assert scheduler.stats()["ticks"] == 150
+
+
+def test_rejects_bad_rates():
+    with pytest.raises(ValueError):
+        FrameScheduler(target_fps=30, min_fps=60)
@@ -0,0 +1,72 @@
+"""Whole-piece ghost sprites placed on the calibrated board grid."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from overlay_renderer import BoardGeometry, OverlayRenderer
+from src.agents.prediction_agent_dellacherie import PIECE_SHAPES, PredictionAgent
+
+
+@pytest.fixture
+def renderer():
+    pygame.init()
+    renderer = OverlayRenderer()
+    renderer.use_dirty_rects = False
+    yield renderer
+    pygame.quit()
+
+
+def test_geometry_is_precomputed_from_the_roi():
+    geometry = BoardGeometry.from_rect((674, 373, 153, 332), offset=(600, 300))
+    assert geometry.origin == (74, 73)
+    assert geometry.cell == (15, 17)
+    # edges are rounded from the exact 15.3 x 16.6 px cell, so the grid does not drift
+    assert geometry.xs[9] == 138 and geometry.ys[19] == 315
+    assert geometry.cell_pos(9, 19) == (74 + 138, 73 + 315)
+
+
+def test_ghost_is_drawn_as_one_sprite_at_the_landing_row(renderer):
+    renderer.set_board_geometry("left", (0, 0, 100, 200))
+    surface = pygame.Surface((100, 200), pygame.SRCALPHA)
+    colour = (0, 255, 0, 200)
+
+    renderer.draw_ghost(surface, column=4, rotation=0, piece_type="T", row=10, colour=colour)
+
+    sprite = renderer.assets.ghost_sprite("T", 0, (10, 10), colour)
+    assert renderer.assets.ghost_sprite("T", 0, (10, 10), colour) is sprite
+    assert sprite.get_size() == (30, 20)
+    # T rotation 0 is the flat side up: (0,0) (1,0) (2,0) (1,1)
+    painted = {
+        (x // 10, y // 10)
+        for x in range(0, 100, 10)
+        for y in range(0, 200, 10)
+        if surface.get_at((x + 5, y + 5)).a
+    }
+    assert painted == {(4, 10), (5, 10), (6, 10), (5, 11)}
+
+
+def test_ghost_without_a_row_rests_on_the_floor(renderer):
+    renderer.set_board_geometry("left", (0, 0, 100, 200))
+    surface = pygame.Surface((100, 200), pygame.SRCALPHA)
+    renderer.draw_ghost(surface, column=0, rotation=1, piece_type="I")
+    assert surface.get_at((5, 165)).a and surface.get_at((5, 195)).a
+    assert not surface.get_at((5, 155)).a
+
+
+def test_prediction_reports_the_landing_row():
+    board = np.zeros((20, 10), dtype=np.uint8)
+    board[14:, 1:] = 255  # stack with a well in column 0
+    pred = PredictionAgent(lookahead_depth=0).handle({"board": board, "piece": "I", "orientation": 0})
+
+    cells = [
+        (pred["target_col"] + x, pred["target_row"] + y)
+        for x, y in PIECE_SHAPES["I"][pred["target_rot"]]
+    ]
+    assert all(board[y, x] == 0 for x, y in cells)
+    # resting: one step lower would hit the stack or the floor
+    assert any(y + 1 == 20 or board[y + 1, x] for x, y in cells)
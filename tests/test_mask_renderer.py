@@ -0,0 +1,46 @@
+"""Board mask drawn as one scaled surface."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from src.mask_renderer import MaskRenderer
+
+
+@pytest.fixture(autouse=True)
+def _pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_occupied_cells_are_scaled_to_whole_cells():
+    mask = np.zeros((20, 10), dtype=np.uint8)
+    mask[19, 0] = 255
+    mask[0, 9] = 255
+    overlay = MaskRenderer((255, 255, 255, 120)).render(mask, 8)
+
+    assert overlay.get_size() == (80, 160)
+    assert tuple(overlay.get_at((0, 152))) == (255, 255, 255, 120)
+    assert tuple(overlay.get_at((7, 159))) == (255, 255, 255, 120)
+    assert overlay.get_at((8, 152)).a == 0  # neighbouring cell stays clear
+    assert overlay.get_at((79, 0)).a == 120
+    assert overlay.get_at((40, 80)).a == 0
+
+
+def test_surfaces_are_reused_and_cleared_between_frames():
+    renderer = MaskRenderer()
+    full = np.full((20, 10), 255, dtype=np.uint8)
+    first = renderer.render(full, 4)
+    assert first.get_at((20, 40)).a == 120
+
+    second = renderer.render(np.zeros_like(full), 4)
+    assert second is first
+    assert second.get_at((20, 40)).a == 0
+
+    assert renderer.render(full, 6) is not first  # new cell size, new destination
+    assert renderer.rendered == 3
@@ -0,0 +1,132 @@
+"""Staged pipeline runtime and bounded queue drop policies."""
+
+import queue
+import threading
+
+import pytest
+
+from src.pipeline import BLOCK, DROP_NEWEST, DROP_OLDEST, BoundedQueue, Pipeline
+
+
+def _drain(q):
+    items = []
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
+
+
+def test_drop_oldest_keeps_newest_and_reports_drops():
+    dropped = []
+    q = BoundedQueue(2, DROP_OLDEST, on_drop=dropped.append)
+    assert all(q.offer(i) for i in range(4))
+    assert _drain(q) == [2, 3]
+    assert dropped == [0, 1]
+    assert q.dropped == 2
+
+
+def test_drop_newest_rejects_the_offered_item():
+    q = BoundedQueue(1, DROP_NEWEST)
+    assert q.offer("a")
+    assert not q.offer("b")
+    assert _drain(q) == ["a"]
+    assert q.dropped == 1
+
+
+def test_block_waits_for_space_and_gives_up_on_stop():
+    q = BoundedQueue(1, BLOCK)
+    q.offer(1)
+    threading.Timer(0.05, q.get).start()
+    assert q.offer(2, poll=0.01)  # unblocked by the consumer
+    assert _drain(q) == [2]
+
+    q.offer(3)
+    stop = threading.Event()
+    stop.set()
+    assert not q.offer(4, stop=stop)
+    assert q.dropped == 1
+
+
+def test_invalid_queue_arguments():
+    with pytest.raises(ValueError):
+        BoundedQueue(0)
+    with pytest.raises(ValueError):
+        BoundedQueue(1, "lifo")
+
+
+def test_stages_chain_source_to_sink():
+    counter = iter(range(1000))
+    seen = []
+    done = threading.Event()
+
+    def source():
+        return next(counter)
+
+    def sink(item):
+        seen.append(item)
+        if len(seen) >= 5:
+            done.set()
+
+    pipeline = Pipeline("test")
+    pipeline.stage("source", source, policy=BLOCK)
+    pipeline.stage("double", lambda x: x * 2, policy=BLOCK)
+    pipeline.stage("filter", lambda x: x if x % 4 == 0 else None, policy=BLOCK)
+    pipeline.stage("sink", sink)
+
+    with pipeline:
+        assert done.wait(2.0)
+    assert not pipeline.running
+    # back-pressure end to end: no gaps, order preserved (an item blocked at
+    # shutdown may be dropped, so only what reached the sink is checked)
+    assert seen == list(range(0, 4 * len(seen), 4))
+    assert len(seen) >= 5
+    stats = pipeline.stats()
+    assert list(stats) == ["source", "double", "filter", "sink"]
+    assert stats["double"]["processed"] >= 5
+
+
+def test_stage_errors_are_counted_not_fatal():
+    values = iter([1, 0, 2])
+
+    def source():
+        try:
+            return next(values)
+        except StopIteration:
+            return None
+
+    pipeline = Pipeline("errors")
+    pipeline.stage("source", source, policy=BLOCK)
+    pipeline.stage("invert", lambda x: 1 / x, outbox=BoundedQueue(10, BLOCK))
+    pipeline.start()
+    try:
+        assert pipeline.output.get(timeout=1.0) == 1.0
+        assert pipeline.output.get(timeout=1.0) == 0.5
+    finally:
+        pipeline.stop()
+    assert pipeline.stats()["invert"]["errors"] == 1
+
+
+def test_cannot_add_stages_while_running():
+    pipeline = Pipeline("running")
+    pipeline.stage("source", lambda: None, interval=0.01)
+    with pipeline:
+        with pytest.raises(RuntimeError):
+            pipeline.stage("late", lambda x: x)
+
+
+def test_a_stage_can_stop_its_own_pipeline():
+    calls = []
+    pipeline = Pipeline("self_stop")
+
+    def tick():
+        calls.append(1)
+        if len(calls) == 3:
+            pipeline.request_stop()
+
+    pipeline.stage("tick", tick, interval=0.001)
+    pipeline.start()
+    for stage in pipeline.stages:
+        stage.join(2.0)
+    assert not pipeline.running
+    assert len(calls) == 3
@@ -0,0 +1,142 @@
+"""Out-of-process prediction backend."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.agents.prediction_backend import (
+    ProcessPredictionBackend,
+    load_prediction_agent,
+    make_prediction_backend,
+    pack_board,
+    unpack_board,
+)
+
+
+def _board():
+    board = np.zeros((20, 10), dtype=np.uint8)
+    board[15:, :] = 255
+    board[15:, 4] = 0
+    board[12, 7] = 1  # any non-zero value counts as a block
+    return board
+
+
+def test_board_payload_round_trip():
+    board = _board()
+    shape, payload = pack_board(board)
+    assert len(payload) == 25
+    restored = unpack_board(shape, payload)
+    np.testing.assert_array_equal(restored, np.where(board > 0, 255, 0))
+
+
+def test_inline_backend_is_the_agent():
+    agent = make_prediction_backend("mock", "inline")
+    assert type(agent) is type(load_prediction_agent("mock"))
+    with pytest.raises(ValueError):
+        make_prediction_backend("mock", "threads")
+    with pytest.raises(ValueError):
+        ProcessPredictionBackend("nope")
+
+
+def test_process_backend_matches_inline_agent():
+    params = {"board": _board(), "piece": "T", "orientation": 0}
+    expected = load_prediction_agent("dellacherie").handle(dict(params))
+
+    with ProcessPredictionBackend("dellacherie", timeout_ms=5000) as backend:
+        assert backend.running
+        assert backend.handle(dict(params)) == expected
+        stats = backend.stats()
+    assert stats["completed"] == 1
+    assert not backend.running
+
+
+def test_timed_out_answers_are_discarded():
+    params = {"board": _board(), "piece": "I", "orientation": 0}
+    with ProcessPredictionBackend("mock", timeout_ms=0) as backend:
+        with pytest.raises(TimeoutError):
+            backend.handle(params)
+        backend.timeout_ms = 5000
+        assert backend.handle(params)["target_col"] == 0
+        stats = backend.stats()
+    assert stats["requests"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["completed"] == 1
+
+
+def _wait_until(predicate, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_worker_is_restarted_in_the_background():
+    params = {"board": _board(), "piece": "O", "orientation": 0}
+    with ProcessPredictionBackend("mock", timeout_ms=5000) as backend:
+        backend._process.kill()
+        backend._process.join()
+
+        # the caller is refused at once instead of waiting for the spawn
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            backend.handle(params)
+        assert time.perf_counter() - start < 0.5
+        assert backend.stats()["restarts"] == 1
+
+        _wait_until(lambda: backend.running)
+        assert backend.handle(params)["target_rot"] == 0
+        assert backend.stats()["unavailable"] == 1
+
+
+def test_handle_never_spawns_on_the_calling_thread():
+    backend = ProcessPredictionBackend("mock", timeout_ms=5000)
+    try:
+        with pytest.raises(TimeoutError):
+            backend.handle({"board": _board(), "piece": "T", "orientation": 0})
+        _wait_until(lambda: backend.running)
+    finally:
+        backend.stop()
+    assert not backend.running
+
+
+def test_failed_start_is_reported_and_retried_later():
+    backend = ProcessPredictionBackend("onnx", retry_interval=60.0)
+    with pytest.raises(RuntimeError, match="could not load onnx"):
+        backend.start()
+    with pytest.raises(TimeoutError):
+        backend.handle({"board": _board(), "piece": "T", "orientation": 0})
+    assert not backend.starting  # no respawn before retry_interval
+    backend.stop()
+
+
+def test_script_entrypoint_starts_the_worker_under_main_guard(tmp_path):
+    # spawn re-runs the script as __mp_main__ in the worker: the module level
+    # runs twice, the guarded block (like run_overlay_core's) only once
+    marker = tmp_path / "imports.txt"
+    script = tmp_path / "entrypoint.py"
+    script.write_text(textwrap.dedent(f"""
+        import numpy as np
+        from src.agents.prediction_backend import ProcessPredictionBackend
+
+        with open({str(marker)!r}, "a") as f:
+            f.write(__name__ + "\\n")
+
+        if __name__ == "__main__":
+            with ProcessPredictionBackend("mock", timeout_ms=5000) as backend:
+                board = np.zeros((20, 10), dtype=np.uint8)
+                print(backend.handle({{"board": board, "piece": "T", "orientation": 0}})["target_rot"])
+    """))
+    repo = Path(__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(repo), os.environ.get("PYTHONPATH", "")])}
+    result = subprocess.run(
+        [sys.executable, str(script)], cwd=repo, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split()[-1] == "0"
+    assert marker.read_text().split() == ["__main__", "__mp_main__"]
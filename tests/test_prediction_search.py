@@ -0,0 +1,107 @@
+"""Full rotation × column search for the Dellacherie agent."""
+
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+from src.agents import bitboard
+from src.agents.prediction_agent_dellacherie import (
+    PIECE_MASKS,
+    PIECE_SHAPES,
+    PLACEMENTS,
+    SEARCH_BUDGET_US,
+    W_BUMPINESS,
+    W_HEIGHT,
+    W_HOLES,
+    W_LINES,
+    W_WELL_DEPTH,
+    PredictionAgent,
+    special_bonus,
+)
+
+
+def _random_board(rng, max_height=12):
+    board = np.zeros((20, 10), dtype=np.uint8)
+    for col in range(10):
+        board[20 - rng.integers(0, max_height):, col] = 255
+    board[rng.random((20, 10)) < 0.15] = 0
+    return board
+
+
+def _reference_score(board, lines_cleared):
+    """Unbatched, uncached Dellacherie score straight from the board metrics."""
+    agg_h, holes, bumpiness, well = bitboard.board_metrics(board)
+    shape = W_HEIGHT * agg_h + W_HOLES * holes + W_BUMPINESS * bumpiness + W_WELL_DEPTH * well
+    return shape + W_LINES * lines_cleared
+
+
+def test_placement_table_covers_unique_rotations():
+    counts = {piece: len(table) for piece, table in PLACEMENTS.items()}
+    assert counts == {"I": 17, "O": 9, "T": 34, "S": 17, "Z": 17, "J": 34, "L": 34}
+    for piece, table in PLACEMENTS.items():
+        for col, rot, mask in table:
+            assert mask is PIECE_MASKS[piece][rot]
+            assert 0 <= col <= bitboard.BOARD_COLS - mask.width
+
+
+def test_every_rotation_reaches_both_walls():
+    for piece, rotations in PIECE_SHAPES.items():
+        for rot, shape in enumerate(rotations):
+            columns = {
+                col + x
+                for col, r, _ in PLACEMENTS[piece]
+                if PIECE_MASKS[piece][r] == PIECE_MASKS[piece][rot]
+                for x, _ in shape
+            }
+            assert min(columns) == 0 and max(columns) == bitboard.BOARD_COLS - 1, (piece, rot)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_landing_row_matches_drop(seed):
+    rows = bitboard.from_array(_random_board(np.random.default_rng(seed), max_height=21))
+    tops = bitboard.column_tops(rows)
+    for table in PLACEMENTS.values():
+        for col, _, mask in table:
+            assert bitboard.landing_row(tops, mask, col) == bitboard.drop_row(rows, mask, col)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_search_returns_best_of_all_rotations(seed):
+    rows = bitboard.from_array(_random_board(np.random.default_rng(seed)))
+    agent = PredictionAgent()
+    state = (4, False, 2)
+    for piece, rotations in PIECE_SHAPES.items():
+        best_score = -float("inf")
+        for rot in range(len(rotations)):
+            mask = PIECE_MASKS[piece][rot]
+            for col in range(10 - mask.width + 1):
+                landed, lines, tspin = agent._drop_piece(rows, mask, col, piece)
+                score = _reference_score(landed, lines) + special_bonus(state, lines, tspin)[0]
+                best_score = max(best_score, score)
+        assert agent.search(rows, piece, state).score == pytest.approx(best_score)
+
+
+def test_handle_finds_rotated_tetris():
+    board = np.full((20, 10), 255, dtype=np.uint8)
+    board[:16, :] = 0
+    board[16:, 9] = 0  # four-deep well on the right
+    agent = PredictionAgent()
+    pred = agent.handle({"board": board, "piece": "I", "orientation": 0})
+    assert (pred["target_col"], pred["target_rot"]) == (9, 1)
+    assert pred["combo"] == 1
+
+
+def test_search_stays_within_budget():
+    rng = np.random.default_rng(7)
+    boards = [bitboard.from_array(_random_board(rng)) for _ in range(20)]
+    agent = PredictionAgent()
+    state = agent.state
+    timings = []
+    for rows in boards:
+        for piece in PIECE_SHAPES:
+            start = time.perf_counter()
+            agent.search(rows, piece, state)
+            timings.append((time.perf_counter() - start) * 1e6)
+    assert statistics.median(timings) < SEARCH_BUDGET_US
@@ -0,0 +1,59 @@
+"""Font / text / sprite cache used by the overlay renderers."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from src.render_assets import RenderAssets
+
+SHAPES = {
+    "O": [[(0, 0), (1, 0), (0, 1), (1, 1)]],
+    "L": [[(2, 0), (0, 1), (1, 1), (2, 1)], [(1, 0), (1, 1), (1, 2), (2, 2)]],
+}
+
+
+@pytest.fixture(autouse=True)
+def _pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_fonts_and_labels_are_built_once():
+    assets = RenderAssets()
+    assert assets.font(20) is assets.font(20)
+    assert assets.font(20) is not assets.font(24)
+
+    first = assets.text("B2B", 20, (255, 255, 255))
+    assert assets.text("B2B", 20, (255, 255, 255)) is first
+    assert assets.text("B2B", 20, (255, 0, 0)) is not first
+    assert (assets.text_hits, assets.text_misses) == (1, 2)
+
+
+def test_text_cache_is_bounded():
+    assets = RenderAssets(max_text=2)
+    for label in ("a", "b", "c"):
+        assets.text(label, 20, (0, 0, 0))
+    assert assets.stats()["text"] == 2
+    assets.text("a", 20, (0, 0, 0))
+    assert assets.text_misses == 4  # "a" was evicted
+
+
+def test_ghost_sprites_follow_the_style():
+    assets = RenderAssets(SHAPES)
+    colour = (0, 255, 0, 128)
+    assets.prebuild_ghosts(10, colour)
+    assert assets.stats()["sprites"] == 3
+
+    sprite = assets.ghost_sprite("L", 1, 10, colour)
+    assert sprite is assets.ghost_sprite("L", 3, 10, colour)  # rotation wraps
+    assert sprite.get_size() == (30, 30)
+    assert tuple(sprite.get_at((15, 5))) == colour  # occupied cell, undarkened
+    assert sprite.get_at((5, 5)).a == 0  # empty cell stays transparent
+
+    assets.clear_sprites()
+    assert assets.stats()["sprites"] == 0
+    assert assets.ghost_sprite("L", 1, 10, (255, 0, 0, 128)) is not sprite
@@ -0,0 +1,42 @@
+"""SQLite pragmas and versioned migrations for stats.db."""
+
+from sqlalchemy import text
+from sqlmodel import SQLModel, create_engine
+
+import stats.db  # noqa: F401  (registers the Match / Event tables)
+from stats.sqlite_setup import SCHEMA_VERSION, install_pragmas, migrate, schema_version
+
+
+def _engine(tmp_path):
+    engine = install_pragmas(create_engine(f"sqlite:///{tmp_path / 'stats.db'}"))
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def test_connections_use_wal_and_tuned_pragmas(tmp_path):
+    engine = _engine(tmp_path)
+    install_pragmas(engine)  # idempotent
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -16000
+
+
+def test_migrations_run_once_and_index_event_lookups(tmp_path):
+    engine = _engine(tmp_path)
+    assert schema_version(engine) == 0
+    assert migrate(engine) == SCHEMA_VERSION
+    assert migrate(engine) == SCHEMA_VERSION
+    assert schema_version(engine) == SCHEMA_VERSION
+
+    with engine.connect() as conn:
+        indexes = {row[1] for row in conn.execute(text("PRAGMA index_list(event)"))}
+        assert "ix_event_match_frame" in indexes
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                text("EXPLAIN QUERY PLAN SELECT * FROM event WHERE match_id = 'm' ORDER BY frame")
+            )
+        )
+    assert "ix_event_match_frame" in plan
+    assert "TEMP B-TREE" not in plan  # ordered straight from the index
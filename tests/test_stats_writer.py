@@ -0,0 +1,76 @@
+"""Batched background writer for stats events."""
+
+import threading
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from stats.db import Event, Match
+from stats.writer import StatsWriter
+
+
+def _engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as s:
+        s.add(Match(id="m1", start_ts=0.0, agent="test"))
+        s.commit()
+    return engine
+
+
+def _row(frame):
+    return dict(
+        match_id="m1", frame=frame, ts=float(frame), piece="T", orientation=0,
+        lines_cleared=0, combo=0, b2b=False, tspin=False, latency_ms=1.0,
+    )
+
+
+def test_rows_are_committed_in_batches():
+    engine = _engine()
+    writer = StatsWriter(lambda: Session(engine), batch_size=10, flush_interval=60.0)
+    try:
+        for frame in range(25):
+            assert writer.submit(**_row(frame))
+        assert writer.flush()
+        with Session(engine) as s:
+            frames = [e.frame for e in s.exec(select(Event).order_by(Event.frame)).all()]
+        assert frames == list(range(25))
+        assert writer.stats()["written"] == 25
+        assert writer.batches == 3  # 10 + 10 by size, 5 by flush
+    finally:
+        writer.stop()
+    assert not writer.running
+
+
+def test_full_queue_drops_instead_of_blocking():
+    engine = _engine()
+    gate = threading.Event()
+
+    def slow_session():
+        gate.wait(5.0)
+        return Session(engine)
+
+    writer = StatsWriter(slow_session, batch_size=1, maxsize=2)
+    try:
+        results = [writer.submit(**_row(frame)) for frame in range(10)]
+        # the writer holds at most one row, the queue two more
+        assert results.count(False) == writer.dropped >= 7
+    finally:
+        gate.set()
+        writer.stop()
+    assert writer.written + writer.dropped == 10
+
+
+def test_failed_commit_is_counted_and_writer_survives():
+    engine = _engine()
+    writer = StatsWriter(lambda: Session(engine), batch_size=1)
+    try:
+        writer.submit(**{**_row(0), "match_id": None})  # violates NOT NULL
+        writer.submit(**_row(1))
+        assert writer.flush()
+        assert writer.failed == 1
+        assert writer.written == 1
+    finally:
+        writer.stop()
@@ -0,0 +1,96 @@
+"""Queue-based telemetry sink: compact lines, sampling, rotation, drops."""
+
+import json
+import logging
+import threading
+
+import pytest
+
+import logger_config
+from logger_config import TelemetryQueueHandler, setup_telemetry_logger, shutdown_telemetry_logger, telemetry_stats
+
+
+@pytest.fixture
+def telemetry(tmp_path):
+    shutdown_telemetry_logger()  # e.g. the one run_overlay_core starts on import
+
+    def make(**kwargs):
+        return setup_telemetry_logger(str(tmp_path / "telemetry.log"), **kwargs)
+
+    yield make
+    shutdown_telemetry_logger()
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_hold_only_the_payload(telemetry, tmp_path):
+    logger = telemetry()
+    payload = {"ts": "2024-01-01T00:00:00", "frame_id": 1, "piece": "T"}
+    logger.info(payload)
+    payload["piece"] = "changed after logging"
+    logger.warning("Slow frame: 61.0ms")
+    shutdown_telemetry_logger()
+
+    frame, warning = _lines(tmp_path / "telemetry.log")
+    assert frame == {"ts": "2024-01-01T00:00:00", "frame_id": 1, "piece": "T"}
+    assert warning["msg"] == "Slow frame: 61.0ms" and warning["level"] == "WARNING"
+    assert set(warning) == {"msg", "ts", "level"}
+
+
+def test_frame_records_are_sampled(telemetry, tmp_path):
+    logger = telemetry(sample_every=3)
+    for frame_id in range(9):
+        logger.info({"frame_id": frame_id})
+    logger.info({"performance": {"fps": 60}})  # stats are never sampled out
+    logger.warning({"frame_id": 10})  # nor are warnings about a frame
+    assert telemetry_stats()["sampled_out"] == 6
+    shutdown_telemetry_logger()
+
+    lines = _lines(tmp_path / "telemetry.log")
+    assert [line.get("frame_id") for line in lines] == [0, 3, 6, None, 10]
+
+
+def test_file_rotates_by_size(telemetry, tmp_path):
+    logger = telemetry(max_bytes=500, backup_count=2)
+    for frame_id in range(100):
+        logger.info({"frame_id": frame_id, "pad": "x" * 40})
+    shutdown_telemetry_logger()
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["telemetry.log", "telemetry.log.1", "telemetry.log.2"]
+    assert all(p.stat().st_size <= 500 for p in tmp_path.iterdir())
+    assert _lines(tmp_path / "telemetry.log")[-1]["frame_id"] == 99
+
+
+def test_full_queue_drops_instead_of_blocking(telemetry):
+    logger = telemetry(queue_size=2)
+    handler = next(h for h in logger.handlers if isinstance(h, TelemetryQueueHandler))
+
+    # hold the writer inside the file handler so the queue cannot drain
+    release = threading.Event()
+    entered = threading.Event()
+    target = handler.listener.handlers[0]
+    emit = target.emit
+
+    def slow_emit(record):
+        entered.set()
+        release.wait(5)
+        emit(record)
+
+    target.emit = slow_emit
+    logger.info({"frame_id": 0})
+    assert entered.wait(5)
+    for frame_id in range(1, 6):
+        logger.info({"frame_id": frame_id})  # returns at once even when full
+    assert telemetry_stats()["dropped"] == 3
+    release.set()
+
+
+def test_setup_is_idempotent(telemetry):
+    logger = telemetry()
+    assert telemetry() is logger
+    assert sum(isinstance(h, TelemetryQueueHandler) for h in logger.handlers) == 1
+    assert logger.name == logger_config.TELEMETRY_LOGGER and not logger.propagate
+    assert logging.getLogger(logger_config.TELEMETRY_LOGGER) is logger
@@ -17,9 +17,11 @@ try:
 except ImportError:  # pragma: no cover
     msvcrt = None
 
+import cv2
 import keyboard  # type: ignore
 import mss  # type: ignore
 from PIL import Image  # type: ignore
+from capture import CAPTURE_MODES, bgra_view
 from roi_calibrator import start_calibrator
 
 BLACKLIST = set()
@@ -55,11 +57,18 @@ def window_filter():
 
 
 class ScreenCapture:
-    """Capture a rectangle of the primary monitor using mss only."""
+    """Capture a rectangle of the primary monitor using mss only.
 
-    def __init__(self, rect):
+    ``mode`` is one of ``capture.CAPTURE_MODES``; ``"bgra"`` returns a
+    zero-copy numpy view over the raw screenshot buffer.
+    """
+
+    def __init__(self, rect, mode="pil"):
         if len(rect) != 4:
             raise ValueError("rect must be a (left, top, width, height) tuple")
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"mode must be one of {CAPTURE_MODES}, got {mode!r}")
+        self.mode = mode
         left, top, width, height = rect
         self.region = {"left": left, "top": top, "width": width, "height": height}
         self.sct = mss.mss()
@@ -75,7 +84,24 @@ class ScreenCapture:
 
     def grab(self):
         shot = self.sct.grab(self.region)
-        return Image.frombytes("RGB", shot.size, shot.rgb)
+        if self.mode == "pil":
+            return Image.frombytes("RGB", shot.size, shot.rgb)
+        pixels = bgra_view(shot)
+        if self.mode == "gray":
+            return cv2.cvtColor(pixels, cv2.COLOR_BGRA2GRAY)
+        return pixels
+
+    def close(self):
+        """Release the mss handle; safe to call more than once."""
+        if self.sct is not None:
+            self.sct.close()
+            self.sct = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 
 def _release_lock():
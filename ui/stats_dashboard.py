@@ -125,7 +125,7 @@ class StatsDashboard(QWidget):
         
         match_id = self.model._data[current.row()].id
         with get_session() as s:
-            events = s.exec(select(Event).where(Event.match_id == match_id)).all()
+            events = s.exec(select(Event).where(Event.match_id == match_id).order_by(Event.frame)).all()
 
         if not events:
             return
@@ -170,7 +170,7 @@ class StatsDashboard(QWidget):
         match_id = self.model._data[idx.row()].id
         
         with get_session() as s:
-            events = s.exec(select(Event).where(Event.match_id == match_id)).all()
+            events = s.exec(select(Event).where(Event.match_id == match_id).order_by(Event.frame)).all()
         
         if not events:
             QMessageBox.information(self, "Empty", "No events to export.")
@@ -200,7 +200,7 @@ class StatsDashboard(QWidget):
         match_id = self.model._data[idx.row()].id
         
         with get_session() as s:
-            events = s.exec(select(Event).where(Event.match_id == match_id)).all()
+            events = s.exec(select(Event).where(Event.match_id == match_id).order_by(Event.frame)).all()
         
         if not events:
             QMessageBox.information(self, "Empty", "No events to export.")
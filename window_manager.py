@@ -5,6 +5,8 @@ import os
 import re
 from pathlib import Path
 
+from config_cache import FileCache
+
 try:
     import win32gui  # type: ignore
 except ImportError:  # pragma: no cover
@@ -16,21 +18,33 @@ BLACKLIST = set()
 _PATTERN = re.compile(r"Tetris\s*\d+", re.IGNORECASE)
 
 
-def load_cache() -> dict:
-    if not CONFIG_PATH.exists():
+def _parse_cache(path: Path) -> dict:
+    if not path.exists():
         data = {"hwnd": 0, "roi": [0, 0, 640, 360]}
-        CONFIG_PATH.write_text(json.dumps(data, indent=2))
+        path.write_text(json.dumps(data, indent=2))
         return data
-    with CONFIG_PATH.open("r", encoding="utf-8") as fh:
+    with path.open("r", encoding="utf-8") as fh:
         data = json.load(fh)
     if "roi" in data:
         data["roi"] = clamp_roi(data["roi"])
     return data
 
 
+_CACHE = FileCache(lambda: CONFIG_PATH, _parse_cache)
+
+
+def load_cache() -> dict:
+    """Window cache (parsed and clamped once per file change); returns a copy."""
+    data = dict(_CACHE.get())
+    if "roi" in data:
+        data["roi"] = list(data["roi"])
+    return data
+
+
 def save_cache(hwnd: int, roi: list) -> None:
     data = {"hwnd": int(hwnd), "roi": clamp_roi(roi)}
     CONFIG_PATH.write_text(json.dumps(data, indent=2))
+    _CACHE.reload()
     logging.info("Cache saved for hwnd=%s", hwnd)
 
 